@@ -6,11 +6,10 @@ import os
 import sys
 import logging
 from dotenv import load_dotenv
-from fastapi.responses import JSONResponse, PlainTextResponse
+from fastapi.responses import JSONResponse, PlainTextResponse, ORJSONResponse
 from fastapi.staticfiles import StaticFiles
 import time
 import uuid
-import traceback
 
 # Cấu hình logging
 logging.basicConfig(
@@ -25,6 +24,7 @@ logger = logging.getLogger(__name__)
 # Load environment variables
 load_dotenv()
 DEBUG = os.getenv("DEBUG", "False").lower() in ("true", "1", "t")
+THREADPOOL_SIZE = int(os.getenv("THREADPOOL_SIZE", "64"))
 
 # Kiểm tra các biến môi trường bắt buộc
 required_env_vars = [
@@ -68,6 +68,11 @@ def check_database_connections():
 async def lifespan(app: FastAPI):
     # Startup: kiểm tra kết nối các database
     logger.info("Starting application...")
+    
+    # Các route đồng bộ (def) chạy trong threadpool của AnyIO; tăng số thread cho các lệnh DB blocking
+    import anyio.to_thread
+    anyio.to_thread.current_default_thread_limiter().total_tokens = THREADPOOL_SIZE
+    
     db_status = check_database_connections()
     
     # Khởi tạo bảng trong cơ sở dữ liệu (nếu chưa tồn tại)
@@ -76,8 +81,44 @@ async def lifespan(app: FastAPI):
         if create_tables():
             logger.info("Database tables created or already exist")
     
+    # Dọn định kỳ các response đã hết hạn trong cache cục bộ của worker
+    import asyncio
+    from app.api.postgresql_routes import sweep_local_caches
+    cache_sweeper = asyncio.create_task(sweep_local_caches())
+    
+    # Listen for PostgreSQL change notifications to invalidate route caches
+    change_listener = None
+    if db_status["postgresql"]:
+        from app.database.postgresql import create_indexes, create_updated_at_triggers, create_change_notify_triggers, start_change_listener, get_missing_tables
+        from app.api.postgresql_routes import invalidate_table_cache
+        
+        # Kiểm tra schema một lần khi khởi động thay vì trong từng request
+        missing_tables = get_missing_tables()
+        app.state.postgres_schema_ok = missing_tables == []
+        if missing_tables:
+            logger.error(f"Missing PostgreSQL tables: {', '.join(missing_tables)}")
+        
+        create_indexes()
+        create_updated_at_triggers()
+        
+        # Mở sẵn các kết nối async để request đầu tiên không phải chờ kết nối
+        from app.database.postgresql import warm_async_pool
+        await warm_async_pool()
+        if create_change_notify_triggers():
+            change_listener = start_change_listener(invalidate_table_cache)
+    
     yield
     
+    cache_sweeper.cancel()
+    
+    if change_listener is not None:
+        from app.database.postgresql import stop_change_listener
+        stop_change_listener(change_listener)
+    
+    # Close pooled asyncpg connections
+    from app.database.postgresql import async_engine
+    await async_engine.dispose()
+    
     # Shutdown
     logger.info("Shutting down application...")
 
@@ -96,8 +137,9 @@ try:
     # Import debug utilities
     from app.utils.debug_utils import debug_view, DebugInfo, error_tracker, performance_monitor
     
-    # Import cache
+    # Import cache (singleton bound once instead of looked up in every handler)
     from app.utils.cache import get_cache
+    app_cache = get_cache()
     
     logger.info("Successfully imported all routers and modules")
     
@@ -114,6 +156,7 @@ app = FastAPI(
     redoc_url="/redoc",
     debug=DEBUG,
     lifespan=lifespan,
+    default_response_class=ORJSONResponse,  # Mã hóa response của mọi router bằng orjson thay vì json.dumps
 )
 
 # Configure CORS
@@ -123,6 +166,7 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    expose_headers=["X-Next-Cursor", "ETag"],
 )
 
 # Thêm middlewares
@@ -176,15 +220,13 @@ async def ping():
 @app.get("/cache/stats")
 def cache_stats():
     """Trả về thống kê về cache"""
-    cache = get_cache()
-    return cache.stats()
+    return app_cache.stats()
 
 # Cache clear endpoint
 @app.delete("/cache/clear")
 def cache_clear():
     """Xóa tất cả dữ liệu trong cache"""
-    cache = get_cache()
-    cache.clear()
+    app_cache.clear()
     return {"message": "Cache cleared successfully"}
 
 # Debug endpoints (chỉ có trong chế độ debug)
@@ -232,21 +274,20 @@ if DEBUG:
     @app.get("/debug/cache")
     def debug_cache():
         """Hiển thị thông tin chi tiết về cache (chỉ trong chế độ debug)"""
-        cache = get_cache()
-        cache_stats = cache.stats()
+        cache_stats = app_cache.stats()
         
         # Thêm thông tin chi tiết về các key trong cache
-        cache_keys = list(cache.cache.keys())
-        history_users = list(cache.user_history_queues.keys())
+        cache_keys = list(app_cache.cache.keys())
+        history_users = list(app_cache.user_history_queues.keys())
         
         return {
             "stats": cache_stats,
             "keys": cache_keys,
             "history_users": history_users,
             "config": {
-                "ttl": cache.ttl,
-                "cleanup_interval": cache.cleanup_interval,
-                "max_size": cache.max_size,
+                "ttl": app_cache.ttl,
+                "cleanup_interval": app_cache.cleanup_interval,
+                "max_size": app_cache.max_size,
                 "history_queue_size": os.getenv("HISTORY_QUEUE_SIZE", "10"),
                 "history_cache_ttl": os.getenv("HISTORY_CACHE_TTL", "3600"),
             }
@@ -3,7 +3,6 @@ from typing import List, Optional, Dict
 from pymongo.errors import PyMongoError
 import logging
 from datetime import datetime
-import traceback
 import asyncio
 
 from app.database.mongodb import (
@@ -101,15 +100,13 @@ async def create_session(session: SessionCreate, response: Response):
         # Return response
         return session_response
     except PyMongoError as e:
-        logger.error(f"MongoDB error creating session: {e}")
-        logger.error(traceback.format_exc())
+        logger.exception(f"MongoDB error creating session: {e}")
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail=f"MongoDB error: {str(e)}"
         )
     except Exception as e:
-        logger.error(f"Unexpected error creating session: {e}")
-        logger.error(traceback.format_exc())
+        logger.exception(f"Unexpected error creating session: {e}")
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail=f"Failed to create session: {str(e)}"
@@ -143,8 +140,7 @@ async def update_session_with_response(session_id: str, response_text: str):
             
         return {"status": "success", "message": "Response added to session"}
     except PyMongoError as e:
-        logger.error(f"MongoDB error updating session response: {e}")
-        logger.error(traceback.format_exc())
+        logger.exception(f"MongoDB error updating session response: {e}")
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail=f"MongoDB error: {str(e)}"
@@ -153,8 +149,7 @@ async def update_session_with_response(session_id: str, response_text: str):
         # Re-throw HTTP exceptions
         raise
     except Exception as e:
-        logger.error(f"Unexpected error updating session response: {e}")
-        logger.error(traceback.format_exc())
+        logger.exception(f"Unexpected error updating session response: {e}")
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail=f"Failed to update session: {str(e)}"
@@ -183,15 +178,13 @@ async def get_history(user_id: str, n: int = Query(3, ge=1, le=10)):
         # Convert to response model
         return HistoryResponse(history=history_data)
     except PyMongoError as e:
-        logger.error(f"MongoDB error getting user history: {e}")
-        logger.error(traceback.format_exc())
+        logger.exception(f"MongoDB error getting user history: {e}")
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail=f"MongoDB error: {str(e)}"
         )
     except Exception as e:
-        logger.error(f"Unexpected error getting user history: {e}")
-        logger.error(traceback.format_exc())
+        logger.exception(f"Unexpected error getting user history: {e}")
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail=f"Failed to get user history: {str(e)}"
@@ -219,8 +212,7 @@ async def health_check():
             "timestamp": datetime.now().isoformat()
         }
     except Exception as e:
-        logger.error(f"MongoDB health check failed: {e}")
-        logger.error(traceback.format_exc())
+        logger.exception(f"MongoDB health check failed: {e}")
         return {
             "status": "error", 
             "message": f"MongoDB health check error: {str(e)}", 
@@ -258,8 +250,7 @@ async def get_session(session_id: str):
             
         return session_data
     except PyMongoError as e:
-        logger.error(f"MongoDB error getting session: {e}")
-        logger.error(traceback.format_exc())
+        logger.exception(f"MongoDB error getting session: {e}")
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail=f"MongoDB error: {str(e)}"
@@ -268,8 +259,7 @@ async def get_session(session_id: str):
         # Re-throw HTTP exceptions
         raise
     except Exception as e:
-        logger.error(f"Unexpected error getting session: {e}")
-        logger.error(traceback.format_exc())
+        logger.exception(f"Unexpected error getting session: {e}")
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail=f"Failed to get session: {str(e)}"
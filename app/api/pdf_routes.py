@@ -2,11 +2,13 @@ import os
 import shutil
 import uuid
 import sys
-import traceback
 from fastapi import APIRouter, UploadFile, File, Form, HTTPException, BackgroundTasks, Depends, Query
 from fastapi.responses import JSONResponse
+from fastapi.concurrency import run_in_threadpool
 from typing import Optional, List, Dict, Any
-from sqlalchemy.orm import Session
+from sqlalchemy import select, update
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session, joinedload
 import os.path
 import logging
 import tempfile
@@ -16,7 +18,7 @@ from datetime import datetime
 
 from app.utils.pdf_processor import PDFProcessor
 from app.models.pdf_models import PDFResponse, DeleteDocumentRequest, DocumentsListResponse
-from app.database.postgresql import get_db
+from app.database.postgresql import get_db, get_async_db
 from app.database.models import VectorDatabase, Document, VectorStatus, ApiKey, DocumentContent
 from app.api.pdf_websocket import (
     send_pdf_upload_started, 
@@ -70,11 +72,9 @@ def log_with_timestamp(message: str, level: str = "info", error: Exception = Non
         logger.warning(full_message)
         pdf_debug_logger.warning(full_message)
     elif level.lower() == "error":
-        logger.error(full_message)
-        pdf_debug_logger.error(full_message)
-        if error:
-            logger.error(traceback.format_exc())
-            pdf_debug_logger.error(traceback.format_exc())
+        # exc_info attaches the traceback lazily, only when a handler emits the record
+        logger.error(full_message, exc_info=error)
+        pdf_debug_logger.error(full_message, exc_info=error)
     else:
         logger.info(full_message)
         pdf_debug_logger.info(full_message)
@@ -84,8 +84,7 @@ def log_upload_debug(correlation_id: str, message: str, error: Exception = None)
     """Log detailed debug information about PDF uploads"""
     pdf_debug_logger.debug(f"[{correlation_id}] {message}")
     if error:
-        pdf_debug_logger.error(f"[{correlation_id}] Error: {str(error)}")
-        pdf_debug_logger.error(traceback.format_exc())
+        pdf_debug_logger.error(f"[{correlation_id}] Error: {str(error)}", exc_info=error)
 
 # Helper function to send progress updates
 async def send_progress_update(user_id, file_id, step, progress=0.0, message=""):
@@ -93,8 +92,7 @@ async def send_progress_update(user_id, file_id, step, progress=0.0, message="")
     try:
         await send_pdf_upload_progress(user_id, file_id, step, progress, message)
     except Exception as e:
-        logger.error(f"Error sending progress update: {e}")
-        logger.error(traceback.format_exc())
+        logger.exception(f"Error sending progress update: {e}")
 
 # Function with fixed indentation for the troublesome parts
 async def handle_pdf_processing_result(result, correlation_id, user_id, file_id, filename, document, vector_status, 
@@ -115,7 +113,7 @@ async def handle_pdf_processing_result(result, correlation_id, user_id, file_id,
                 vector_status.embedded_at = datetime.now()
                 vector_status.vector_id = file_id
                 document.is_embedded = True
-                db.commit()
+                await run_in_threadpool(db.commit)
                 log_upload_debug(correlation_id, f"Database status updated successfully")
             except Exception as db_error:
                 log_upload_debug(correlation_id, f"Error updating database status: {db_error}", db_error)
@@ -148,7 +146,7 @@ async def handle_pdf_processing_result(result, correlation_id, user_id, file_id,
                 log_upload_debug(correlation_id, f"Updating vector status to 'failed' for document ID {document.id}")
                 vector_status.status = "failed"
                 vector_status.error_message = result.get('error', 'Unknown error')
-                db.commit()
+                await run_in_threadpool(db.commit)
                 log_upload_debug(correlation_id, f"Database status updated for failure")
             except Exception as db_error:
                 log_upload_debug(correlation_id, f"Error updating database status for failure: {db_error}", db_error)
@@ -233,11 +231,13 @@ async def upload_pdf(
         if vector_database_id:
             log_upload_debug(correlation_id, f"Looking up vector database ID {vector_database_id}")
             
-            vector_db = db.query(VectorDatabase).filter(
-                VectorDatabase.id == vector_database_id,
-                VectorDatabase.status == "active"
-            ).first()
-            if not vector_db:
+            # Primary-key lookup through the session identity map; the status is checked on the loaded row.
+            # The sync session runs in the bounded threadpool so the upload handler does not block the event loop,
+            # and the API key is joined in so reading it below does not lazy-load on the loop
+            vector_db = await run_in_threadpool(
+                db.get, VectorDatabase, vector_database_id, options=[joinedload(VectorDatabase.api_key_ref)]
+            )
+            if not vector_db or vector_db.status != "active":
                 return PDFResponse(
                     success=False,
                     error=f"Vector database with ID {vector_database_id} not found or inactive"
@@ -367,8 +367,7 @@ async def upload_pdf(
                     vector_database_id=vector_database_id
                 )
                 db.add(document)
-                db.commit()
-                db.refresh(document)
+                await run_in_threadpool(db.flush)  # INSERT ... RETURNING yields the id; the records below share one transaction
                 log_upload_debug(correlation_id, f"Created document record: id={document.id}")
             except Exception as doc_error:
                 log_upload_debug(correlation_id, f"Error creating document record: {doc_error}", doc_error)
@@ -381,7 +380,6 @@ async def upload_pdf(
                     file_content=file_content
                 )
                 db.add(document_content)
-                db.commit()
                 log_upload_debug(correlation_id, f"Created document content record for document ID {document.id}")
             except Exception as content_error:
                 log_upload_debug(correlation_id, f"Error creating document content: {content_error}", content_error)
@@ -395,7 +393,7 @@ async def upload_pdf(
                     status="pending"
                 )
                 db.add(vector_status)
-                db.commit()
+                await run_in_threadpool(db.commit)  # Commit document, content and status together
                 log_upload_debug(correlation_id, f"Created vector status record for document ID {document.id}")
             except Exception as status_error:
                 log_upload_debug(correlation_id, f"Error creating vector status: {status_error}", status_error)
@@ -464,7 +462,7 @@ async def handle_upload_error(e, correlation_id, temp_file_path, user_id, file_i
         try:
             vector_status.status = "failed"
             vector_status.error_message = str(e)
-            db.commit()
+            await run_in_threadpool(db.commit)
             log_upload_debug(correlation_id, f"Updated database with error status")
         except Exception as db_error:
             log_upload_debug(correlation_id, f"Error updating database with error status: {db_error}", db_error)
@@ -496,7 +494,7 @@ async def delete_namespace(
     index_name: str = "testbot768",
     vector_database_id: Optional[int] = None,
     user_id: Optional[str] = None,
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ):
     """
     Xóa toàn bộ embeddings trong một namespace từ Pinecone (tương ứng xoá namespace)
@@ -515,11 +513,8 @@ async def delete_namespace(
         mock_mode = False  # Use real mode by default
 
         if vector_database_id:
-            vector_db = db.query(VectorDatabase).filter(
-                VectorDatabase.id == vector_database_id,
-                VectorDatabase.status == "active"
-            ).first()
-            if not vector_db:
+            vector_db = await db.get(VectorDatabase, vector_database_id, options=[joinedload(VectorDatabase.api_key_ref)])
+            if not vector_db or vector_db.status != "active":
                 return PDFResponse(
                     success=False,
                     error=f"Vector database with ID {vector_database_id} not found or inactive"
@@ -555,18 +550,22 @@ async def delete_namespace(
         if mock_mode and result.get('success') and vector_database_id:
             try:
                 # Update vector statuses for this database
-                affected_count = db.query(VectorStatus).filter(
-                    VectorStatus.vector_database_id == vector_database_id,
-                    VectorStatus.status != "deleted"
-                ).update({"status": "deleted", "updated_at": datetime.now()})
+                affected_count = (await db.execute(
+                    update(VectorStatus).where(
+                        VectorStatus.vector_database_id == vector_database_id,
+                        VectorStatus.status != "deleted"
+                    ).values(status="deleted")
+                )).rowcount
                 
                 # Update document embedding status
-                db.query(Document).filter(
-                    Document.vector_database_id == vector_database_id,
-                    Document.is_embedded == True
-                ).update({"is_embedded": False})
+                await db.execute(
+                    update(Document).where(
+                        Document.vector_database_id == vector_database_id,
+                        Document.is_embedded == True
+                    ).values(is_embedded=False)
+                )
                 
-                db.commit()
+                await db.commit()
                 logger.info(f"Updated {affected_count} vector statuses to 'deleted'")
                 
                 # Include this info in the result
@@ -601,7 +600,7 @@ async def get_documents(
     namespace: str = "Default", 
     index_name: str = "testbot768",
     vector_database_id: Optional[int] = None,
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ):
     """
     Lấy thông tin về tất cả tài liệu đã được embed
@@ -619,12 +618,9 @@ async def get_documents(
         mock_mode = False  # Use real mode by default
 
         if vector_database_id:
-            vector_db = db.query(VectorDatabase).filter(
-                VectorDatabase.id == vector_database_id,
-                VectorDatabase.status == "active"
-            ).first()
+            vector_db = await db.get(VectorDatabase, vector_database_id, options=[joinedload(VectorDatabase.api_key_ref)])
             
-            if not vector_db:
+            if not vector_db or vector_db.status != "active":
                 return DocumentsListResponse(
                     success=False,
                     error=f"Vector database with ID {vector_database_id} not found or inactive"
@@ -659,13 +655,15 @@ async def get_documents(
         if vector_database_id:
             try:
                 # Get all successfully embedded documents for this vector database
-                documents = db.query(Document).join(
-                    VectorStatus, Document.id == VectorStatus.document_id
-                ).filter(
-                    Document.vector_database_id == vector_database_id,
-                    Document.is_embedded == True,
-                    VectorStatus.status == "completed"
-                ).all()
+                documents = (await db.scalars(
+                    select(Document).join(
+                        VectorStatus, Document.id == VectorStatus.document_id
+                    ).where(
+                        Document.vector_database_id == vector_database_id,
+                        Document.is_embedded == True,
+                        VectorStatus.status == "completed"
+                    )
+                )).all()
                 
                 # Add document info to the result
                 if documents:
@@ -711,7 +709,7 @@ async def delete_document(
     vector_database_id: Optional[int] = None,
     user_id: Optional[str] = None,
     mock_mode: bool = False,
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ):
     """
     Delete vectors for a specific document from the vector database
@@ -731,11 +729,8 @@ async def delete_document(
         vector_db = None
 
         if vector_database_id:
-            vector_db = db.query(VectorDatabase).filter(
-                VectorDatabase.id == vector_database_id,
-                VectorDatabase.status == "active"
-            ).first()
-            if not vector_db:
+            vector_db = await db.get(VectorDatabase, vector_database_id, options=[joinedload(VectorDatabase.api_key_ref)])
+            if not vector_db or vector_db.status != "active":
                 return PDFResponse(
                     success=False,
                     error=f"Vector database with ID {vector_database_id} not found or inactive"
@@ -777,23 +772,27 @@ async def delete_document(
         if result.get('success') and vector_database_id:
             try:
                 # Find document by vector ID if it exists
-                document = db.query(Document).join(
-                    VectorStatus, Document.id == VectorStatus.document_id
-                ).filter(
-                    Document.vector_database_id == vector_database_id,
-                    VectorStatus.vector_id == document_id
-                ).first()
+                document = (await db.scalars(
+                    select(Document).join(
+                        VectorStatus, Document.id == VectorStatus.document_id
+                    ).where(
+                        Document.vector_database_id == vector_database_id,
+                        VectorStatus.vector_id == document_id
+                    ).limit(1)
+                )).first()
                 
                 if document:
                     # Update vector status
-                    vector_status = db.query(VectorStatus).filter(
-                        VectorStatus.document_id == document.id,
-                        VectorStatus.vector_database_id == vector_database_id
-                    ).first()
+                    vector_status = (await db.scalars(
+                        select(VectorStatus).where(
+                            VectorStatus.document_id == document.id,
+                            VectorStatus.vector_database_id == vector_database_id
+                        ).limit(1)
+                    )).first()
                     
                     if vector_status:
                         vector_status.status = "deleted"
-                        db.commit()
+                        await db.commit()
                         result["postgresql_updated"] = True
                         logger.info(f"Updated vector status for document ID {document.id} to 'deleted'")
             except Exception as db_error:
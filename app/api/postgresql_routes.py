@@ -1,28 +1,27 @@
+import asyncio
+import hashlib
 import logging
 import json
-import traceback
-from datetime import datetime, timedelta, timezone
+import orjson
+from datetime import datetime, timezone
 import time
-from functools import lru_cache
 from pathlib import Path as pathlib_Path  # Import Path from pathlib with a different name
 
-from fastapi import APIRouter, HTTPException, Depends, Query, Body, Response, File, UploadFile, Form, BackgroundTasks
+from fastapi import APIRouter, HTTPException, Depends, Query, Body, Header, Response, File, UploadFile, Form, BackgroundTasks
+from fastapi.responses import StreamingResponse
 from fastapi.params import Path  # Import Path explicitly from fastapi.params instead
 from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.exc import SQLAlchemyError
 from typing import List, Optional, Dict, Any
-import logging
-import traceback
-from datetime import datetime
-from sqlalchemy import text, inspect, func
-from sqlalchemy.exc import SQLAlchemyError
-from sqlalchemy import desc, func
-from cachetools import TTLCache
-import uuid
+from sqlalchemy import text
+from sqlalchemy import func, insert, update, delete, select, tuple_, exists, or_, bindparam, JSON, Integer, DateTime
+from sqlalchemy.dialects.postgresql import ARRAY
 
-from app.database.postgresql import get_db
+from app.database.postgresql import get_db, get_async_db, async_engine
+from app.utils.cache import LocalTTLCache, get_redis_cache, DEFAULT_CACHE_CLEANUP_INTERVAL
 from app.database.models import FAQItem, EmergencyItem, EventItem, AboutPixity, SolanaSummit, DaNangBucketList, ApiKey, VectorDatabase, Document, VectorStatus, TelegramBot, ChatEngine, BotEngine, EngineVectorDb, DocumentContent
-from pydantic import BaseModel, Field, ConfigDict
+from pydantic import BaseModel, ConfigDict, TypeAdapter, field_validator
 
 # Configure logging
 logger = logging.getLogger(__name__)
@@ -35,12 +34,318 @@ router = APIRouter(
 
 # Initialize caches for frequently used data
 # Cache for 5 minutes (300 seconds)
-faqs_cache = TTLCache(maxsize=1, ttl=300)
-emergencies_cache = TTLCache(maxsize=1, ttl=300)
-events_cache = TTLCache(maxsize=10, ttl=300)  # Cache for different page sizes
-about_pixity_cache = TTLCache(maxsize=1, ttl=300)
-solana_summit_cache = TTLCache(maxsize=1, ttl=300)
-danang_bucket_list_cache = TTLCache(maxsize=1, ttl=300)
+# List pages and single items share a cache, so leave room for both
+faqs_cache = LocalTTLCache(maxsize=256, ttl=300)
+emergencies_cache = LocalTTLCache(maxsize=256, ttl=300)
+events_cache = LocalTTLCache(maxsize=256, ttl=300)
+about_pixity_cache = LocalTTLCache(maxsize=1, ttl=300)
+solana_summit_cache = LocalTTLCache(maxsize=1, ttl=300)
+danang_bucket_list_cache = LocalTTLCache(maxsize=1, ttl=300)
+
+# Raw SQL statements built once at import rather than on every request
+DELETE_FAQ_STMT = text("DELETE FROM faq_item WHERE id = :id RETURNING id")
+EMERGENCY_SECTIONS_STMT = text("""
+    SELECT DISTINCT section_id AS id, section AS name
+    FROM emergency_item
+    WHERE section IS NOT NULL
+    ORDER BY section_id
+""")
+DELETE_EMERGENCY_STMT = text("DELETE FROM emergency_item WHERE id = :id RETURNING id")
+DELETE_EVENT_STMT = text("DELETE FROM event_item WHERE id = :id RETURNING id")
+
+# Batch statements bind the whole id list as one integer[] parameter: unlike an expanding
+# IN (...), the SQL text stays the same for every batch size, so it is compiled and
+# prepared once per connection instead of once per distinct list length.
+# Status updates and deletes join against unnest() so the planner can hash-join large id lists
+# instead of probing the array once per candidate row; updated_at is set by the
+# BEFORE UPDATE trigger from create_updated_at_triggers()
+def with_unmatched_ids(changed_sql: str, ids_param: str):
+    """
+    Wrap a batch UPDATE/DELETE ... RETURNING item.id in a CTE that also reports, in the
+    same round-trip, the requested ids it did not match (in request order), so the
+    handlers do not rebuild the difference in Python.
+    """
+    return text(f"""
+    WITH changed AS ({changed_sql})
+    SELECT
+        ARRAY(SELECT id FROM changed) AS changed_ids,
+        ARRAY(
+            SELECT requested.id
+            FROM unnest(CAST(:{ids_param} AS integer[])) WITH ORDINALITY AS requested(id, position)
+            WHERE NOT EXISTS (SELECT 1 FROM changed WHERE changed.id = requested.id)
+            ORDER BY requested.position
+        ) AS unmatched_ids
+    """).bindparams(bindparam(ids_param, type_=ARRAY(Integer)))
+
+BATCH_UPDATE_EMERGENCY_STATUS_STMT = with_unmatched_ids("""
+        UPDATE emergency_item AS item
+        SET is_active = :is_active
+        FROM unnest(CAST(:emergency_ids AS integer[])) AS batch(id)
+        WHERE item.id = batch.id
+        RETURNING item.id
+""", "emergency_ids")
+BATCH_DELETE_EMERGENCY_STMT = with_unmatched_ids("""
+        DELETE FROM emergency_item AS item
+        USING unnest(CAST(:emergency_ids AS integer[])) AS batch(id)
+        WHERE item.id = batch.id
+        RETURNING item.id
+""", "emergency_ids")
+BATCH_UPDATE_EVENT_STATUS_STMT = with_unmatched_ids("""
+        UPDATE event_item AS item
+        SET is_active = :is_active
+        FROM unnest(CAST(:event_ids AS integer[])) AS batch(id)
+        WHERE item.id = batch.id
+        RETURNING item.id
+""", "event_ids")
+BATCH_DELETE_EVENT_STMT = with_unmatched_ids("""
+        DELETE FROM event_item AS item
+        USING unnest(CAST(:event_ids AS integer[])) AS batch(id)
+        WHERE item.id = batch.id
+        RETURNING item.id
+""", "event_ids")
+HEALTH_CHECK_STMT = text("SELECT 1")
+BATCH_UPDATE_FAQ_STATUS_STMT = with_unmatched_ids("""
+        UPDATE faq_item AS item
+        SET is_active = :is_active
+        FROM unnest(CAST(:faq_ids AS integer[])) AS batch(id)
+        WHERE item.id = batch.id
+        RETURNING item.id
+""", "faq_ids")
+BATCH_DELETE_FAQ_STMT = with_unmatched_ids("""
+        DELETE FROM faq_item AS item
+        USING unnest(CAST(:faq_ids AS integer[])) AS batch(id)
+        WHERE item.id = batch.id
+        RETURNING item.id
+""", "faq_ids")
+
+# Shared Redis cache behind the in-process caches so all workers reuse encoded responses
+# (None when REDIS_URL is not configured)
+shared_cache = get_redis_cache()
+
+# Caches invalidated when PostgreSQL notifies that their backing table changed:
+# (cache, item namespace, list namespace, item cache key prefix)
+table_caches = {
+    "faq_item": (faqs_cache, "faqs", "faqs_list", "faq"),
+    "emergency_item": (emergencies_cache, "emergency", "emergency_list", "emergency"),
+    "event_item": (events_cache, "events", "events_list", "event"),
+    "about_pixity": (about_pixity_cache, "about_pixity", None, None),
+    "solana_summit": (solana_summit_cache, "solana_summit", None, None),
+    "danang_bucket_list": (danang_bucket_list_cache, "danang_bucket_list", None, None),
+}
+
+def drop_local_responses(local_cache: LocalTTLCache, namespace: str, cache_keys=None):
+    """
+    Remove cached entries of a namespace from this worker (all of them when cache_keys is None).
+    
+    The local cache tracks which keys belong to each namespace, so one namespace (e.g. list pages)
+    can be dropped without evicting the single items that share its local cache.
+    """
+    if cache_keys is None:
+        local_cache.clear_namespace(namespace)
+        return
+    for cache_key in cache_keys:
+        local_cache.pop(cache_key, None)
+
+def invalidate_table_cache(payload: str):
+    """
+    Drop this worker's cached responses for a table after a change notification.
+    
+    The payload is "table:id1,id2,..." for one statement; an empty id list means the
+    statement touched too many rows to list, so the whole namespace is dropped.
+    Only local entries are dropped: the handler that made the write has already
+    invalidated Redis, so repeating it here would cost one round-trip per worker.
+    """
+    table_name, _, row_ids = payload.partition(":")
+    entry = table_caches.get(table_name)
+    if entry is None:
+        return
+    
+    cache, namespace, list_namespace, item_prefix = entry
+    if list_namespace is not None and row_ids:
+        # Only the changed rows and the list pages can be stale; other cached items stay warm
+        item_keys = [(item_prefix, int(row_id)) for row_id in row_ids.split(",")]
+        drop_local_responses(cache, namespace, item_keys)
+        drop_local_responses(cache, list_namespace)
+    else:
+        drop_local_responses(cache, namespace)
+        if list_namespace is not None:
+            drop_local_responses(cache, list_namespace)
+    logger.debug(f"Invalidated cache for {payload} after change notification")
+
+async def get_cached_response(local_cache: LocalTTLCache, namespace: str, cache_key):
+    """Look up an encoded (payload, next_cursor, etag) entry locally, then in the shared Redis cache"""
+    cached_result = local_cache.get(cache_key)
+    if cached_result is None and shared_cache is not None:
+        cached_result = await shared_cache.get(namespace, cache_key)
+        if cached_result is not None:
+            payload, next_cursor = cached_result
+            cached_result = (payload, next_cursor, payload_etag(payload))
+            local_cache.set(cache_key, cached_result, namespace)
+    return cached_result
+
+async def set_cached_response(local_cache: LocalTTLCache, namespace: str, cache_key, payload, next_cursor: Optional[int] = None):
+    """Store an encoded response locally and in the shared Redis cache"""
+    local_cache.set(cache_key, (payload, next_cursor, payload_etag(payload)), namespace)
+    if shared_cache is not None:
+        await shared_cache.set(namespace, cache_key, payload, next_cursor)
+
+async def clear_cached_responses(local_cache: LocalTTLCache, namespace: str):
+    """
+    Drop cached responses for a namespace on this worker and in Redis.
+    
+    Redis is cleared before the response is sent: other workers drop their local entries on the
+    commit notification and would otherwise reload the stale shared entry for a full TTL.
+    """
+    drop_local_responses(local_cache, namespace)
+    if shared_cache is not None:
+        await shared_cache.clear(namespace)
+
+async def invalidate_cached_items(local_cache: LocalTTLCache, namespace: str, cache_keys: List[Any], list_namespace: str):
+    """
+    Drop changed items and every list page of their table, pipelining both Redis invalidations.
+    
+    Like clear_cached_responses, Redis is invalidated before the response is sent.
+    """
+    drop_local_responses(local_cache, namespace, cache_keys)
+    drop_local_responses(local_cache, list_namespace)
+    if shared_cache is not None:
+        await shared_cache.invalidate_many({namespace: cache_keys}, [list_namespace])
+
+async def sweep_local_caches(interval: int = DEFAULT_CACHE_CLEANUP_INTERVAL):
+    """Periodically drop expired local entries so keys that are never read again do not hold memory"""
+    while True:
+        await asyncio.sleep(interval)
+        for local_cache, *_ in table_caches.values():
+            local_cache.sweep()
+
+# Cache misses currently being fetched, so concurrent identical requests share one query
+inflight_fetches: Dict[Any, asyncio.Future] = {}
+
+async def single_flight(key, fetch):
+    """
+    Run fetch() once for concurrent callers with the same key and share its result.
+    
+    If the caller running fetch() is cancelled (e.g. its client disconnected), the
+    waiters are not: the first of them runs fetch() again for the rest.
+    """
+    future = inflight_fetches.get(key)
+    while future is not None:
+        try:
+            return await asyncio.shield(future)
+        except asyncio.CancelledError:
+            # Propagate only this caller's own cancellation
+            if not future.cancelled() or asyncio.current_task().cancelling():
+                raise
+        future = inflight_fetches.get(key)
+    
+    future = asyncio.get_running_loop().create_future()
+    inflight_fetches[key] = future
+    try:
+        result = await fetch()
+    except asyncio.CancelledError:
+        future.cancel()
+        raise
+    except Exception as e:
+        future.set_exception(e)
+        future.exception()  # Mark retrieved so an unawaited failure is not logged twice
+        raise
+    else:
+        future.set_result(result)
+        return result
+    finally:
+        inflight_fetches.pop(key, None)
+
+# Upper bound on rows a single list request can return
+MAX_LIST_LIMIT = 10000
+
+def next_page_cursor(rows, limit: int) -> Optional[int]:
+    """Return the id to resume after, or None when this page is the last one"""
+    return rows[-1]["id"] if rows and len(rows) == limit else None
+
+# Bounds on the id list of a batch update or delete, enforced while the body is validated
+# so empty or oversized batches are rejected before the handler runs
+MAX_BATCH_SIZE = 10000
+
+# Pages larger than this are streamed from a server-side cursor instead of buffered
+STREAM_LIST_THRESHOLD = 1000
+
+# Batch creates larger than this are loaded with COPY instead of multi-row INSERTs
+COPY_BATCH_THRESHOLD = 200
+
+# Allocate ids and timestamps for a COPY batch in one round-trip, since COPY cannot RETURN them
+ALLOCATE_ROWS_STMT = text("""
+    SELECT nextval(pg_get_serial_sequence(:table_name, 'id')) AS id,
+           LOCALTIMESTAMP AS created_at,
+           LOCALTIMESTAMP AS updated_at
+    FROM generate_series(1, :row_count)
+""")
+
+# Table columns copied into each response model, worked out once per (model, table) pair
+response_column_names: Dict[Any, List[str]] = {}
+
+def to_response(model, orm_obj):
+    """Build a response model from a loaded ORM row without re-running validation"""
+    table = orm_obj.__table__
+    names = response_column_names.get((model, table))
+    if names is None:
+        names = [c.name for c in table.columns if c.name in model.model_fields]
+        response_column_names[(model, table)] = names
+    return model.model_construct(**{name: getattr(orm_obj, name) for name in names})
+
+async def stream_json_array(rows, partition_size: int = 500):
+    """
+    Encode rows into a JSON array one partition at a time.
+    
+    The rows must already hold exactly the response model's columns; orjson
+    encodes each partition in a single C call instead of one model per row.
+    """
+    yield b"["
+    first = True
+    async for partition in rows.mappings().partitions(partition_size):
+        chunk = orjson.dumps([dict(row) for row in partition])[1:-1]
+        yield chunk if first else b"," + chunk
+        first = False
+    yield b"]"
+
+def payload_etag(payload: bytes) -> str:
+    """Strong ETag for an encoded response body"""
+    return '"' + hashlib.blake2b(payload, digest_size=8).hexdigest() + '"'
+
+def etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    """Check an If-None-Match header against an ETag (weak comparison, as GET requires)"""
+    if not if_none_match:
+        return False
+    for tag in if_none_match.split(","):
+        tag = tag.strip()
+        if tag.startswith("W/"):
+            tag = tag[2:]
+        if tag == etag or tag == "*":
+            return True
+    return False
+
+def build_json_response(payload: bytes, if_none_match: Optional[str], next_cursor: Optional[int] = None, etag: Optional[str] = None) -> Response:
+    """
+    Wrap encoded JSON with its ETag, exposing the keyset cursor for the next page as a header.
+    
+    Clients that already hold this payload get an empty 304 instead of the body.
+    """
+    headers = {"ETag": etag or payload_etag(payload)}
+    if next_cursor is not None:
+        headers["X-Next-Cursor"] = str(next_cursor)
+    if etag_matches(if_none_match, headers["ETag"]):
+        return Response(status_code=304, headers=headers)
+    return Response(content=payload, media_type="application/json", headers=headers)
+
+def to_naive_utc(value: Optional[datetime]) -> Optional[datetime]:
+    """
+    Convert an offset-aware datetime to naive UTC for the naive DateTime columns.
+    
+    asyncpg rejects aware values bound to timestamp without time zone, so they are
+    normalized before reaching the session; naive values are kept as they are.
+    """
+    if value is None or value.tzinfo is None:
+        return value
+    return value.astimezone(timezone.utc).replace(tzinfo=None)
 
 # --- Pydantic models for request/response ---
 
@@ -127,6 +432,11 @@ class EventBase(BaseModel):
     url: Optional[str] = None
     is_active: bool = True
     featured: bool = False
+    
+    @field_validator("date_start", "date_end")
+    @classmethod
+    def normalize_dates(cls, value: Optional[datetime]) -> Optional[datetime]:
+        return to_naive_utc(value)
 
 class EventCreate(EventBase):
     pass
@@ -142,6 +452,11 @@ class EventUpdate(BaseModel):
     url: Optional[str] = None
     is_active: Optional[bool] = None
     featured: Optional[bool] = None
+    
+    @field_validator("date_start", "date_end")
+    @classmethod
+    def normalize_dates(cls, value: Optional[datetime]) -> Optional[datetime]:
+        return to_naive_utc(value)
 
 class EventResponse(EventBase):
     id: int
@@ -150,6 +465,171 @@ class EventResponse(EventBase):
     
     model_config = ConfigDict(from_attributes=True)
 
+# Columns read by the GET endpoints; selecting Core rows skips ORM hydration,
+# and the columns follow the response model field order so orjson can encode the row mappings as-is
+faq_response_columns = [FAQItem.__table__.c[name] for name in FAQResponse.model_fields]
+emergency_response_columns = [EmergencyItem.__table__.c[name] for name in EmergencyResponse.model_fields]
+event_response_columns = [EventItem.__table__.c[name] for name in EventResponse.model_fields]
+
+# Base SELECTs built once at import, keyed by their filter flags; endpoints only append
+# the per-request cursor, offset and limit instead of rebuilding the expression tree
+FAQ_LIST_STMTS = {
+    False: select(*faq_response_columns),
+    True: select(*faq_response_columns).where(FAQItem.is_active == True),
+}
+FAQ_BY_ID_STMT = select(*faq_response_columns).where(FAQItem.id == bindparam("id"))
+
+EMERGENCY_PRIORITY = func.coalesce(EmergencyItem.priority, 0)
+EMERGENCY_LIST_STMTS = {
+    False: select(*emergency_response_columns),
+    True: select(*emergency_response_columns).where(EmergencyItem.is_active == True),
+}
+EMERGENCY_SECTION_ID_STMTS = {
+    active_only: stmt.where(EmergencyItem.section_id == bindparam("section_id")).order_by(EmergencyItem.priority.desc())
+    for active_only, stmt in EMERGENCY_LIST_STMTS.items()
+}
+EMERGENCY_BY_ID_STMT = select(*emergency_response_columns).where(EmergencyItem.id == bindparam("id"))
+
+EVENT_LIST_STMTS = {
+    (active_only, featured_only): select(*event_response_columns).where(
+        *([EventItem.is_active == True] if active_only else []),
+        *([EventItem.featured == True] if featured_only else []),
+    )
+    for active_only in (False, True)
+    for featured_only in (False, True)
+}
+EVENT_BY_ID_STMT = select(*event_response_columns).where(EventItem.id == bindparam("id"))
+
+# Content stored by the info endpoints when their table is still empty
+ABOUT_PIXITY_DEFAULT_CONTENT = """PiXity is your smart, AI-powered local companion designed to help foreigners navigate life in any city of Vietnam with ease, starting with Da Nang. From finding late-night eats to handling visas, housing, and healthcare, PiXity bridges the gap in language, culture, and local know-how — so you can explore the city like a true insider.
+
+PiXity is proudly built by PiX.teq, the tech team behind PiX — a multidisciplinary collective based in Da Nang.
+
+X: x.com/pixity_bot
+Instagram: instagram.com/pixity.aibot/
+Tiktok: tiktok.com/@pixity.aibot"""
+DANANG_BUCKET_LIST_DEFAULT_CONTENT = json.dumps({
+    "title": "Da Nang Bucket List",
+    "description": "Must-visit places and experiences in Da Nang",
+    "items": [
+        {"name": "Ba Na Hills", "description": "Visit the famous Golden Bridge"},
+        {"name": "Marble Mountains", "description": "Explore caves and temples"},
+        {"name": "My Khe Beach", "description": "Relax at one of the most beautiful beaches in Vietnam"},
+        {"name": "Dragon Bridge", "description": "Watch the fire-breathing show on weekends"},
+        {"name": "Son Tra Peninsula", "description": "See the Lady Buddha statue and lookout point"}
+    ]
+})
+SOLANA_SUMMIT_DEFAULT_CONTENT = json.dumps({
+    "title": "Solana Summit Vietnam",
+    "description": "Information about Solana Summit Vietnam event in Da Nang",
+    "date": "2023-11-04T09:00:00+07:00",
+    "location": "Hyatt Regency, Da Nang",
+    "details": "The Solana Summit is a gathering of developers, entrepreneurs, and enthusiasts in the Solana ecosystem.",
+    "agenda": [
+        {"time": "09:00", "activity": "Registration & Networking"},
+        {"time": "10:00", "activity": "Opening Keynote"},
+        {"time": "12:00", "activity": "Lunch Break"},
+        {"time": "13:30", "activity": "Developer Workshops"},
+        {"time": "17:00", "activity": "Closing Remarks & Networking"}
+    ],
+    "registration_url": "https://example.com/solana-summit-registration"
+})
+
+def content_row_stmt(model, default_content: str):
+    """
+    Read the single row of an info table, inserting the default content first if the table is empty.
+    
+    The outer SELECT does not see rows inserted by the CTE, so exactly one branch returns
+    a row and both the usual read and the first-ever read take one round-trip.
+    """
+    table_name = model.__tablename__
+    return text(f"""
+        WITH inserted AS (
+            INSERT INTO {table_name} (content)
+            SELECT :content
+            WHERE NOT EXISTS (SELECT 1 FROM {table_name})
+            RETURNING id, content, created_at, updated_at
+        )
+        SELECT id, content, created_at, updated_at FROM inserted
+        UNION ALL
+        (SELECT id, content, created_at, updated_at FROM {table_name} LIMIT 1)
+        LIMIT 1
+    """).bindparams(content=default_content)
+
+# Single-row content tables read by the info endpoints
+ABOUT_PIXITY_STMT = content_row_stmt(AboutPixity, ABOUT_PIXITY_DEFAULT_CONTENT)
+DANANG_BUCKET_LIST_STMT = content_row_stmt(DaNangBucketList, DANANG_BUCKET_LIST_DEFAULT_CONTENT)
+SOLANA_SUMMIT_STMT = content_row_stmt(SolanaSummit, SOLANA_SUMMIT_DEFAULT_CONTENT)
+
+async def upsert_content_row(db: AsyncSession, model, content: str):
+    """
+    Set the content of a single-row info table and return the row.
+    
+    One UPDATE ... RETURNING replaces the SELECT, flush and post-commit refresh;
+    an INSERT ... RETURNING runs only when the table is still empty.
+    """
+    row = (await db.scalars(
+        update(model)
+        .where(model.id == select(model.id).limit(1).scalar_subquery())
+        .values(content=content)
+        .returning(model)
+    )).first()
+    if row is None:
+        row = await db.scalar(insert(model).values(content=content).returning(model))
+    return row
+
+async def copy_rows(db: AsyncSession, model, rows: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """
+    Bulk-load rows with asyncpg's binary COPY inside the session's transaction.
+    
+    The ids and timestamps are allocated first and sent with the rows, so the
+    caller gets the same merged dicts as from insert_rows.
+    """
+    table = model.__table__
+    generated = (await db.execute(
+        ALLOCATE_ROWS_STMT, {"table_name": table.name, "row_count": len(rows)}
+    )).mappings().all()
+    rows = [{**row, **generated_row} for row, generated_row in zip(rows, generated)]
+    
+    # COPY bypasses SQLAlchemy's bind processing, so encode JSON columns and bring datetimes
+    # to naive UTC here, giving the same values as the insert_rows path
+    columns = list(rows[0])
+    json_columns = {column.name for column in table.columns if isinstance(column.type, JSON)}
+    datetime_columns = {column.name for column in table.columns if isinstance(column.type, DateTime)}
+    
+    def encode(name, value):
+        if value is None:
+            return None
+        if name in json_columns:
+            return orjson.dumps(value).decode()
+        if name in datetime_columns:
+            return to_naive_utc(value)
+        return value
+    
+    records = [tuple(encode(name, row[name]) for name in columns) for row in rows]
+    
+    connection = await db.connection()
+    raw_connection = await connection.get_raw_connection()
+    await raw_connection.driver_connection.copy_records_to_table(table.name, records=records, columns=columns)
+    return rows
+
+async def insert_rows(db: AsyncSession, model, rows: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """
+    Insert rows with one Core executemany and merge the generated id and timestamps back in.
+    
+    Only the generated columns are returned, so no ORM objects enter the session;
+    sort_by_parameter_order keeps the RETURNING rows aligned with the input rows.
+    Large batches go through COPY instead.
+    """
+    if len(rows) > COPY_BATCH_THRESHOLD:
+        return await copy_rows(db, model, rows)
+    
+    generated = (await db.execute(
+        insert(model).returning(model.id, model.created_at, model.updated_at, sort_by_parameter_order=True),
+        rows
+    )).mappings().all()
+    return [{**row, **generated_row} for row, generated_row in zip(rows, generated)]
+
 # --- Batch operations for better performance ---
 
 class BatchEventCreate(BaseModel):
@@ -164,66 +644,82 @@ class BatchUpdateResult(BaseModel):
 
 @router.get("/faq", response_model=List[FAQResponse])
 async def get_faqs(
-    skip: int = 0, 
-    limit: int = 100,
+    skip: int = Query(0, deprecated=True, description="Offset pagination, superseded by after_id"),
+    limit: int = Query(100, ge=1, le=MAX_LIST_LIMIT),
+    after_id: Optional[int] = None,
     active_only: bool = False,
     use_cache: bool = True,
-    db: Session = Depends(get_db)
+    if_none_match: Optional[str] = Header(None),
+    db: AsyncSession = Depends(get_async_db)
 ):
     """
     Get all FAQ items.
     
-    - **skip**: Number of items to skip
+    - **skip**: Number of items to skip (deprecated, use after_id)
     - **limit**: Maximum number of items to return
+    - **after_id**: Return items after this ID, taken from the X-Next-Cursor header of the previous page
     - **active_only**: If true, only return active items
     - **use_cache**: If true, use cached results when available
+    
+    Limits must be between 1 and 10000; pages over 1000 items are streamed and not cached.
     """
     try:
         # Generate cache key based on query parameters
-        cache_key = f"faqs_{skip}_{limit}_{active_only}"
+        cache_key = ("faqs", skip, limit, after_id, active_only)
         
         # Try to get from cache if caching is enabled
         if use_cache:
-            cached_result = faqs_cache.get(cache_key)
-            if cached_result:
-                logger.info(f"Cache hit for {cache_key}")
-                return cached_result
-        
-        # Build query directly without excessive logging or inspection
-        query = db.query(FAQItem)
-        
-        # Add filter if needed
-        if active_only:
-            query = query.filter(FAQItem.is_active == True)
-        
-        # Get total count for pagination
-        count_query = query.with_entities(func.count(FAQItem.id))
-        total_count = count_query.scalar()
+            cached_result = await get_cached_response(faqs_cache, "faqs_list", cache_key)
+            if cached_result is not None:
+                if logger.isEnabledFor(logging.DEBUG):
+                    logger.debug(f"Cache hit for {cache_key}")
+                payload, next_cursor, etag = cached_result
+                return build_json_response(payload, if_none_match, next_cursor, etag)
+        
+        # Start from the prebuilt statement for this filter
+        query = FAQ_LIST_STMTS[active_only]
+        
+        # Keyset pagination seeks through the primary key index instead of scanning skipped rows
+        if after_id is not None:
+            query = query.where(FAQItem.id > after_id)
+        else:
+            query = query.offset(skip)
         
-        # Execute query with pagination
-        faqs = query.offset(skip).limit(limit).all()
+        query = query.order_by(FAQItem.id).limit(limit)
         
-        # Convert to Pydantic models
-        result = [FAQResponse.model_validate(faq, from_attributes=True) for faq in faqs]
+        # Spool large pages from a server-side cursor instead of materializing every row
+        if limit > STREAM_LIST_THRESHOLD:
+            rows = await db.stream(query.execution_options(yield_per=500))
+            return StreamingResponse(stream_json_array(rows), media_type="application/json")
         
-        # Store in cache if caching is enabled
-        if use_cache:
-            faqs_cache[cache_key] = result
+        async def fetch_page():
+            # Execute query with pagination
+            faqs = (await db.execute(query)).mappings().all()
+            next_cursor = next_page_cursor(faqs, limit)
             
-        return result
+            # The selected columns are exactly FAQResponse's fields, in order, so orjson can
+            # encode the rows directly; the cache keeps the encoded JSON bytes
+            payload = orjson.dumps([dict(faq) for faq in faqs])
+            
+            # Store in cache if caching is enabled
+            if use_cache:
+                await set_cached_response(faqs_cache, "faqs_list", cache_key, payload, next_cursor)
+            return payload, next_cursor
+        
+        # Concurrent misses for the same cached page share a single query
+        payload, next_cursor = await (single_flight(cache_key, fetch_page) if use_cache else fetch_page())
+        return build_json_response(payload, if_none_match, next_cursor)
     except SQLAlchemyError as e:
-        logger.error(f"Database error in get_faqs: {e}")
-        logger.error(traceback.format_exc())
+        logger.exception(f"Database error in get_faqs: {e}")
         raise HTTPException(status_code=500, detail=f"Database error: {str(e)}")
     except Exception as e:
-        logger.error(f"Unexpected error in get_faqs: {e}")
-        logger.error(traceback.format_exc())
+        logger.exception(f"Unexpected error in get_faqs: {e}")
         raise HTTPException(status_code=500, detail=f"Unexpected error: {str(e)}")
 
 @router.post("/faq", response_model=FAQResponse)
 async def create_faq(
     faq: FAQCreate,
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ):
     """
     Create a new FAQ item.
@@ -233,28 +729,27 @@ async def create_faq(
     - **is_active**: Whether the FAQ is active (default: True)
     """
     try:
-        # Create new FAQ item
-        db_faq = FAQItem(**faq.model_dump())
-        db.add(db_faq)
-        db.commit()
-        db.refresh(db_faq)
+        # Insert and read only the generated id and timestamps back in one INSERT ... RETURNING round-trip;
+        # no ORM instance is built, the response is the request data plus those fields
+        db_faq = (await insert_rows(db, FAQItem, [faq.model_dump()]))[0]
+        await db.commit()
         
-        # Invalidate FAQ cache after creating a new item
-        faqs_cache.clear()
+        # A new item only changes the list pages; cached single items stay valid
+        await clear_cached_responses(faqs_cache, "faqs_list")
         
-        # Convert to Pydantic model
-        return FAQResponse.model_validate(db_faq, from_attributes=True)
+        # Encode once; returning a Response skips FastAPI's second validation pass
+        return Response(content=orjson.dumps(db_faq), media_type="application/json")
     except SQLAlchemyError as e:
-        db.rollback()
-        logger.error(f"Database error in create_faq: {e}")
-        logger.error(traceback.format_exc())
+        await db.rollback()
+        logger.exception(f"Database error in create_faq: {e}")
         raise HTTPException(status_code=500, detail=f"Database error: {str(e)}")
 
 @router.get("/faq/{faq_id}", response_model=FAQResponse)
 async def get_faq(
     faq_id: int = Path(..., gt=0),
     use_cache: bool = True,
-    db: Session = Depends(get_db)
+    if_none_match: Optional[str] = Header(None),
+    db: AsyncSession = Depends(get_async_db)
 ):
     """
     Get a single FAQ item by ID.
@@ -264,46 +759,43 @@ async def get_faq(
     """
     try:
         # Generate cache key
-        cache_key = f"faq_{faq_id}"
+        cache_key = ("faq", faq_id)
         
         # Try to get from cache if caching is enabled
         if use_cache:
-            cached_result = faqs_cache.get(cache_key)
-            if cached_result:
-                logger.info(f"Cache hit for {cache_key}")
-                return cached_result
-        
-        # Use direct SQL query for better performance on single item lookup
-        stmt = text("SELECT * FROM faq_item WHERE id = :id")
-        result = db.execute(stmt, {"id": faq_id}).fetchone()
-        
-        if not result:
-            raise HTTPException(status_code=404, detail="FAQ item not found")
-        
-        # Create a FAQItem model instance manually
-        faq = FAQItem()
-        for key, value in result._mapping.items():
-            if hasattr(faq, key):
-                setattr(faq, key, value)
-                
-        # Convert to Pydantic model
-        response = FAQResponse.model_validate(faq, from_attributes=True)
-        
-        # Store in cache if caching is enabled
-        if use_cache:
-            faqs_cache[cache_key] = response
+            cached_result = await get_cached_response(faqs_cache, "faqs", cache_key)
+            if cached_result is not None:
+                if logger.isEnabledFor(logging.DEBUG):
+                    logger.debug(f"Cache hit for {cache_key}")
+                payload, _, etag = cached_result
+                return build_json_response(payload, if_none_match, etag=etag)
+        
+        async def fetch_faq():
+            # Read the response columns as a plain row mapping, skipping ORM instance construction
+            faq = (await db.execute(FAQ_BY_ID_STMT, {"id": faq_id})).mappings().first()
+            if faq is None:
+                raise HTTPException(status_code=404, detail="FAQ item not found")
             
-        return response
+            # Encode once; returning a Response skips FastAPI's second validation pass
+            payload = orjson.dumps(dict(faq))
+            
+            # Store in cache if caching is enabled
+            if use_cache:
+                await set_cached_response(faqs_cache, "faqs", cache_key, payload)
+            return payload
+        
+        # Concurrent misses for the same item share a single query
+        payload = await (single_flight(cache_key, fetch_faq) if use_cache else fetch_faq())
+        return build_json_response(payload, if_none_match)
     except SQLAlchemyError as e:
-        logger.error(f"Database error in get_faq: {e}")
-        logger.error(traceback.format_exc())
+        logger.exception(f"Database error in get_faq: {e}")
         raise HTTPException(status_code=500, detail=f"Database error: {str(e)}")
 
 @router.put("/faq/{faq_id}", response_model=FAQResponse)
 async def update_faq(
     faq_id: int = Path(..., gt=0),
     faq_update: FAQUpdate = Body(...),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ):
     """
     Update an existing FAQ item.
@@ -314,36 +806,34 @@ async def update_faq(
     - **is_active**: Updated active status (optional)
     """
     try:
-        # Check if FAQ exists
-        faq = db.query(FAQItem).filter(FAQItem.id == faq_id).first()
+        # Update and fetch the row in a single UPDATE ... RETURNING round-trip
+        stmt = (
+            update(FAQItem)
+            .where(FAQItem.id == faq_id)
+            .values(**{name: getattr(faq_update, name) for name in faq_update.model_fields_set})
+            .returning(FAQItem)
+        )
+        faq = (await db.execute(stmt)).scalar_one_or_none()
         if faq is None:
             raise HTTPException(status_code=404, detail=f"FAQ with ID {faq_id} not found")
         
-        # Update fields with optimized dict handling
-        update_data = faq_update.model_dump(exclude_unset=True)
-        for key, value in update_data.items():
-            setattr(faq, key, value)
-            
         # Commit changes
-        db.commit()
-        db.refresh(faq)
+        await db.commit()
         
-        # Invalidate specific cache entries
-        faqs_cache.delete(f"faq_{faq_id}")
-        faqs_cache.clear()  # Clear all list caches
+        # Drop the changed item and the list pages; other cached items stay warm
+        await invalidate_cached_items(faqs_cache, "faqs", [("faq", faq_id)], "faqs_list")
         
-        # Convert to Pydantic model
-        return FAQResponse.model_validate(faq, from_attributes=True)
+        # Encode once; returning a Response skips FastAPI's second validation pass
+        return Response(content=to_response(FAQResponse, faq).model_dump_json(), media_type="application/json")
     except SQLAlchemyError as e:
-        db.rollback()
-        logger.error(f"Database error in update_faq: {e}")
-        logger.error(traceback.format_exc())
+        await db.rollback()
+        logger.exception(f"Database error in update_faq: {e}")
         raise HTTPException(status_code=500, detail=f"Database error: {str(e)}")
 
 @router.delete("/faq/{faq_id}", response_model=dict)
 async def delete_faq(
     faq_id: int = Path(..., gt=0),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ):
     """
     Delete an FAQ item.
@@ -352,96 +842,114 @@ async def delete_faq(
     """
     try:
         # Use optimized query with proper error handling
-        result = db.execute(
-            text("DELETE FROM faq_item WHERE id = :id RETURNING id"),
-            {"id": faq_id}
-        ).fetchone()
+        deleted_id = await db.scalar(DELETE_FAQ_STMT, {"id": faq_id})
         
-        if not result:
+        if deleted_id is None:
             raise HTTPException(status_code=404, detail="FAQ item not found")
         
-        db.commit()
+        await db.commit()
         
-        # Invalidate cache entries
-        faqs_cache.delete(f"faq_{faq_id}")
-        faqs_cache.clear()  # Clear all list caches
+        # Drop the changed item and the list pages; other cached items stay warm
+        await invalidate_cached_items(faqs_cache, "faqs", [("faq", faq_id)], "faqs_list")
         
         return {"status": "success", "message": f"FAQ item {faq_id} deleted"}
     except SQLAlchemyError as e:
-        db.rollback()
-        logger.error(f"Database error in delete_faq: {e}")
-        logger.error(traceback.format_exc())
+        await db.rollback()
+        logger.exception(f"Database error in delete_faq: {e}")
         raise HTTPException(status_code=500, detail=f"Database error: {str(e)}")
 
 # --- Emergency contact endpoints ---
 
 @router.get("/emergency", response_model=List[EmergencyResponse])
 async def get_emergency_contacts(
-    skip: int = 0, 
-    limit: int = 100,
+    skip: int = Query(0, deprecated=True, description="Offset pagination, superseded by after_id"),
+    limit: int = Query(100, ge=1, le=MAX_LIST_LIMIT),
+    after_id: Optional[int] = None,
+    after_priority: Optional[int] = None,
     active_only: bool = False,
     section: Optional[str] = None,
     use_cache: bool = True,
-    db: Session = Depends(get_db)
+    if_none_match: Optional[str] = Header(None),
+    db: AsyncSession = Depends(get_async_db)
 ):
     """
     Get all emergency contacts.
     
-    - **skip**: Number of items to skip
+    - **skip**: Number of items to skip (deprecated, use after_id)
     - **limit**: Maximum number of items to return
+    - **after_id**: Return items after this ID, taken from the X-Next-Cursor header of the previous page
+    - **after_priority**: Priority of the after_id contact; lets the cursor seek without looking that row up
     - **active_only**: If true, only return active items
     - **section**: Filter by section (16.1, 16.2.1, 16.2.2, 16.3)
     - **use_cache**: If true, use cached results when available
+    
+    Limits must be between 1 and 10000; pages over 1000 items are streamed and not cached.
     """
     try:
         # Generate cache key based on query parameters
-        cache_key = f"emergency_{skip}_{limit}_{active_only}_{section}"
+        cache_key = ("emergency", skip, limit, after_id, after_priority, active_only, section)
         
         # Try to get from cache if caching is enabled
         if use_cache:
-            cached_result = emergencies_cache.get(cache_key)
-            if cached_result:
-                logger.info(f"Cache hit for {cache_key}")
-                return cached_result
+            cached_result = await get_cached_response(emergencies_cache, "emergency_list", cache_key)
+            if cached_result is not None:
+                if logger.isEnabledFor(logging.DEBUG):
+                    logger.debug(f"Cache hit for {cache_key}")
+                payload, next_cursor, etag = cached_result
+                return build_json_response(payload, if_none_match, next_cursor, etag)
                 
-        # Build query directly without excessive inspection and logging
-        query = db.query(EmergencyItem)
+        # Start from the prebuilt statement for this filter
+        query = EMERGENCY_LIST_STMTS[active_only]
         
-        # Add filters if needed
-        if active_only:
-            query = query.filter(EmergencyItem.is_active == True)
-            
         if section:
-            query = query.filter(EmergencyItem.section == section)
+            query = query.where(EmergencyItem.section == section)
+        
+        # Order by priority for proper sorting, with id as a tie-breaker for stable pages
+        priority = EMERGENCY_PRIORITY
         
-        # Get total count for pagination info
-        count_query = query.with_entities(func.count(EmergencyItem.id))
-        total_count = count_query.scalar()
+        # Seek past the cursor row in (priority, id) order instead of scanning skipped rows
+        if after_id is not None:
+            cursor_priority = after_priority
+            if cursor_priority is None:
+                cursor_priority = select(priority).where(EmergencyItem.id == after_id).scalar_subquery()
+            query = query.where(tuple_(priority, EmergencyItem.id) < tuple_(cursor_priority, after_id))
+        else:
+            query = query.offset(skip)
         
-        # Order by priority for proper sorting
-        emergency_contacts = query.order_by(EmergencyItem.priority.desc()).offset(skip).limit(limit).all()
+        query = query.order_by(priority.desc(), EmergencyItem.id.desc()).limit(limit)
         
-        # Convert to Pydantic models efficiently
-        result = [EmergencyResponse.model_validate(contact, from_attributes=True) for contact in emergency_contacts]
+        # Spool large pages from a server-side cursor instead of materializing every row
+        if limit > STREAM_LIST_THRESHOLD:
+            rows = await db.stream(query.execution_options(yield_per=500))
+            return StreamingResponse(stream_json_array(rows), media_type="application/json")
         
-        # Store in cache if caching is enabled
-        if use_cache:
-            emergencies_cache[cache_key] = result
+        async def fetch_page():
+            emergency_contacts = (await db.execute(query)).mappings().all()
+            next_cursor = next_page_cursor(emergency_contacts, limit)
             
-        return result
+            # The selected columns are exactly EmergencyResponse's fields, in order, so orjson can
+            # encode the rows directly; the cache keeps the encoded JSON bytes
+            payload = orjson.dumps([dict(contact) for contact in emergency_contacts])
+            
+            # Store in cache if caching is enabled
+            if use_cache:
+                await set_cached_response(emergencies_cache, "emergency_list", cache_key, payload, next_cursor)
+            return payload, next_cursor
+        
+        # Concurrent misses for the same cached page share a single query
+        payload, next_cursor = await (single_flight(cache_key, fetch_page) if use_cache else fetch_page())
+        return build_json_response(payload, if_none_match, next_cursor)
     except SQLAlchemyError as e:
-        logger.error(f"Database error in get_emergency_contacts: {e}")
-        logger.error(traceback.format_exc())
+        logger.exception(f"Database error in get_emergency_contacts: {e}")
         raise HTTPException(status_code=500, detail=f"Database error: {str(e)}")
     except Exception as e:
-        logger.error(f"Unexpected error in get_emergency_contacts: {e}")
-        logger.error(traceback.format_exc())
+        logger.exception(f"Unexpected error in get_emergency_contacts: {e}")
         raise HTTPException(status_code=500, detail=f"Unexpected error: {str(e)}")
 
 @router.get("/emergency/sections", response_model=List[Dict[str, Any]])
 async def get_emergency_sections(
     use_cache: bool = True,
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ):
     """
     Get all available emergency sections.
@@ -454,35 +962,32 @@ async def get_emergency_sections(
         
         # Try to get from cache if caching is enabled
         if use_cache:
-            cached_result = emergencies_cache.get(cache_key)
-            if cached_result:
-                logger.info(f"Cache hit for {cache_key}")
-                return cached_result
+            cached_result = await get_cached_response(emergencies_cache, "emergency_list", cache_key)
+            if cached_result is not None:
+                if logger.isEnabledFor(logging.DEBUG):
+                    logger.debug(f"Cache hit for {cache_key}")
+                return Response(content=cached_result[0], media_type="application/json")
                 
-        # Query distinct sections with their IDs
-        stmt = text("""
-            SELECT DISTINCT section_id, section 
-            FROM emergency_item 
-            WHERE section IS NOT NULL 
-            ORDER BY section_id
-        """)
-        result = db.execute(stmt)
-        
-        # Extract section info
-        sections = [{"id": row[0], "name": row[1]} for row in result]
-        
-        # Store in cache if caching is enabled
-        if use_cache:
-            emergencies_cache[cache_key] = sections
+        async def fetch_sections():
+            # Query distinct sections with their IDs; the columns are already named as the response keys
+            sections = (await db.execute(EMERGENCY_SECTIONS_STMT)).mappings().all()
             
-        return sections
+            # Encode the row mappings directly instead of unpacking each row tuple
+            payload = orjson.dumps([dict(section) for section in sections])
+            
+            # Store in cache if caching is enabled
+            if use_cache:
+                await set_cached_response(emergencies_cache, "emergency_list", cache_key, payload)
+            return payload
+        
+        # Concurrent misses share a single query
+        payload = await (single_flight(cache_key, fetch_sections) if use_cache else fetch_sections())
+        return Response(content=payload, media_type="application/json")
     except SQLAlchemyError as e:
-        logger.error(f"Database error in get_emergency_sections: {e}")
-        logger.error(traceback.format_exc())
+        logger.exception(f"Database error in get_emergency_sections: {e}")
         raise HTTPException(status_code=500, detail=f"Database error: {str(e)}")
     except Exception as e:
-        logger.error(f"Unexpected error in get_emergency_sections: {e}")
-        logger.error(traceback.format_exc())
+        logger.exception(f"Unexpected error in get_emergency_sections: {e}")
         raise HTTPException(status_code=500, detail=f"Unexpected error: {str(e)}")
 
 @router.get("/emergency/section/{section_id}", response_model=List[EmergencyResponse])
@@ -490,7 +995,7 @@ async def get_emergency_contacts_by_section_id(
     section_id: int = Path(..., description="Section ID (1, 2, 3, or 4)"),
     active_only: bool = True,
     use_cache: bool = True,
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ):
     """
     Get emergency contacts for a specific section ID.
@@ -501,46 +1006,45 @@ async def get_emergency_contacts_by_section_id(
     """
     try:
         # Generate cache key based on query parameters
-        cache_key = f"emergency_section_id_{section_id}_{active_only}"
+        cache_key = ("emergency_section_id", section_id, active_only)
         
         # Try to get from cache if caching is enabled
         if use_cache:
-            cached_result = emergencies_cache.get(cache_key)
-            if cached_result:
-                logger.info(f"Cache hit for {cache_key}")
-                return cached_result
+            cached_result = await get_cached_response(emergencies_cache, "emergency_list", cache_key)
+            if cached_result is not None:
+                if logger.isEnabledFor(logging.DEBUG):
+                    logger.debug(f"Cache hit for {cache_key}")
+                return Response(content=cached_result[0], media_type="application/json")
                 
-        # Build query
-        query = db.query(EmergencyItem).filter(EmergencyItem.section_id == section_id)
-        
-        # Add active filter if needed
-        if active_only:
-            query = query.filter(EmergencyItem.is_active == True)
+        # Prebuilt statement for this filter, ordered by priority
+        query = EMERGENCY_SECTION_ID_STMTS[active_only]
         
-        # Order by priority for proper sorting
-        emergency_contacts = query.order_by(EmergencyItem.priority.desc()).all()
-        
-        # Convert to Pydantic models efficiently
-        result = [EmergencyResponse.model_validate(contact, from_attributes=True) for contact in emergency_contacts]
-        
-        # Store in cache if caching is enabled
-        if use_cache:
-            emergencies_cache[cache_key] = result
+        async def fetch_section():
+            emergency_contacts = (await db.execute(query, {"section_id": section_id})).mappings().all()
             
-        return result
+            # The selected columns are exactly EmergencyResponse's fields, in order, so orjson can
+            # encode the rows directly; the cache keeps the encoded JSON bytes
+            payload = orjson.dumps([dict(contact) for contact in emergency_contacts])
+            
+            # Store in cache if caching is enabled
+            if use_cache:
+                await set_cached_response(emergencies_cache, "emergency_list", cache_key, payload)
+            return payload
+        
+        # Concurrent misses for the same section share a single query
+        payload = await (single_flight(cache_key, fetch_section) if use_cache else fetch_section())
+        return Response(content=payload, media_type="application/json")
     except SQLAlchemyError as e:
-        logger.error(f"Database error in get_emergency_contacts_by_section_id: {e}")
-        logger.error(traceback.format_exc())
+        logger.exception(f"Database error in get_emergency_contacts_by_section_id: {e}")
         raise HTTPException(status_code=500, detail=f"Database error: {str(e)}")
     except Exception as e:
-        logger.error(f"Unexpected error in get_emergency_contacts_by_section_id: {e}")
-        logger.error(traceback.format_exc())
+        logger.exception(f"Unexpected error in get_emergency_contacts_by_section_id: {e}")
         raise HTTPException(status_code=500, detail=f"Unexpected error: {str(e)}")
 
 @router.post("/emergency", response_model=EmergencyResponse)
 async def create_emergency_contact(
     emergency: EmergencyCreate,
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ):
     """
     Create a new emergency contact.
@@ -554,28 +1058,27 @@ async def create_emergency_contact(
     - **is_active**: Whether the contact is active (default: True)
     """
     try:
-        db_emergency = EmergencyItem(**emergency.model_dump())
-        db.add(db_emergency)
-        db.commit()
-        db.refresh(db_emergency)
+        # Insert and read only the generated id and timestamps back in one INSERT ... RETURNING round-trip;
+        # no ORM instance is built, the response is the request data plus those fields
+        db_emergency = (await insert_rows(db, EmergencyItem, [emergency.model_dump()]))[0]
+        await db.commit()
         
-        # Invalidate emergency cache after creating a new item
-        emergencies_cache.clear()
+        # A new item only changes the list pages; cached single items stay valid
+        await clear_cached_responses(emergencies_cache, "emergency_list")
         
-        # Convert SQLAlchemy model to Pydantic model before returning
-        result = EmergencyResponse.model_validate(db_emergency, from_attributes=True)
-        return result
+        # Encode once; returning a Response skips FastAPI's second validation pass
+        return Response(content=orjson.dumps(db_emergency), media_type="application/json")
     except SQLAlchemyError as e:
-        db.rollback()
-        logger.error(f"Database error in create_emergency_contact: {e}")
-        logger.error(traceback.format_exc())
+        await db.rollback()
+        logger.exception(f"Database error in create_emergency_contact: {e}")
         raise HTTPException(status_code=500, detail=f"Database error: {str(e)}")
 
 @router.get("/emergency/{emergency_id}", response_model=EmergencyResponse)
 async def get_emergency_contact(
     emergency_id: int = Path(..., gt=0),
     use_cache: bool = True,
-    db: Session = Depends(get_db)
+    if_none_match: Optional[str] = Header(None),
+    db: AsyncSession = Depends(get_async_db)
 ):
     """
     Get a single emergency contact by ID.
@@ -585,46 +1088,43 @@ async def get_emergency_contact(
     """
     try:
         # Generate cache key
-        cache_key = f"emergency_{emergency_id}"
+        cache_key = ("emergency", emergency_id)
         
         # Try to get from cache if caching is enabled
         if use_cache:
-            cached_result = emergencies_cache.get(cache_key)
-            if cached_result:
-                logger.info(f"Cache hit for {cache_key}")
-                return cached_result
-                
-        # Use direct SQL query for better performance on single item lookup
-        stmt = text("SELECT * FROM emergency_item WHERE id = :id")
-        result = db.execute(stmt, {"id": emergency_id}).fetchone()
-        
-        if not result:
-            raise HTTPException(status_code=404, detail="Emergency contact not found")
-        
-        # Create an EmergencyItem model instance manually
-        emergency = EmergencyItem()
-        for key, value in result._mapping.items():
-            if hasattr(emergency, key):
-                setattr(emergency, key, value)
+            cached_result = await get_cached_response(emergencies_cache, "emergency", cache_key)
+            if cached_result is not None:
+                if logger.isEnabledFor(logging.DEBUG):
+                    logger.debug(f"Cache hit for {cache_key}")
+                payload, _, etag = cached_result
+                return build_json_response(payload, if_none_match, etag=etag)
                 
-        # Convert to Pydantic model
-        response = EmergencyResponse.model_validate(emergency, from_attributes=True)
-        
-        # Store in cache if caching is enabled
-        if use_cache:
-            emergencies_cache[cache_key] = response
+        async def fetch_emergency():
+            # Read the response columns as a plain row mapping, skipping ORM instance construction
+            emergency = (await db.execute(EMERGENCY_BY_ID_STMT, {"id": emergency_id})).mappings().first()
+            if emergency is None:
+                raise HTTPException(status_code=404, detail="Emergency contact not found")
             
-        return response
+            # Encode once; returning a Response skips FastAPI's second validation pass
+            payload = orjson.dumps(dict(emergency))
+            
+            # Store in cache if caching is enabled
+            if use_cache:
+                await set_cached_response(emergencies_cache, "emergency", cache_key, payload)
+            return payload
+        
+        # Concurrent misses for the same item share a single query
+        payload = await (single_flight(cache_key, fetch_emergency) if use_cache else fetch_emergency())
+        return build_json_response(payload, if_none_match)
     except SQLAlchemyError as e:
-        logger.error(f"Database error in get_emergency_contact: {e}")
-        logger.error(traceback.format_exc())
+        logger.exception(f"Database error in get_emergency_contact: {e}")
         raise HTTPException(status_code=500, detail=f"Database error: {str(e)}")
 
 @router.put("/emergency/{emergency_id}", response_model=EmergencyResponse)
 async def update_emergency_contact(
     emergency_id: int = Path(..., gt=0),
     emergency_update: EmergencyUpdate = Body(...),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ):
     """
     Update a specific emergency contact.
@@ -639,34 +1139,33 @@ async def update_emergency_contact(
     - **is_active**: New active status (optional)
     """
     try:
-        emergency = db.query(EmergencyItem).filter(EmergencyItem.id == emergency_id).first()
+        # Update and fetch the row in a single UPDATE ... RETURNING round-trip
+        stmt = (
+            update(EmergencyItem)
+            .where(EmergencyItem.id == emergency_id)
+            .values(**{name: getattr(emergency_update, name) for name in emergency_update.model_fields_set})
+            .returning(EmergencyItem)
+        )
+        emergency = (await db.execute(stmt)).scalar_one_or_none()
         if not emergency:
             raise HTTPException(status_code=404, detail="Emergency contact not found")
-        
-        # Update fields if provided
-        update_data = emergency_update.model_dump(exclude_unset=True)
-        for key, value in update_data.items():
-            setattr(emergency, key, value)
             
-        db.commit()
-        db.refresh(emergency)
+        await db.commit()
         
-        # Invalidate specific cache entries
-        emergencies_cache.delete(f"emergency_{emergency_id}")
-        emergencies_cache.clear()  # Clear all list caches
+        # Drop the changed item and the list pages; other cached items stay warm
+        await invalidate_cached_items(emergencies_cache, "emergency", [("emergency", emergency_id)], "emergency_list")
         
-        # Convert to Pydantic model
-        return EmergencyResponse.model_validate(emergency, from_attributes=True)
+        # Encode once; returning a Response skips FastAPI's second validation pass
+        return Response(content=to_response(EmergencyResponse, emergency).model_dump_json(), media_type="application/json")
     except SQLAlchemyError as e:
-        db.rollback()
-        logger.error(f"Database error in update_emergency_contact: {e}")
-        logger.error(traceback.format_exc())
+        await db.rollback()
+        logger.exception(f"Database error in update_emergency_contact: {e}")
         raise HTTPException(status_code=500, detail=f"Database error: {str(e)}")
 
 @router.delete("/emergency/{emergency_id}", response_model=dict)
 async def delete_emergency_contact(
     emergency_id: int = Path(..., gt=0),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ):
     """
     Delete a specific emergency contact.
@@ -675,32 +1174,27 @@ async def delete_emergency_contact(
     """
     try:
         # Use optimized direct SQL with RETURNING for better performance
-        result = db.execute(
-            text("DELETE FROM emergency_item WHERE id = :id RETURNING id"),
-            {"id": emergency_id}
-        ).fetchone()
+        deleted_id = await db.scalar(DELETE_EMERGENCY_STMT, {"id": emergency_id})
         
-        if not result:
+        if deleted_id is None:
             raise HTTPException(status_code=404, detail="Emergency contact not found")
         
-        db.commit()
+        await db.commit()
         
-        # Invalidate cache entries
-        emergencies_cache.delete(f"emergency_{emergency_id}")
-        emergencies_cache.clear()  # Clear all list caches
+        # Drop the changed item and the list pages; other cached items stay warm
+        await invalidate_cached_items(emergencies_cache, "emergency", [("emergency", emergency_id)], "emergency_list")
         
         return {"status": "success", "message": f"Emergency contact {emergency_id} deleted"}
     except SQLAlchemyError as e:
-        db.rollback()
-        logger.error(f"Database error in delete_emergency_contact: {e}")
-        logger.error(traceback.format_exc())
+        await db.rollback()
+        logger.exception(f"Database error in delete_emergency_contact: {e}")
         raise HTTPException(status_code=500, detail=f"Database error: {str(e)}")
 
 @router.put("/emergency/batch-update-status", response_model=BatchUpdateResult)
 async def batch_update_emergency_status(
-    emergency_ids: List[int] = Body(..., embed=True),
+    emergency_ids: List[int] = Body(..., embed=True, min_length=1, max_length=MAX_BATCH_SIZE),
     is_active: bool = Body(..., embed=True),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ):
     """
     Update the active status of multiple emergency contacts at once.
@@ -708,29 +1202,20 @@ async def batch_update_emergency_status(
     This is much more efficient than updating emergency contacts one at a time.
     """
     try:
-        if not emergency_ids:
-            raise HTTPException(status_code=400, detail="No emergency contact IDs provided")
-        
         # Prepare the update statement
-        stmt = text("""
-            UPDATE emergency_item 
-            SET is_active = :is_active, updated_at = NOW()
-            WHERE id = ANY(:emergency_ids)
-            RETURNING id
-        """)
+        stmt = BATCH_UPDATE_EMERGENCY_STATUS_STMT
         
         # Execute the update in a single query
-        result = db.execute(stmt, {"is_active": is_active, "emergency_ids": emergency_ids})
-        updated_ids = [row[0] for row in result]
+        # One row holds both the changed IDs and the requested IDs that weren't found
+        result = (await db.execute(stmt, {"is_active": is_active, "emergency_ids": emergency_ids})).one()
+        updated_ids = result.changed_ids
+        failed_ids = result.unmatched_ids
         
         # Commit the transaction
-        db.commit()
+        await db.commit()
         
-        # Determine which IDs weren't found
-        failed_ids = [id for id in emergency_ids if id not in updated_ids]
-        
-        # Invalidate emergency cache
-        emergencies_cache.clear()
+        # Drop the changed items and the list pages
+        await invalidate_cached_items(emergencies_cache, "emergency", [("emergency", item_id) for item_id in updated_ids], "emergency_list")
         
         return BatchUpdateResult(
             success_count=len(updated_ids),
@@ -738,15 +1223,14 @@ async def batch_update_emergency_status(
             message=f"Updated {len(updated_ids)} emergency contacts" if updated_ids else "No emergency contacts were updated"
         )
     except SQLAlchemyError as e:
-        db.rollback()
-        logger.error(f"Database error in batch_update_emergency_status: {e}")
-        logger.error(traceback.format_exc())
+        await db.rollback()
+        logger.exception(f"Database error in batch_update_emergency_status: {e}")
         raise HTTPException(status_code=500, detail=f"Database error: {str(e)}")
 
 @router.delete("/emergency/batch", response_model=BatchUpdateResult)
 async def batch_delete_emergency_contacts(
-    emergency_ids: List[int] = Body(..., embed=True),
-    db: Session = Depends(get_db)
+    emergency_ids: List[int] = Body(..., embed=True, min_length=1, max_length=MAX_BATCH_SIZE),
+    db: AsyncSession = Depends(get_async_db)
 ):
     """
     Delete multiple emergency contacts at once.
@@ -754,27 +1238,19 @@ async def batch_delete_emergency_contacts(
     This is much more efficient than deleting emergency contacts one at a time with separate API calls.
     """
     try:
-        if not emergency_ids:
-            raise HTTPException(status_code=400, detail="No emergency contact IDs provided")
-        
         # Prepare and execute the delete statement with RETURNING to get deleted IDs
-        stmt = text("""
-            DELETE FROM emergency_item
-            WHERE id = ANY(:emergency_ids)
-            RETURNING id
-        """)
+        stmt = BATCH_DELETE_EMERGENCY_STMT
         
-        result = db.execute(stmt, {"emergency_ids": emergency_ids})
-        deleted_ids = [row[0] for row in result]
+        # One row holds both the changed IDs and the requested IDs that weren't found
+        result = (await db.execute(stmt, {"emergency_ids": emergency_ids})).one()
+        deleted_ids = result.changed_ids
+        failed_ids = result.unmatched_ids
         
         # Commit the transaction
-        db.commit()
+        await db.commit()
         
-        # Determine which IDs weren't found
-        failed_ids = [id for id in emergency_ids if id not in deleted_ids]
-        
-        # Invalidate emergency cache
-        emergencies_cache.clear()
+        # Drop the changed items and the list pages
+        await invalidate_cached_items(emergencies_cache, "emergency", [("emergency", item_id) for item_id in deleted_ids], "emergency_list")
         
         return BatchUpdateResult(
             success_count=len(deleted_ids),
@@ -782,78 +1258,98 @@ async def batch_delete_emergency_contacts(
             message=f"Deleted {len(deleted_ids)} emergency contacts" if deleted_ids else "No emergency contacts were deleted"
         )
     except SQLAlchemyError as e:
-        db.rollback()
-        logger.error(f"Database error in batch_delete_emergency_contacts: {e}")
-        logger.error(traceback.format_exc())
+        await db.rollback()
+        logger.exception(f"Database error in batch_delete_emergency_contacts: {e}")
         raise HTTPException(status_code=500, detail=f"Database error: {str(e)}")
 
 # --- Event endpoints ---
 
 @router.get("/events", response_model=List[EventResponse])
 async def get_events(
-    skip: int = 0, 
-    limit: int = 100,
+    skip: int = Query(0, deprecated=True, description="Offset pagination, superseded by after_id"),
+    limit: int = Query(100, ge=1, le=MAX_LIST_LIMIT),
+    after_id: Optional[int] = None,
+    after_date_start: Optional[datetime] = None,
     active_only: bool = False,
     featured_only: bool = False,
     use_cache: bool = True,
-    db: Session = Depends(get_db)
+    if_none_match: Optional[str] = Header(None),
+    db: AsyncSession = Depends(get_async_db)
 ):
     """
     Get all events.
     
-    - **skip**: Number of items to skip
+    - **skip**: Number of items to skip (deprecated, use after_id)
     - **limit**: Maximum number of items to return
+    - **after_id**: Return items after this ID, taken from the X-Next-Cursor header of the previous page
+    - **after_date_start**: date_start of the after_id event; lets the cursor seek without looking that row up
     - **active_only**: If true, only return active items
     - **featured_only**: If true, only return featured items
     - **use_cache**: If true, use cached results when available
+    
+    Limits must be between 1 and 10000; pages over 1000 items are streamed and not cached.
     """
     try:
+        # The cursor is compared with the naive date_start column
+        after_date_start = to_naive_utc(after_date_start)
+        
         # Generate cache key based on query parameters
-        cache_key = f"events_{skip}_{limit}_{active_only}_{featured_only}"
+        cache_key = ("events", skip, limit, after_id, after_date_start, active_only, featured_only)
         
         # Try to get from cache if caching is enabled
         if use_cache:
-            cached_result = events_cache.get(cache_key)
-            if cached_result:
-                return cached_result
-        
-        # Build query directly without excessive inspection and logging
-        query = db.query(EventItem)
-        
-        # Add filters if needed
-        if active_only:
-            query = query.filter(EventItem.is_active == True)
-        if featured_only:
-            query = query.filter(EventItem.featured == True)
-        
-        # To improve performance, first fetch just IDs with COUNT
-        count_query = query.with_entities(func.count(EventItem.id))
-        total_count = count_query.scalar()
+            cached_result = await get_cached_response(events_cache, "events_list", cache_key)
+            if cached_result is not None:
+                payload, next_cursor, etag = cached_result
+                return build_json_response(payload, if_none_match, next_cursor, etag)
+        
+        # Start from the prebuilt statement for these filters
+        query = EVENT_LIST_STMTS[(active_only, featured_only)]
+        
+        # Seek past the cursor row in (date_start, id) order instead of scanning skipped rows
+        if after_id is not None:
+            cursor_date = after_date_start
+            if cursor_date is None:
+                cursor_date = select(EventItem.date_start).where(EventItem.id == after_id).scalar_subquery()
+            query = query.where(tuple_(EventItem.date_start, EventItem.id) < tuple_(cursor_date, after_id))
+        else:
+            query = query.offset(skip)
         
-        # Now get the actual data with pagination
-        events = query.order_by(EventItem.date_start.desc()).offset(skip).limit(limit).all()
+        # Now get the actual data with pagination, with id as a tie-breaker for stable pages
+        query = query.order_by(EventItem.date_start.desc(), EventItem.id.desc()).limit(limit)
         
-        # Convert to Pydantic models efficiently
-        result = [EventResponse.model_validate(event, from_attributes=True) for event in events]
+        # Spool large pages from a server-side cursor instead of materializing every row
+        if limit > STREAM_LIST_THRESHOLD:
+            rows = await db.stream(query.execution_options(yield_per=500))
+            return StreamingResponse(stream_json_array(rows), media_type="application/json")
         
-        # Store in cache if caching is enabled (30 seconds TTL for events list)
-        if use_cache:
-            events_cache[cache_key] = result
+        async def fetch_page():
+            events = (await db.execute(query)).mappings().all()
+            next_cursor = next_page_cursor(events, limit)
             
-        return result
+            # The selected columns are exactly EventResponse's fields, in order, so orjson can
+            # encode the rows directly; it walks datetimes and the nested price list in C
+            payload = orjson.dumps([dict(event) for event in events])
+            
+            # Store in cache if caching is enabled
+            if use_cache:
+                await set_cached_response(events_cache, "events_list", cache_key, payload, next_cursor)
+            return payload, next_cursor
+        
+        # Concurrent misses for the same cached page share a single query
+        payload, next_cursor = await (single_flight(cache_key, fetch_page) if use_cache else fetch_page())
+        return build_json_response(payload, if_none_match, next_cursor)
     except SQLAlchemyError as e:
-        logger.error(f"Database error in get_events: {e}")
-        logger.error(traceback.format_exc())
+        logger.exception(f"Database error in get_events: {e}")
         raise HTTPException(status_code=500, detail=f"Database error: {str(e)}")
     except Exception as e:
-        logger.error(f"Unexpected error in get_events: {e}")
-        logger.error(traceback.format_exc())
+        logger.exception(f"Unexpected error in get_events: {e}")
         raise HTTPException(status_code=500, detail=f"Unexpected error: {str(e)}")
 
 @router.post("/events", response_model=EventResponse)
 async def create_event(
     event: EventCreate,
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ):
     """
     Create a new event.
@@ -869,27 +1365,27 @@ async def create_event(
     - **featured**: Whether the event is featured (default: False)
     """
     try:
-        db_event = EventItem(**event.model_dump())
-        db.add(db_event)
-        db.commit()
-        db.refresh(db_event)
+        # Insert and read only the generated id and timestamps back in one INSERT ... RETURNING round-trip;
+        # no ORM instance is built, the response is the request data plus those fields
+        db_event = (await insert_rows(db, EventItem, [event.model_dump()]))[0]
+        await db.commit()
         
-        # Invalidate relevant caches on create
-        events_cache.clear()
+        # A new item only changes the list pages; cached single items stay valid
+        await clear_cached_responses(events_cache, "events_list")
         
-        # Convert SQLAlchemy model to Pydantic model before returning
-        result = EventResponse.model_validate(db_event, from_attributes=True)
-        return result
+        # Encode once; returning a Response skips FastAPI's second validation pass
+        return Response(content=orjson.dumps(db_event), media_type="application/json")
     except SQLAlchemyError as e:
-        logger.error(f"Database error in create_event: {e}")
-        logger.error(traceback.format_exc())
+        await db.rollback()
+        logger.exception(f"Database error in create_event: {e}")
         raise HTTPException(status_code=500, detail=f"Database error: {str(e)}")
 
 @router.get("/events/{event_id}", response_model=EventResponse)
 async def get_event(
     event_id: int = Path(..., gt=0),
     use_cache: bool = True,
-    db: Session = Depends(get_db)
+    if_none_match: Optional[str] = Header(None),
+    db: AsyncSession = Depends(get_async_db)
 ):
     """
     Get a single event by ID.
@@ -899,94 +1395,88 @@ async def get_event(
     """
     try:
         # Generate cache key
-        cache_key = f"event_{event_id}"
+        cache_key = ("event", event_id)
         
         # Try to get from cache if caching is enabled
         if use_cache:
-            cached_result = events_cache.get(cache_key)
-            if cached_result:
-                return cached_result
-        
-        # Use direct SQL query for better performance on single item lookup
-        # This avoids SQLAlchemy overhead and takes advantage of primary key lookup
-        stmt = text("SELECT * FROM event_item WHERE id = :id")
-        result = db.execute(stmt, {"id": event_id}).fetchone()
-        
-        if not result:
-            raise HTTPException(status_code=404, detail="Event not found")
-        
-        # Create an EventItem model instance manually from the result
-        event = EventItem()
-        for key, value in result._mapping.items():
-            if hasattr(event, key):
-                setattr(event, key, value)
-                
-        # Convert SQLAlchemy model to Pydantic model
-        response = EventResponse.model_validate(event, from_attributes=True)
-        
-        # Store in cache if caching is enabled (60 seconds TTL for single event)
-        if use_cache:
-            events_cache[cache_key] = response
+            cached_result = await get_cached_response(events_cache, "events", cache_key)
+            if cached_result is not None:
+                payload, _, etag = cached_result
+                return build_json_response(payload, if_none_match, etag=etag)
+        
+        async def fetch_event():
+            # Read the response columns as a plain row mapping, skipping ORM instance construction
+            event = (await db.execute(EVENT_BY_ID_STMT, {"id": event_id})).mappings().first()
+            if event is None:
+                raise HTTPException(status_code=404, detail="Event not found")
             
-        return response
+            # Encode once; returning a Response skips FastAPI's second validation pass
+            payload = orjson.dumps(dict(event))
+            
+            # Store in cache if caching is enabled
+            if use_cache:
+                await set_cached_response(events_cache, "events", cache_key, payload)
+            return payload
+        
+        # Concurrent misses for the same item share a single query
+        payload = await (single_flight(cache_key, fetch_event) if use_cache else fetch_event())
+        return build_json_response(payload, if_none_match)
     except SQLAlchemyError as e:
-        logger.error(f"Database error in get_event: {e}")
-        logger.error(traceback.format_exc())
+        logger.exception(f"Database error in get_event: {e}")
         raise HTTPException(status_code=500, detail=f"Database error: {str(e)}")
 
 @router.put("/events/{event_id}", response_model=EventResponse)
-def update_event(
+async def update_event(
     event_id: int, 
     event: EventUpdate, 
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ):
     """Update an existing event."""
     try:
-        db_event = db.query(EventItem).filter(EventItem.id == event_id).first()
+        # Update and fetch the row in a single UPDATE ... RETURNING round-trip
+        stmt = (
+            update(EventItem)
+            .where(EventItem.id == event_id)
+            .values(**{name: getattr(event, name) for name in event.model_fields_set})
+            .returning(EventItem)
+        )
+        db_event = (await db.execute(stmt)).scalar_one_or_none()
         if not db_event:
             raise HTTPException(status_code=404, detail="Event not found")
             
-        # Update event fields
-        for key, value in event.model_dump(exclude_unset=True).items():
-            setattr(db_event, key, value)
-            
-        db.commit()
-        db.refresh(db_event)
+        await db.commit()
         
-        # Invalidate specific cache entries
-        events_cache.delete(f"event_{event_id}")
-        events_cache.clear()  # Clear all list caches
+        # Drop the changed item and the list pages; other cached items stay warm
+        await invalidate_cached_items(events_cache, "events", [("event", event_id)], "events_list")
         
-        # Convert SQLAlchemy model to Pydantic model before returning
-        result = EventResponse.model_validate(db_event, from_attributes=True)
-        return result
+        # Encode once; returning a Response skips FastAPI's second validation pass
+        return Response(content=to_response(EventResponse, db_event).model_dump_json(), media_type="application/json")
     except SQLAlchemyError as e:
-        logger.error(f"Database error in update_event: {e}")
-        logger.error(traceback.format_exc())
+        await db.rollback()
+        logger.exception(f"Database error in update_event: {e}")
         raise HTTPException(status_code=500, detail=f"Database error: {str(e)}")
 
 @router.delete("/events/{event_id}", response_model=dict)
 async def delete_event(
     event_id: int = Path(..., gt=0),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ):
     """Delete a specific event."""
     try:
-        event = db.query(EventItem).filter(EventItem.id == event_id).first()
-        if event is None:
+        # Delete with RETURNING to confirm existence without a preceding SELECT
+        deleted_id = await db.scalar(DELETE_EVENT_STMT, {"id": event_id})
+        if deleted_id is None:
             raise HTTPException(status_code=404, detail=f"Event with ID {event_id} not found")
         
-        db.delete(event)
-        db.commit()
+        await db.commit()
         
-        # Invalidate cache entries
-        events_cache.delete(f"event_{event_id}")
-        events_cache.clear()  # Clear all list caches
+        # Drop the changed item and the list pages; other cached items stay warm
+        await invalidate_cached_items(events_cache, "events", [("event", event_id)], "events_list")
         
         return {"status": "success", "message": f"Event {event_id} deleted"}
     except SQLAlchemyError as e:
-        db.rollback()
-        logger.error(f"Database error: {e}")
+        await db.rollback()
+        logger.exception(f"Database error in delete_event: {e}")
         raise HTTPException(status_code=500, detail=f"Database error: {str(e)}")
 
 # --- Batch operations for better performance ---
@@ -994,7 +1484,7 @@ async def delete_event(
 @router.post("/events/batch", response_model=List[EventResponse])
 async def batch_create_events(
     batch: BatchEventCreate,
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ):
     """
     Create multiple events in a single database transaction.
@@ -1002,33 +1492,32 @@ async def batch_create_events(
     This is much more efficient than creating events one at a time with separate API calls.
     """
     try:
-        db_events = []
-        for event_data in batch.events:
-            db_event = EventItem(**event_data.model_dump())
-            db.add(db_event)
-            db_events.append(db_event)
+        if not batch.events:
+            return []
+        
+        # Insert every row in one statement and read only the generated fields back with RETURNING
+        db_events = await insert_rows(db, EventItem, [event_data.model_dump() for event_data in batch.events])
         
         # Commit all events in a single transaction
-        db.commit()
+        await db.commit()
         
-        # Refresh all events to get their IDs and other generated fields
-        for db_event in db_events:
-            db.refresh(db_event)
+        # New items only change the list pages
+        await clear_cached_responses(events_cache, "events_list")
         
-        # Convert SQLAlchemy models to Pydantic models
-        result = [EventResponse.model_validate(event, from_attributes=True) for event in db_events]
-        return result
+        # Rows are validated request data plus database-generated fields, holding exactly the
+        # response fields, so orjson encodes the dicts directly without building a model per row
+        payload = orjson.dumps(db_events)
+        return Response(content=payload, media_type="application/json")
     except SQLAlchemyError as e:
-        db.rollback()
-        logger.error(f"Database error in batch_create_events: {e}")
-        logger.error(traceback.format_exc())
+        await db.rollback()
+        logger.exception(f"Database error in batch_create_events: {e}")
         raise HTTPException(status_code=500, detail=f"Database error: {str(e)}")
 
 @router.put("/events/batch-update-status", response_model=BatchUpdateResult)
 async def batch_update_event_status(
-    event_ids: List[int] = Body(..., embed=True),
+    event_ids: List[int] = Body(..., embed=True, min_length=1, max_length=MAX_BATCH_SIZE),
     is_active: bool = Body(..., embed=True),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ):
     """
     Update the active status of multiple events at once.
@@ -1036,26 +1525,20 @@ async def batch_update_event_status(
     This is much more efficient than updating events one at a time.
     """
     try:
-        if not event_ids:
-            raise HTTPException(status_code=400, detail="No event IDs provided")
-        
         # Prepare the update statement
-        stmt = text("""
-            UPDATE event_item 
-            SET is_active = :is_active, updated_at = NOW()
-            WHERE id = ANY(:event_ids)
-            RETURNING id
-        """)
+        stmt = BATCH_UPDATE_EVENT_STATUS_STMT
         
         # Execute the update in a single query
-        result = db.execute(stmt, {"is_active": is_active, "event_ids": event_ids})
-        updated_ids = [row[0] for row in result]
+        # One row holds both the changed IDs and the requested IDs that weren't found
+        result = (await db.execute(stmt, {"is_active": is_active, "event_ids": event_ids})).one()
+        updated_ids = result.changed_ids
+        failed_ids = result.unmatched_ids
         
         # Commit the transaction
-        db.commit()
+        await db.commit()
         
-        # Determine which IDs weren't found
-        failed_ids = [id for id in event_ids if id not in updated_ids]
+        # Drop the changed items and the list pages
+        await invalidate_cached_items(events_cache, "events", [("event", item_id) for item_id in updated_ids], "events_list")
         
         return BatchUpdateResult(
             success_count=len(updated_ids),
@@ -1063,15 +1546,14 @@ async def batch_update_event_status(
             message=f"Updated {len(updated_ids)} events" if updated_ids else "No events were updated"
         )
     except SQLAlchemyError as e:
-        db.rollback()
-        logger.error(f"Database error in batch_update_event_status: {e}")
-        logger.error(traceback.format_exc())
+        await db.rollback()
+        logger.exception(f"Database error in batch_update_event_status: {e}")
         raise HTTPException(status_code=500, detail=f"Database error: {str(e)}")
 
 @router.delete("/events/batch", response_model=BatchUpdateResult)
 async def batch_delete_events(
-    event_ids: List[int] = Body(..., embed=True),
-    db: Session = Depends(get_db)
+    event_ids: List[int] = Body(..., embed=True, min_length=1, max_length=MAX_BATCH_SIZE),
+    db: AsyncSession = Depends(get_async_db)
 ):
     """
     Delete multiple events at once.
@@ -1079,24 +1561,19 @@ async def batch_delete_events(
     This is much more efficient than deleting events one at a time with separate API calls.
     """
     try:
-        if not event_ids:
-            raise HTTPException(status_code=400, detail="No event IDs provided")
-        
         # Prepare and execute the delete statement with RETURNING to get deleted IDs
-        stmt = text("""
-            DELETE FROM event_item
-            WHERE id = ANY(:event_ids)
-            RETURNING id
-        """)
+        stmt = BATCH_DELETE_EVENT_STMT
         
-        result = db.execute(stmt, {"event_ids": event_ids})
-        deleted_ids = [row[0] for row in result]
+        # One row holds both the changed IDs and the requested IDs that weren't found
+        result = (await db.execute(stmt, {"event_ids": event_ids})).one()
+        deleted_ids = result.changed_ids
+        failed_ids = result.unmatched_ids
         
         # Commit the transaction
-        db.commit()
+        await db.commit()
         
-        # Determine which IDs weren't found
-        failed_ids = [id for id in event_ids if id not in deleted_ids]
+        # Drop the changed items and the list pages
+        await invalidate_cached_items(events_cache, "events", [("event", item_id) for item_id in deleted_ids], "events_list")
         
         return BatchUpdateResult(
             success_count=len(deleted_ids),
@@ -1104,25 +1581,63 @@ async def batch_delete_events(
             message=f"Deleted {len(deleted_ids)} events" if deleted_ids else "No events were deleted"
         )
     except SQLAlchemyError as e:
-        db.rollback()
-        logger.error(f"Database error in batch_delete_events: {e}")
-        logger.error(traceback.format_exc())
+        await db.rollback()
+        logger.exception(f"Database error in batch_delete_events: {e}")
         raise HTTPException(status_code=500, detail=f"Database error: {str(e)}")
 
 # Health check endpoint
+# Seconds a healthy result is reused, so frequent load balancer probes don't each query PostgreSQL
+HEALTH_CHECK_INTERVAL = 2.0
+
+# Seconds the probe may wait for a connection and SELECT 1 before reporting failure
+HEALTH_CHECK_TIMEOUT = 1.0
+
+# (monotonic time, response) of the last healthy check
+last_health_check = (0.0, None)
+
+async def probe_postgres():
+    """Run SELECT 1 on a pooled connection without opening an ORM session"""
+    async with async_engine.connect() as conn:
+        await conn.execute(HEALTH_CHECK_STMT)
+
+async def probe_redis():
+    """PING the shared Redis cache, if one is configured"""
+    if shared_cache is not None:
+        await shared_cache.ping()
+
 @router.get("/health")
-async def health_check(db: Session = Depends(get_db)):
-    """
-    Check health of PostgreSQL connection.
-    """
-    try:
-        # Perform a simple database query to check health
-        # Use text() to wrap the SQL query for SQLAlchemy 2.0 compatibility
-        db.execute(text("SELECT 1")).first()
-        return {"status": "healthy", "message": "PostgreSQL connection is working", "timestamp": datetime.now().isoformat()}
-    except Exception as e:
-        logger.error(f"PostgreSQL health check failed: {e}")
-        raise HTTPException(status_code=503, detail=f"PostgreSQL connection failed: {str(e)}")
+async def health_check():
+    """
+    Check health of the PostgreSQL connection and, when configured, the shared Redis cache.
+    
+    A PostgreSQL failure returns 503; a Redis failure reports "degraded", since
+    requests fall back to the database. Healthy results are reused for a couple of seconds.
+    """
+    global last_health_check
+    checked_at, cached_response = last_health_check
+    if cached_response is not None and time.monotonic() - checked_at < HEALTH_CHECK_INTERVAL:
+        return cached_response
+    
+    # Probe both backends concurrently, each bounded so a hung backend fails fast
+    postgres_error, redis_error = await asyncio.gather(
+        asyncio.wait_for(probe_postgres(), HEALTH_CHECK_TIMEOUT),
+        asyncio.wait_for(probe_redis(), HEALTH_CHECK_TIMEOUT),
+        return_exceptions=True,
+    )
+    if postgres_error is not None:
+        logger.error(f"PostgreSQL health check failed: {postgres_error}")
+        raise HTTPException(status_code=503, detail=f"PostgreSQL connection failed: {str(postgres_error)}")
+    
+    response = {"status": "healthy", "message": "PostgreSQL connection is working", "timestamp": datetime.now().isoformat()}
+    if shared_cache is not None:
+        response["redis"] = "ok" if redis_error is None else f"failed: {redis_error}"
+    if redis_error is not None:
+        logger.warning(f"Redis health check failed: {redis_error}")
+        response["status"] = "degraded"
+        return response
+    
+    last_health_check = (time.monotonic(), response)
+    return response
 
 # Add BatchFAQCreate class to model definitions
 class BatchFAQCreate(BaseModel):
@@ -1132,7 +1647,7 @@ class BatchFAQCreate(BaseModel):
 @router.post("/faqs/batch", response_model=List[FAQResponse])
 async def batch_create_faqs(
     batch: BatchFAQCreate,
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ):
     """
     Create multiple FAQ items in a single database transaction.
@@ -1140,36 +1655,32 @@ async def batch_create_faqs(
     This is much more efficient than creating FAQ items one at a time with separate API calls.
     """
     try:
-        db_faqs = []
-        for faq_data in batch.faqs:
-            db_faq = FAQItem(**faq_data.model_dump())
-            db.add(db_faq)
-            db_faqs.append(db_faq)
+        if not batch.faqs:
+            return []
         
-        # Commit all FAQ items in a single transaction
-        db.commit()
+        # Insert every row in one statement and read only the generated fields back with RETURNING
+        db_faqs = await insert_rows(db, FAQItem, [faq_data.model_dump() for faq_data in batch.faqs])
         
-        # Refresh all FAQ items to get their IDs and other generated fields
-        for db_faq in db_faqs:
-            db.refresh(db_faq)
+        # Commit all FAQ items in a single transaction
+        await db.commit()
         
-        # Invalidate FAQ cache
-        faqs_cache.clear()
+        # New items only change the list pages
+        await clear_cached_responses(faqs_cache, "faqs_list")
         
-        # Convert SQLAlchemy models to Pydantic models
-        result = [FAQResponse.model_validate(faq, from_attributes=True) for faq in db_faqs]
-        return result
+        # Rows are validated request data plus database-generated fields, holding exactly the
+        # response fields, so orjson encodes the dicts directly without building a model per row
+        payload = orjson.dumps(db_faqs)
+        return Response(content=payload, media_type="application/json")
     except SQLAlchemyError as e:
-        db.rollback()
-        logger.error(f"Database error in batch_create_faqs: {e}")
-        logger.error(traceback.format_exc())
+        await db.rollback()
+        logger.exception(f"Database error in batch_create_faqs: {e}")
         raise HTTPException(status_code=500, detail=f"Database error: {str(e)}")
 
 @router.put("/faqs/batch-update-status", response_model=BatchUpdateResult)
 async def batch_update_faq_status(
-    faq_ids: List[int] = Body(..., embed=True),
+    faq_ids: List[int] = Body(..., embed=True, min_length=1, max_length=MAX_BATCH_SIZE),
     is_active: bool = Body(..., embed=True),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ):
     """
     Update the active status of multiple FAQ items at once.
@@ -1177,29 +1688,20 @@ async def batch_update_faq_status(
     This is much more efficient than updating FAQ items one at a time.
     """
     try:
-        if not faq_ids:
-            raise HTTPException(status_code=400, detail="No FAQ IDs provided")
-        
         # Prepare the update statement
-        stmt = text("""
-            UPDATE faq_item 
-            SET is_active = :is_active, updated_at = NOW()
-            WHERE id = ANY(:faq_ids)
-            RETURNING id
-        """)
+        stmt = BATCH_UPDATE_FAQ_STATUS_STMT
         
         # Execute the update in a single query
-        result = db.execute(stmt, {"is_active": is_active, "faq_ids": faq_ids})
-        updated_ids = [row[0] for row in result]
+        # One row holds both the changed IDs and the requested IDs that weren't found
+        result = (await db.execute(stmt, {"is_active": is_active, "faq_ids": faq_ids})).one()
+        updated_ids = result.changed_ids
+        failed_ids = result.unmatched_ids
         
         # Commit the transaction
-        db.commit()
+        await db.commit()
         
-        # Determine which IDs weren't found
-        failed_ids = [id for id in faq_ids if id not in updated_ids]
-        
-        # Invalidate FAQ cache
-        faqs_cache.clear()
+        # Drop the changed items and the list pages
+        await invalidate_cached_items(faqs_cache, "faqs", [("faq", item_id) for item_id in updated_ids], "faqs_list")
         
         return BatchUpdateResult(
             success_count=len(updated_ids),
@@ -1207,15 +1709,14 @@ async def batch_update_faq_status(
             message=f"Updated {len(updated_ids)} FAQ items" if updated_ids else "No FAQ items were updated"
         )
     except SQLAlchemyError as e:
-        db.rollback()
-        logger.error(f"Database error in batch_update_faq_status: {e}")
-        logger.error(traceback.format_exc())
+        await db.rollback()
+        logger.exception(f"Database error in batch_update_faq_status: {e}")
         raise HTTPException(status_code=500, detail=f"Database error: {str(e)}")
 
 @router.delete("/faqs/batch", response_model=BatchUpdateResult)
 async def batch_delete_faqs(
-    faq_ids: List[int] = Body(..., embed=True),
-    db: Session = Depends(get_db)
+    faq_ids: List[int] = Body(..., embed=True, min_length=1, max_length=MAX_BATCH_SIZE),
+    db: AsyncSession = Depends(get_async_db)
 ):
     """
     Delete multiple FAQ items at once.
@@ -1223,27 +1724,19 @@ async def batch_delete_faqs(
     This is much more efficient than deleting FAQ items one at a time with separate API calls.
     """
     try:
-        if not faq_ids:
-            raise HTTPException(status_code=400, detail="No FAQ IDs provided")
-        
         # Prepare and execute the delete statement with RETURNING to get deleted IDs
-        stmt = text("""
-            DELETE FROM faq_item
-            WHERE id = ANY(:faq_ids)
-            RETURNING id
-        """)
+        stmt = BATCH_DELETE_FAQ_STMT
         
-        result = db.execute(stmt, {"faq_ids": faq_ids})
-        deleted_ids = [row[0] for row in result]
+        # One row holds both the changed IDs and the requested IDs that weren't found
+        result = (await db.execute(stmt, {"faq_ids": faq_ids})).one()
+        deleted_ids = result.changed_ids
+        failed_ids = result.unmatched_ids
         
         # Commit the transaction
-        db.commit()
+        await db.commit()
         
-        # Determine which IDs weren't found
-        failed_ids = [id for id in faq_ids if id not in deleted_ids]
-        
-        # Invalidate FAQ cache
-        faqs_cache.clear()
+        # Drop the changed items and the list pages
+        await invalidate_cached_items(faqs_cache, "faqs", [("faq", item_id) for item_id in deleted_ids], "faqs_list")
         
         return BatchUpdateResult(
             success_count=len(deleted_ids),
@@ -1251,9 +1744,8 @@ async def batch_delete_faqs(
             message=f"Deleted {len(deleted_ids)} FAQ items" if deleted_ids else "No FAQ items were deleted"
         )
     except SQLAlchemyError as e:
-        db.rollback()
-        logger.error(f"Database error in batch_delete_faqs: {e}")
-        logger.error(traceback.format_exc())
+        await db.rollback()
+        logger.exception(f"Database error in batch_delete_faqs: {e}")
         raise HTTPException(status_code=500, detail=f"Database error: {str(e)}")
 
 # Add BatchEmergencyCreate class to the Pydantic models section
@@ -1263,7 +1755,7 @@ class BatchEmergencyCreate(BaseModel):
 @router.post("/emergency/batch", response_model=List[EmergencyResponse])
 async def batch_create_emergency_contacts(
     batch: BatchEmergencyCreate,
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ):
     """
     Create multiple emergency contacts in a single database transaction.
@@ -1271,120 +1763,25 @@ async def batch_create_emergency_contacts(
     This is much more efficient than creating emergency contacts one at a time with separate API calls.
     """
     try:
-        db_emergency_contacts = []
-        for emergency_data in batch.emergency_contacts:
-            db_emergency = EmergencyItem(**emergency_data.model_dump())
-            db.add(db_emergency)
-            db_emergency_contacts.append(db_emergency)
-        
-        # Commit all emergency contacts in a single transaction
-        db.commit()
-        
-        # Refresh all items to get their IDs and other generated fields
-        for db_emergency in db_emergency_contacts:
-            db.refresh(db_emergency)
-        
-        # Invalidate emergency cache
-        emergencies_cache.clear()
-        
-        # Convert SQLAlchemy models to Pydantic models
-        result = [EmergencyResponse.model_validate(emergency, from_attributes=True) for emergency in db_emergency_contacts]
-        return result
-    except SQLAlchemyError as e:
-        db.rollback()
-        logger.error(f"Database error in batch_create_emergency_contacts: {e}")
-        logger.error(traceback.format_exc())
-        raise HTTPException(status_code=500, detail=f"Database error: {str(e)}")
-
-@router.put("/emergency/batch-update-status", response_model=BatchUpdateResult)
-async def batch_update_emergency_status(
-    emergency_ids: List[int] = Body(..., embed=True),
-    is_active: bool = Body(..., embed=True),
-    db: Session = Depends(get_db)
-):
-    """
-    Update the active status of multiple emergency contacts at once.
-    
-    This is much more efficient than updating emergency contacts one at a time.
-    """
-    try:
-        if not emergency_ids:
-            raise HTTPException(status_code=400, detail="No emergency contact IDs provided")
-        
-        # Prepare the update statement
-        stmt = text("""
-            UPDATE emergency_item 
-            SET is_active = :is_active, updated_at = NOW()
-            WHERE id = ANY(:emergency_ids)
-            RETURNING id
-        """)
-        
-        # Execute the update in a single query
-        result = db.execute(stmt, {"is_active": is_active, "emergency_ids": emergency_ids})
-        updated_ids = [row[0] for row in result]
+        if not batch.emergency_contacts:
+            return []
         
-        # Commit the transaction
-        db.commit()
+        # Insert every row in one statement and read only the generated fields back with RETURNING
+        db_emergency_contacts = await insert_rows(db, EmergencyItem, [emergency_data.model_dump() for emergency_data in batch.emergency_contacts])
         
-        # Determine which IDs weren't found
-        failed_ids = [id for id in emergency_ids if id not in updated_ids]
+        # Commit all emergency contacts in a single transaction
+        await db.commit()
         
-        # Invalidate emergency cache
-        emergencies_cache.clear()
+        # New items only change the list pages
+        await clear_cached_responses(emergencies_cache, "emergency_list")
         
-        return BatchUpdateResult(
-            success_count=len(updated_ids),
-            failed_ids=failed_ids,
-            message=f"Updated {len(updated_ids)} emergency contacts" if updated_ids else "No emergency contacts were updated"
-        )
+        # Rows are validated request data plus database-generated fields, holding exactly the
+        # response fields, so orjson encodes the dicts directly without building a model per row
+        payload = orjson.dumps(db_emergency_contacts)
+        return Response(content=payload, media_type="application/json")
     except SQLAlchemyError as e:
-        db.rollback()
-        logger.error(f"Database error in batch_update_emergency_status: {e}")
-        logger.error(traceback.format_exc())
-        raise HTTPException(status_code=500, detail=f"Database error: {str(e)}")
-
-@router.delete("/emergency/batch", response_model=BatchUpdateResult)
-async def batch_delete_emergency_contacts(
-    emergency_ids: List[int] = Body(..., embed=True),
-    db: Session = Depends(get_db)
-):
-    """
-    Delete multiple emergency contacts at once.
-    
-    This is much more efficient than deleting emergency contacts one at a time with separate API calls.
-    """
-    try:
-        if not emergency_ids:
-            raise HTTPException(status_code=400, detail="No emergency contact IDs provided")
-        
-        # Prepare and execute the delete statement with RETURNING to get deleted IDs
-        stmt = text("""
-            DELETE FROM emergency_item
-            WHERE id = ANY(:emergency_ids)
-            RETURNING id
-        """)
-        
-        result = db.execute(stmt, {"emergency_ids": emergency_ids})
-        deleted_ids = [row[0] for row in result]
-        
-        # Commit the transaction
-        db.commit()
-        
-        # Determine which IDs weren't found
-        failed_ids = [id for id in emergency_ids if id not in deleted_ids]
-        
-        # Invalidate emergency cache
-        emergencies_cache.clear()
-        
-        return BatchUpdateResult(
-            success_count=len(deleted_ids),
-            failed_ids=failed_ids,
-            message=f"Deleted {len(deleted_ids)} emergency contacts" if deleted_ids else "No emergency contacts were deleted"
-        )
-    except SQLAlchemyError as e:
-        db.rollback()
-        logger.error(f"Database error in batch_delete_emergency_contacts: {e}")
-        logger.error(traceback.format_exc())
+        await db.rollback()
+        logger.exception(f"Database error in batch_create_emergency_contacts: {e}")
         raise HTTPException(status_code=500, detail=f"Database error: {str(e)}")
 
 # --- About Pixity endpoints ---
@@ -1392,7 +1789,7 @@ async def batch_delete_emergency_contacts(
 @router.get("/about-pixity", response_model=InfoContentResponse)
 async def get_about_pixity(
     use_cache: bool = True,
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ):
     """
     Get the About Pixity information.
@@ -1402,51 +1799,32 @@ async def get_about_pixity(
     try:
         # Try to get from cache if caching is enabled
         if use_cache:
-            cached_result = about_pixity_cache.get("about_pixity")
-            if cached_result:
-                logger.info("Cache hit for about_pixity")
-                return cached_result
+            cached_result = await get_cached_response(about_pixity_cache, "about_pixity", "about_pixity")
+            if cached_result is not None:
+                if logger.isEnabledFor(logging.DEBUG):
+                    logger.debug("Cache hit for about_pixity")
+                return Response(content=cached_result[0], media_type="application/json")
         
-        # Get the first record (or create if none exists)
-        about = db.query(AboutPixity).first()
+        # Get the record, creating the default one in the same statement if none exists
+        about = (await db.execute(ABOUT_PIXITY_STMT)).mappings().one()
+        await db.commit()
         
-        if not about:
-            # Create default content if none exists
-            about = AboutPixity(
-                content="""PiXity is your smart, AI-powered local companion designed to help foreigners navigate life in any city of Vietnam with ease, starting with Da Nang. From finding late-night eats to handling visas, housing, and healthcare, PiXity bridges the gap in language, culture, and local know-how — so you can explore the city like a true insider.
-
-PiXity is proudly built by PiX.teq, the tech team behind PiX — a multidisciplinary collective based in Da Nang.
-
-X: x.com/pixity_bot
-Instagram: instagram.com/pixity.aibot/
-Tiktok: tiktok.com/@pixity.aibot"""
-            )
-            db.add(about)
-            db.commit()
-            db.refresh(about)
-        
-        # Convert to Pydantic model
-        response = InfoContentResponse(
-            id=about.id,
-            content=about.content,
-            created_at=about.created_at,
-            updated_at=about.updated_at
-        )
+        # The row holds exactly the response fields; encode it directly, the cache keeps the JSON bytes
+        payload = orjson.dumps(dict(about))
         
         # Store in cache if caching is enabled
         if use_cache:
-            about_pixity_cache["about_pixity"] = response
+            await set_cached_response(about_pixity_cache, "about_pixity", "about_pixity", payload)
             
-        return response
+        return Response(content=payload, media_type="application/json")
     except SQLAlchemyError as e:
-        logger.error(f"Database error in get_about_pixity: {e}")
-        logger.error(traceback.format_exc())
+        logger.exception(f"Database error in get_about_pixity: {e}")
         raise HTTPException(status_code=500, detail=f"Database error: {str(e)}")
 
 @router.put("/about-pixity", response_model=InfoContentResponse)
 async def update_about_pixity(
     data: InfoContentUpdate,
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ):
     """
     Update the About Pixity information.
@@ -1454,36 +1832,18 @@ async def update_about_pixity(
     - **content**: New content text
     """
     try:
-        # Get the first record (or create if none exists)
-        about = db.query(AboutPixity).first()
-        
-        if not about:
-            # Create new record if none exists
-            about = AboutPixity(content=data.content)
-            db.add(about)
-        else:
-            # Update existing record
-            about.content = data.content
-            
-        db.commit()
-        db.refresh(about)
+        # Update the record (or create it if none exists) and read it back in the same statement
+        about = await upsert_content_row(db, AboutPixity, data.content)
+        await db.commit()
         
         # Invalidate cache
-        about_pixity_cache.clear()
-        
-        # Convert to Pydantic model
-        response = InfoContentResponse(
-            id=about.id,
-            content=about.content,
-            created_at=about.created_at,
-            updated_at=about.updated_at
-        )
+        await clear_cached_responses(about_pixity_cache, "about_pixity")
         
-        return response
+        # Encode once; returning a Response skips FastAPI's second validation pass
+        return Response(content=to_response(InfoContentResponse, about).model_dump_json(), media_type="application/json")
     except SQLAlchemyError as e:
-        db.rollback()
-        logger.error(f"Database error in update_about_pixity: {e}")
-        logger.error(traceback.format_exc())
+        await db.rollback()
+        logger.exception(f"Database error in update_about_pixity: {e}")
         raise HTTPException(status_code=500, detail=f"Database error: {str(e)}")
 
 # --- Da Nang Bucket List Pydantic models ---
@@ -1506,7 +1866,7 @@ class DaNangBucketListUpdate(BaseModel):
 # --- Da Nang Bucket List Endpoints ---
 @router.get("/danang-bucket-list", response_model=DaNangBucketListResponse)
 async def get_danang_bucket_list(
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
     use_cache: bool = True
 ):
     """
@@ -1516,86 +1876,55 @@ async def get_danang_bucket_list(
     cache_key = "danang_bucket_list"
     
     # Try to get from cache if caching is enabled
-    if use_cache and cache_key in danang_bucket_list_cache:
-        cached_result = danang_bucket_list_cache[cache_key]
-        logger.info(f"Cache hit for {cache_key}")
-        return cached_result
-    
-    try:
-        # Try to get the first bucket list entry
-        db_bucket_list = db.query(DaNangBucketList).first()
-        
-        # If no entry exists, create a default one
-        if not db_bucket_list:
-            default_content = json.dumps({
-                "title": "Da Nang Bucket List",
-                "description": "Must-visit places and experiences in Da Nang",
-                "items": [
-                    {"name": "Ba Na Hills", "description": "Visit the famous Golden Bridge"},
-                    {"name": "Marble Mountains", "description": "Explore caves and temples"},
-                    {"name": "My Khe Beach", "description": "Relax at one of the most beautiful beaches in Vietnam"},
-                    {"name": "Dragon Bridge", "description": "Watch the fire-breathing show on weekends"},
-                    {"name": "Son Tra Peninsula", "description": "See the Lady Buddha statue and lookout point"}
-                ]
-            })
-            
-            new_bucket_list = DaNangBucketList(content=default_content)
-            db.add(new_bucket_list)
-            db.commit()
-            db.refresh(new_bucket_list)
-            db_bucket_list = new_bucket_list
+    if use_cache:
+        cached_result = await get_cached_response(danang_bucket_list_cache, "danang_bucket_list", cache_key)
+        if cached_result is not None:
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug(f"Cache hit for {cache_key}")
+            return Response(content=cached_result[0], media_type="application/json")
+    
+    try:
+        # Get the entry, creating the default one in the same statement if none exists
+        db_bucket_list = (await db.execute(DANANG_BUCKET_LIST_STMT)).mappings().one()
+        await db.commit()
             
-        # Convert to Pydantic model
-        response = DaNangBucketListResponse.model_validate(db_bucket_list, from_attributes=True)
+        # The row holds exactly the response fields; encode it directly, the cache keeps the JSON bytes
+        payload = orjson.dumps(dict(db_bucket_list))
         
         # Store in cache if caching is enabled
         if use_cache:
-            danang_bucket_list_cache[cache_key] = response
+            await set_cached_response(danang_bucket_list_cache, "danang_bucket_list", cache_key, payload)
             
-        return response
+        return Response(content=payload, media_type="application/json")
         
     except SQLAlchemyError as e:
         error_msg = f"Database error in get_danang_bucket_list: {str(e)}"
-        logger.error(error_msg)
-        logger.error(traceback.format_exc())
+        logger.exception(error_msg)
         raise HTTPException(status_code=500, detail=error_msg)
 
 @router.put("/danang-bucket-list", response_model=DaNangBucketListResponse)
 async def update_danang_bucket_list(
     bucket_list_data: DaNangBucketListUpdate,
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ):
     """
     Update the Da Nang Bucket List information.
     If none exists, creates a new entry.
     """
     try:
-        # Try to get the first bucket list entry
-        db_bucket_list = db.query(DaNangBucketList).first()
-        
-        # If no entry exists, create a new one
-        if not db_bucket_list:
-            db_bucket_list = DaNangBucketList(content=bucket_list_data.content)
-            db.add(db_bucket_list)
-        else:
-            # Update existing entry
-            db_bucket_list.content = bucket_list_data.content
-            db_bucket_list.updated_at = datetime.utcnow()
-            
-        db.commit()
-        db.refresh(db_bucket_list)
+        # Update the entry (or create it if none exists) and read it back in the same statement
+        db_bucket_list = await upsert_content_row(db, DaNangBucketList, bucket_list_data.content)
+        await db.commit()
         
         # Clear cache
-        if "danang_bucket_list" in danang_bucket_list_cache:
-            del danang_bucket_list_cache["danang_bucket_list"]
+        await clear_cached_responses(danang_bucket_list_cache, "danang_bucket_list")
         
-        # Convert to Pydantic model
-        return DaNangBucketListResponse.model_validate(db_bucket_list, from_attributes=True)
+        # Encode once; returning a Response skips FastAPI's second validation pass
+        return Response(content=to_response(DaNangBucketListResponse, db_bucket_list).model_dump_json(), media_type="application/json")
         
     except SQLAlchemyError as e:
         error_msg = f"Database error in update_danang_bucket_list: {str(e)}"
-        logger.error(error_msg)
-        logger.error(traceback.format_exc())
+        logger.exception(error_msg)
         raise HTTPException(status_code=500, detail=error_msg)
 
 # --- Solana Summit Pydantic models ---
@@ -1618,7 +1947,7 @@ class SolanaSummitUpdate(BaseModel):
 # --- Solana Summit Endpoints ---
 @router.get("/solana-summit", response_model=SolanaSummitResponse)
 async def get_solana_summit(
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
     use_cache: bool = True
 ):
     """
@@ -1628,90 +1957,55 @@ async def get_solana_summit(
     cache_key = "solana_summit"
     
     # Try to get from cache if caching is enabled
-    if use_cache and cache_key in solana_summit_cache:
-        cached_result = solana_summit_cache[cache_key]
-        logger.info(f"Cache hit for {cache_key}")
-        return cached_result
-    
-    try:
-        # Try to get the first solana summit entry
-        db_solana_summit = db.query(SolanaSummit).first()
-        
-        # If no entry exists, create a default one
-        if not db_solana_summit:
-            default_content = json.dumps({
-                "title": "Solana Summit Vietnam",
-                "description": "Information about Solana Summit Vietnam event in Da Nang",
-                "date": "2023-11-04T09:00:00+07:00",
-                "location": "Hyatt Regency, Da Nang",
-                "details": "The Solana Summit is a gathering of developers, entrepreneurs, and enthusiasts in the Solana ecosystem.",
-                "agenda": [
-                    {"time": "09:00", "activity": "Registration & Networking"},
-                    {"time": "10:00", "activity": "Opening Keynote"},
-                    {"time": "12:00", "activity": "Lunch Break"},
-                    {"time": "13:30", "activity": "Developer Workshops"},
-                    {"time": "17:00", "activity": "Closing Remarks & Networking"}
-                ],
-                "registration_url": "https://example.com/solana-summit-registration"
-            })
-            
-            new_solana_summit = SolanaSummit(content=default_content)
-            db.add(new_solana_summit)
-            db.commit()
-            db.refresh(new_solana_summit)
-            db_solana_summit = new_solana_summit
+    if use_cache:
+        cached_result = await get_cached_response(solana_summit_cache, "solana_summit", cache_key)
+        if cached_result is not None:
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug(f"Cache hit for {cache_key}")
+            return Response(content=cached_result[0], media_type="application/json")
+    
+    try:
+        # Get the entry, creating the default one in the same statement if none exists
+        db_solana_summit = (await db.execute(SOLANA_SUMMIT_STMT)).mappings().one()
+        await db.commit()
             
-        # Convert to Pydantic model
-        response = SolanaSummitResponse.model_validate(db_solana_summit, from_attributes=True)
+        # The row holds exactly the response fields; encode it directly, the cache keeps the JSON bytes
+        payload = orjson.dumps(dict(db_solana_summit))
         
         # Store in cache if caching is enabled
         if use_cache:
-            solana_summit_cache[cache_key] = response
+            await set_cached_response(solana_summit_cache, "solana_summit", cache_key, payload)
             
-        return response
+        return Response(content=payload, media_type="application/json")
         
     except SQLAlchemyError as e:
         error_msg = f"Database error in get_solana_summit: {str(e)}"
-        logger.error(error_msg)
-        logger.error(traceback.format_exc())
+        logger.exception(error_msg)
         raise HTTPException(status_code=500, detail=error_msg)
 
 @router.put("/solana-summit", response_model=SolanaSummitResponse)
 async def update_solana_summit(
     summit_data: SolanaSummitUpdate,
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ):
     """
     Update the Solana Summit information.
     If none exists, creates a new entry.
     """
     try:
-        # Try to get the first solana summit entry
-        db_solana_summit = db.query(SolanaSummit).first()
-        
-        # If no entry exists, create a new one
-        if not db_solana_summit:
-            db_solana_summit = SolanaSummit(content=summit_data.content)
-            db.add(db_solana_summit)
-        else:
-            # Update existing entry
-            db_solana_summit.content = summit_data.content
-            db_solana_summit.updated_at = datetime.utcnow()
-            
-        db.commit()
-        db.refresh(db_solana_summit)
+        # Update the entry (or create it if none exists) and read it back in the same statement
+        db_solana_summit = await upsert_content_row(db, SolanaSummit, summit_data.content)
+        await db.commit()
         
         # Clear cache
-        if "solana_summit" in solana_summit_cache:
-            del solana_summit_cache["solana_summit"]
+        await clear_cached_responses(solana_summit_cache, "solana_summit")
         
-        # Convert to Pydantic model
-        return SolanaSummitResponse.model_validate(db_solana_summit, from_attributes=True)
+        # Encode once; returning a Response skips FastAPI's second validation pass
+        return Response(content=to_response(SolanaSummitResponse, db_solana_summit).model_dump_json(), media_type="application/json")
         
     except SQLAlchemyError as e:
         error_msg = f"Database error in update_solana_summit: {str(e)}"
-        logger.error(error_msg)
-        logger.error(traceback.format_exc())
+        logger.exception(error_msg)
         raise HTTPException(status_code=500, detail=error_msg)
 
 # --- API Key models and endpoints ---
@@ -1737,12 +2031,17 @@ class ApiKeyResponse(ApiKeyBase):
     
     model_config = ConfigDict(from_attributes=True)
 
+# Columns follow the ApiKeyResponse field order so orjson can encode the row mappings as-is
+api_key_response_columns = [ApiKey.__table__.c[name] for name in ApiKeyResponse.model_fields]
+API_KEY_BY_ID_STMT = select(*api_key_response_columns).where(ApiKey.id == bindparam("id"))
+DELETE_API_KEY_STMT = delete(ApiKey).where(ApiKey.id == bindparam("id")).returning(ApiKey.id)
+
 @router.get("/api-keys", response_model=List[ApiKeyResponse])
 async def get_api_keys(
     skip: int = 0,
     limit: int = 100,
     active_only: bool = False,
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ):
     """
     Get all API keys.
@@ -1752,159 +2051,157 @@ async def get_api_keys(
     - **active_only**: If true, only return active keys
     """
     try:
-        query = db.query(ApiKey)
+        query = select(*api_key_response_columns)
         
         if active_only:
-            query = query.filter(ApiKey.is_active == True)
+            query = query.where(ApiKey.is_active == True)
+        
+        api_keys = (await db.execute(query.offset(skip).limit(limit))).mappings().all()
         
-        api_keys = query.offset(skip).limit(limit).all()
-        return [ApiKeyResponse.model_validate(key, from_attributes=True) for key in api_keys]
+        # Rows come straight from the database with exactly the response columns; encode them in one call
+        payload = orjson.dumps([dict(key) for key in api_keys])
+        return Response(content=payload, media_type="application/json")
     except SQLAlchemyError as e:
-        logger.error(f"Database error retrieving API keys: {e}")
+        logger.exception(f"Database error retrieving API keys: {e}")
         raise HTTPException(status_code=500, detail=f"Database error: {str(e)}")
     except Exception as e:
-        logger.error(f"Error retrieving API keys: {e}")
-        logger.error(traceback.format_exc())
+        logger.exception(f"Error retrieving API keys: {e}")
         raise HTTPException(status_code=500, detail=f"Error retrieving API keys: {str(e)}")
 
 @router.post("/api-keys", response_model=ApiKeyResponse)
 async def create_api_key(
     api_key: ApiKeyCreate,
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ):
     """
     Create a new API key.
     """
     try:
         # Create API key object
-        db_api_key = ApiKey(
-            key_type=api_key.key_type,
-            key_value=api_key.key_value,
-            description=api_key.description,
-            is_active=api_key.is_active
+        db_api_key = await db.scalar(
+            insert(ApiKey).values(
+                key_type=api_key.key_type,
+                key_value=api_key.key_value,
+                description=api_key.description,
+                is_active=api_key.is_active
+            ).returning(ApiKey)
         )
-        
-        db.add(db_api_key)
-        db.commit()
-        db.refresh(db_api_key)
+        await db.commit()
         
         return ApiKeyResponse.model_validate(db_api_key, from_attributes=True)
     except SQLAlchemyError as e:
-        db.rollback()
-        logger.error(f"Database error creating API key: {e}")
+        await db.rollback()
+        logger.exception(f"Database error creating API key: {e}")
         raise HTTPException(status_code=500, detail=f"Database error: {str(e)}")
     except Exception as e:
-        db.rollback()
-        logger.error(f"Error creating API key: {e}")
-        logger.error(traceback.format_exc())
+        await db.rollback()
+        logger.exception(f"Error creating API key: {e}")
         raise HTTPException(status_code=500, detail=f"Error creating API key: {str(e)}")
 
 @router.get("/api-keys/{api_key_id}", response_model=ApiKeyResponse)
 async def get_api_key(
     api_key_id: int = Path(..., gt=0),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ):
     """
     Get API key by ID.
     """
     try:
-        api_key = db.query(ApiKey).filter(ApiKey.id == api_key_id).first()
+        api_key = (await db.execute(API_KEY_BY_ID_STMT, {"id": api_key_id})).mappings().first()
         if not api_key:
             raise HTTPException(status_code=404, detail=f"API key with ID {api_key_id} not found")
         
-        return ApiKeyResponse.model_validate(api_key, from_attributes=True)
+        # Same encoding as the API key list: the row mapping holds exactly the response columns
+        return Response(content=orjson.dumps(dict(api_key)), media_type="application/json")
     except HTTPException:
         raise
     except Exception as e:
-        logger.error(f"Error retrieving API key: {e}")
-        logger.error(traceback.format_exc())
+        logger.exception(f"Error retrieving API key: {e}")
         raise HTTPException(status_code=500, detail=f"Error retrieving API key: {str(e)}")
 
 @router.put("/api-keys/{api_key_id}", response_model=ApiKeyResponse)
 async def update_api_key(
     api_key_id: int = Path(..., gt=0),
     api_key_update: ApiKeyUpdate = Body(...),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ):
     """
     Update API key details.
     """
     try:
-        db_api_key = db.query(ApiKey).filter(ApiKey.id == api_key_id).first()
+        # Update fields if provided, fetching the row in a single UPDATE ... RETURNING round-trip
+        update_data = api_key_update.model_dump(exclude_none=True)
+        if update_data:
+            db_api_key = (await db.execute(
+                update(ApiKey).where(ApiKey.id == api_key_id).values(**update_data).returning(ApiKey)
+            )).scalar_one_or_none()
+        else:
+            db_api_key = await db.get(ApiKey, api_key_id)
         if not db_api_key:
             raise HTTPException(status_code=404, detail=f"API key with ID {api_key_id} not found")
         
-        # Update fields if provided
-        if api_key_update.key_type is not None:
-            db_api_key.key_type = api_key_update.key_type
-        if api_key_update.key_value is not None:
-            db_api_key.key_value = api_key_update.key_value
-        if api_key_update.description is not None:
-            db_api_key.description = api_key_update.description
-        if api_key_update.is_active is not None:
-            db_api_key.is_active = api_key_update.is_active
-        
-        db.commit()
-        db.refresh(db_api_key)
+        await db.commit()
         
         return ApiKeyResponse.model_validate(db_api_key, from_attributes=True)
     except HTTPException:
         raise
     except SQLAlchemyError as e:
-        db.rollback()
-        logger.error(f"Database error updating API key: {e}")
+        await db.rollback()
+        logger.exception(f"Database error updating API key: {e}")
         raise HTTPException(status_code=500, detail=f"Database error: {str(e)}")
     except Exception as e:
-        db.rollback()
-        logger.error(f"Error updating API key: {e}")
-        logger.error(traceback.format_exc())
+        await db.rollback()
+        logger.exception(f"Error updating API key: {e}")
         raise HTTPException(status_code=500, detail=f"Error updating API key: {str(e)}")
 
 @router.delete("/api-keys/{api_key_id}", response_model=dict)
 async def delete_api_key(
     api_key_id: int = Path(..., gt=0),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ):
     """
     Delete API key.
     """
     try:
-        db_api_key = db.query(ApiKey).filter(ApiKey.id == api_key_id).first()
-        if not db_api_key:
+        # Delete with RETURNING to confirm existence without a preceding SELECT
+        deleted_id = await db.scalar(DELETE_API_KEY_STMT, {"id": api_key_id})
+        if deleted_id is None:
             raise HTTPException(status_code=404, detail=f"API key with ID {api_key_id} not found")
         
-        db.delete(db_api_key)
-        db.commit()
+        await db.commit()
         
         return {"message": f"API key with ID {api_key_id} deleted successfully"}
     except HTTPException:
         raise
     except SQLAlchemyError as e:
-        db.rollback()
-        logger.error(f"Database error deleting API key: {e}")
+        await db.rollback()
+        logger.exception(f"Database error deleting API key: {e}")
         raise HTTPException(status_code=500, detail=f"Database error: {str(e)}")
     except Exception as e:
-        db.rollback()
-        logger.error(f"Error deleting API key: {e}")
-        logger.error(traceback.format_exc())
+        await db.rollback()
+        logger.exception(f"Error deleting API key: {e}")
         raise HTTPException(status_code=500, detail=f"Error deleting API key: {str(e)}")
 
 @router.get("/api-keys/validate/{key}", response_model=dict)
 async def validate_api_key(
     key: str,
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ):
     """
     Validate an API key and update its last_used timestamp.
     """
     try:
-        db_api_key = db.query(ApiKey).filter(ApiKey.key_value == key, ApiKey.is_active == True).first()
+        # Look up the key and update its last used timestamp in one UPDATE ... RETURNING
+        db_api_key = (await db.execute(
+            update(ApiKey)
+            .where(ApiKey.key_value == key, ApiKey.is_active == True)
+            .values(last_used=datetime.now())
+            .returning(ApiKey.id, ApiKey.key_type)
+        )).first()
         if not db_api_key:
             return {"valid": False, "message": "Invalid or inactive API key"}
             
-        # Update last used timestamp
-        db_api_key.last_used = datetime.now()
-        db.commit()
+        await db.commit()
         
         return {
             "valid": True,
@@ -1913,8 +2210,7 @@ async def validate_api_key(
             "message": "API key is valid"
         }
     except Exception as e:
-        logger.error(f"Error validating API key: {e}")
-        logger.error(traceback.format_exc())
+        logger.exception(f"Error validating API key: {e}")
         return {"valid": False, "message": f"Error validating API key: {str(e)}"}
 
 # --- Vector Database models and endpoints ---
@@ -1949,6 +2245,8 @@ class VectorDatabaseResponse(BaseModel):
     
     model_config = ConfigDict(from_attributes=True)
 
+vector_database_list_adapter = TypeAdapter(List[VectorDatabaseResponse])
+
 class VectorDatabaseDetailResponse(BaseModel):
     id: int
     name: str
@@ -1965,7 +2263,7 @@ class VectorDatabaseDetailResponse(BaseModel):
     model_config = ConfigDict(from_attributes=True)
 
 @router.get("/vector-databases", response_model=List[VectorDatabaseResponse])
-async def get_vector_databases(
+def get_vector_databases(
     skip: int = 0,
     limit: int = 100,
     status: Optional[str] = None,
@@ -1985,17 +2283,19 @@ async def get_vector_databases(
             query = query.filter(VectorDatabase.status == status)
         
         vector_dbs = query.offset(skip).limit(limit).all()
-        return [VectorDatabaseResponse.model_validate(db_item, from_attributes=True) for db_item in vector_dbs]
+        
+        # Rows come straight from the database, so skip validation; returning bytes skips FastAPI's re-serialization
+        payload = vector_database_list_adapter.dump_json([to_response(VectorDatabaseResponse, row) for row in vector_dbs])
+        return Response(content=payload, media_type="application/json")
     except SQLAlchemyError as e:
-        logger.error(f"Database error retrieving vector databases: {e}")
+        logger.exception(f"Database error retrieving vector databases: {e}")
         raise HTTPException(status_code=500, detail=f"Database error: {str(e)}")
     except Exception as e:
-        logger.error(f"Error retrieving vector databases: {e}")
-        logger.error(traceback.format_exc())
+        logger.exception(f"Error retrieving vector databases: {e}")
         raise HTTPException(status_code=500, detail=f"Error retrieving vector databases: {str(e)}")
 
 @router.post("/vector-databases", response_model=VectorDatabaseResponse)
-async def create_vector_database(
+def create_vector_database(
     vector_db: VectorDatabaseCreate,
     db: Session = Depends(get_db)
 ):
@@ -2004,12 +2304,11 @@ async def create_vector_database(
     """
     try:
         # Check if a database with the same name already exists
-        existing_db = db.query(VectorDatabase).filter(VectorDatabase.name == vector_db.name).first()
-        if existing_db:
+        if db.scalar(select(exists().where(VectorDatabase.name == vector_db.name))):
             raise HTTPException(status_code=400, detail=f"Vector database with name '{vector_db.name}' already exists")
         
         # Check if the API key exists
-        api_key = db.query(ApiKey).filter(ApiKey.id == vector_db.api_key_id).first()
+        api_key = db.get(ApiKey, vector_db.api_key_id)
         if not api_key:
             raise HTTPException(status_code=400, detail=f"API key with ID {vector_db.api_key_id} not found")
         
@@ -2048,7 +2347,7 @@ async def create_vector_database(
                 time.sleep(5)
                 
             except Exception as create_error:
-                logger.error(f"Failed to create Pinecone index '{vector_db.pinecone_index}': {create_error}")
+                logger.exception(f"Failed to create Pinecone index '{vector_db.pinecone_index}': {create_error}")
                 raise HTTPException(
                     status_code=400, 
                     detail=f"Failed to create Pinecone index '{vector_db.pinecone_index}': {str(create_error)}"
@@ -2070,15 +2369,12 @@ async def create_vector_database(
             
         except Exception as e:
             error_message = f"Error connecting to Pinecone index '{vector_db.pinecone_index}': {str(e)}"
-            logger.error(error_message)
+            logger.exception(error_message)
             raise HTTPException(status_code=400, detail=error_message)
         
         # Create new vector database
-        db_vector_db = VectorDatabase(**vector_db.model_dump())
-        
-        db.add(db_vector_db)
+        db_vector_db = db.scalar(insert(VectorDatabase).values(**vector_db.model_dump()).returning(VectorDatabase))
         db.commit()
-        db.refresh(db_vector_db)
         
         # Return response with additional info about index creation
         response_data = VectorDatabaseResponse.model_validate(db_vector_db, from_attributes=True).model_dump()
@@ -2094,16 +2390,15 @@ async def create_vector_database(
         raise
     except SQLAlchemyError as e:
         db.rollback()
-        logger.error(f"Database error creating vector database: {e}")
+        logger.exception(f"Database error creating vector database: {e}")
         raise HTTPException(status_code=500, detail=f"Database error: {str(e)}")
     except Exception as e:
         db.rollback()
-        logger.error(f"Error creating vector database: {e}")
-        logger.error(traceback.format_exc())
+        logger.exception(f"Error creating vector database: {e}")
         raise HTTPException(status_code=500, detail=f"Error creating vector database: {str(e)}")
 
 @router.get("/vector-databases/{vector_db_id}", response_model=VectorDatabaseResponse)
-async def get_vector_database(
+def get_vector_database(
     vector_db_id: int = Path(..., gt=0),
     db: Session = Depends(get_db)
 ):
@@ -2111,7 +2406,7 @@ async def get_vector_database(
     Get vector database by ID.
     """
     try:
-        vector_db = db.query(VectorDatabase).filter(VectorDatabase.id == vector_db_id).first()
+        vector_db = db.get(VectorDatabase, vector_db_id)
         if not vector_db:
             raise HTTPException(status_code=404, detail=f"Vector database with ID {vector_db_id} not found")
         
@@ -2119,12 +2414,11 @@ async def get_vector_database(
     except HTTPException:
         raise
     except Exception as e:
-        logger.error(f"Error retrieving vector database: {e}")
-        logger.error(traceback.format_exc())
+        logger.exception(f"Error retrieving vector database: {e}")
         raise HTTPException(status_code=500, detail=f"Error retrieving vector database: {str(e)}")
 
 @router.put("/vector-databases/{vector_db_id}", response_model=VectorDatabaseResponse)
-async def update_vector_database(
+def update_vector_database(
     vector_db_id: int = Path(..., gt=0),
     vector_db_update: VectorDatabaseUpdate = Body(...),
     db: Session = Depends(get_db)
@@ -2133,46 +2427,43 @@ async def update_vector_database(
     Update vector database details.
     """
     try:
-        db_vector_db = db.query(VectorDatabase).filter(VectorDatabase.id == vector_db_id).first()
-        if not db_vector_db:
-            raise HTTPException(status_code=404, detail=f"Vector database with ID {vector_db_id} not found")
-        
-        # Check name uniqueness if updating name
-        if vector_db_update.name and vector_db_update.name != db_vector_db.name:
-            existing_db = db.query(VectorDatabase).filter(VectorDatabase.name == vector_db_update.name).first()
-            if existing_db:
+        # Check name uniqueness against the other vector databases, without loading this one first
+        if vector_db_update.name:
+            if db.scalar(select(exists().where(VectorDatabase.name == vector_db_update.name, VectorDatabase.id != vector_db_id))):
                 raise HTTPException(status_code=400, detail=f"Vector database with name '{vector_db_update.name}' already exists")
         
         # Check if API key exists if updating API key ID
         if vector_db_update.api_key_id:
-            api_key = db.query(ApiKey).filter(ApiKey.id == vector_db_update.api_key_id).first()
-            if not api_key:
+            if not db.scalar(select(exists().where(ApiKey.id == vector_db_update.api_key_id))):
                 raise HTTPException(status_code=400, detail=f"API key with ID {vector_db_update.api_key_id} not found")
         
-        # Update fields if provided
-        update_data = vector_db_update.model_dump(exclude_unset=True)
-        for key, value in update_data.items():
-            if value is not None:
-                setattr(db_vector_db, key, value)
+        # Update fields if provided with one UPDATE ... RETURNING that also tells whether the row exists
+        update_data = {name: getattr(vector_db_update, name) for name in vector_db_update.model_fields_set}
+        if update_data:
+            db_vector_db = db.execute(
+                update(VectorDatabase).where(VectorDatabase.id == vector_db_id).values(**update_data).returning(VectorDatabase)
+            ).scalar_one_or_none()
+        else:
+            db_vector_db = db.get(VectorDatabase, vector_db_id)
+        if not db_vector_db:
+            raise HTTPException(status_code=404, detail=f"Vector database with ID {vector_db_id} not found")
         
         db.commit()
-        db.refresh(db_vector_db)
         
         return VectorDatabaseResponse.model_validate(db_vector_db, from_attributes=True)
     except HTTPException:
         raise
     except SQLAlchemyError as e:
         db.rollback()
-        logger.error(f"Database error updating vector database: {e}")
+        logger.exception(f"Database error updating vector database: {e}")
         raise HTTPException(status_code=500, detail=f"Database error: {str(e)}")
     except Exception as e:
         db.rollback()
-        logger.error(f"Error updating vector database: {e}")
-        logger.error(traceback.format_exc())
+        logger.exception(f"Error updating vector database: {e}")
         raise HTTPException(status_code=500, detail=f"Error updating vector database: {str(e)}")
 
 @router.delete("/vector-databases/{vector_db_id}", response_model=dict)
-async def delete_vector_database(
+def delete_vector_database(
     vector_db_id: int = Path(..., gt=0),
     force: bool = Query(False, description="Force deletion even if documents exist"),
     db: Session = Depends(get_db)
@@ -2183,20 +2474,22 @@ async def delete_vector_database(
     - **force**: If true, will delete all associated documents first
     """
     try:
-        db_vector_db = db.query(VectorDatabase).filter(VectorDatabase.id == vector_db_id).first()
+        db_vector_db = db.get(VectorDatabase, vector_db_id)
         if not db_vector_db:
             raise HTTPException(status_code=404, detail=f"Vector database with ID {vector_db_id} not found")
         
-        # Check if there are documents associated with this database
-        doc_count = db.query(func.count(Document.id)).filter(Document.vector_database_id == vector_db_id).scalar()
-        if doc_count > 0 and not force:
+        # Check if there are documents associated with this database; EXISTS stops at the
+        # first match, and the full count is only taken for the error message
+        has_documents = db.scalar(select(exists().where(Document.vector_database_id == vector_db_id)))
+        if has_documents and not force:
+            doc_count = db.scalar(select(func.count(Document.id)).where(Document.vector_database_id == vector_db_id))
             raise HTTPException(
                 status_code=400, 
                 detail=f"Cannot delete vector database with {doc_count} documents. Use force=true to delete anyway."
             )
         
         # If force=true, delete all associated documents first
-        if force and doc_count > 0:
+        if force and has_documents:
             # Delete all documents associated with this database
             db.query(Document).filter(Document.vector_database_id == vector_db_id).delete()
             
@@ -2215,16 +2508,15 @@ async def delete_vector_database(
         raise
     except SQLAlchemyError as e:
         db.rollback()
-        logger.error(f"Database error deleting vector database: {e}")
+        logger.exception(f"Database error deleting vector database: {e}")
         raise HTTPException(status_code=500, detail=f"Database error: {str(e)}")
     except Exception as e:
         db.rollback()
-        logger.error(f"Error deleting vector database: {e}")
-        logger.error(traceback.format_exc())
+        logger.exception(f"Error deleting vector database: {e}")
         raise HTTPException(status_code=500, detail=f"Error deleting vector database: {str(e)}")
 
 @router.get("/vector-databases/{vector_db_id}/info", response_model=VectorDatabaseDetailResponse)
-async def get_vector_database_info(
+def get_vector_database_info(
     vector_db_id: int = Path(..., gt=0),
     db: Session = Depends(get_db)
 ):
@@ -2234,33 +2526,25 @@ async def get_vector_database_info(
     """
     try:
         # Get the vector database
-        vector_db = db.query(VectorDatabase).filter(VectorDatabase.id == vector_db_id).first()
+        vector_db = db.get(VectorDatabase, vector_db_id)
         if not vector_db:
             raise HTTPException(status_code=404, detail="Vector database not found")
         
-        # Count total documents
-        total_docs = db.query(func.count(Document.id)).filter(
+        # Count total, embedded and pending documents in a single round-trip
+        total_docs, embedded_docs, pending_docs = db.query(
+            func.count(Document.id),
+            func.count(Document.id).filter(Document.is_embedded == True),
+            func.count(Document.id).filter(Document.is_embedded == False)
+        ).filter(
             Document.vector_database_id == vector_db_id
-        ).scalar()
-        
-        # Count embedded documents
-        embedded_docs = db.query(func.count(Document.id)).filter(
-            Document.vector_database_id == vector_db_id,
-            Document.is_embedded == True
-        ).scalar()
-        
-        # Count pending documents (not embedded)
-        pending_docs = db.query(func.count(Document.id)).filter(
-            Document.vector_database_id == vector_db_id,
-            Document.is_embedded == False
-        ).scalar()
+        ).one()
         
         # Verify Pinecone index connectivity if API key is available
         message = None
         if vector_db.api_key_id:
             try:
                 # Get the API key
-                api_key = db.query(ApiKey).filter(ApiKey.id == vector_db.api_key_id).first()
+                api_key = db.get(ApiKey, vector_db.api_key_id)
                 if api_key:
                     # Initialize Pinecone client with the API key
                     from pinecone import Pinecone
@@ -2284,7 +2568,7 @@ async def get_vector_database_info(
                     logger.warning(message)
             except Exception as e:
                 message = f"Error connecting to Pinecone: {str(e)}"
-                logger.error(message)
+                logger.exception(message)
         else:
             message = "No API key associated with this vector database"
             logger.warning(message)
@@ -2308,8 +2592,7 @@ async def get_vector_database_info(
     except HTTPException:
         raise
     except Exception as e:
-        logger.error(f"Error getting vector database info: {e}")
-        logger.error(traceback.format_exc())
+        logger.exception(f"Error getting vector database info: {e}")
         raise HTTPException(status_code=500, detail=f"Error getting vector database info: {str(e)}")
 
 # --- Document models and endpoints ---
@@ -2338,8 +2621,10 @@ class DocumentResponse(BaseModel):
     
     model_config = ConfigDict(from_attributes=True)
 
+document_list_adapter = TypeAdapter(List[DocumentResponse])
+
 @router.get("/documents", response_model=List[DocumentResponse])
-async def get_documents(
+def get_documents(
     skip: int = 0,
     limit: int = 100,
     vector_database_id: Optional[int] = None,
@@ -2357,7 +2642,10 @@ async def get_documents(
     - **file_type**: Filter by file type
     """
     try:
-        query = db.query(Document)
+        # Join the vector database name in the same query instead of one lookup per document
+        query = db.query(Document, VectorDatabase.name).outerjoin(
+            VectorDatabase, VectorDatabase.id == Document.vector_database_id
+        )
         
         # Apply filters if provided
         if vector_database_id is not None:
@@ -2374,7 +2662,7 @@ async def get_documents(
         
         # Add vector database name
         result = []
-        for doc in documents:
+        for doc, joined_db_name in documents:
             # Create a dictionary from the document for easier manipulation
             doc_dict = {
                 "id": doc.id,
@@ -2388,31 +2676,29 @@ async def get_documents(
                 "is_embedded": doc.is_embedded
             }
             
-            # Get vector database name if not already populated
+            # Use the joined vector database name
             vector_db_name = None
             if doc.vector_database_id is not None:
-                vector_db = db.query(VectorDatabase).filter(VectorDatabase.id == doc.vector_database_id).first()
-                vector_db_name = vector_db.name if vector_db else f"db_{doc.vector_database_id}"
+                vector_db_name = joined_db_name or f"db_{doc.vector_database_id}"
             else:
                 vector_db_name = "No Database"
                 
             doc_dict["vector_database_name"] = vector_db_name
                 
-            # Create Pydantic model from dictionary
-            doc_response = DocumentResponse(**doc_dict)
-            result.append(doc_response)
+            result.append(doc_dict)
         
-        return result
+        # Validate and encode the page in single pydantic-core calls; returning bytes skips FastAPI's re-serialization
+        payload = document_list_adapter.dump_json(document_list_adapter.validate_python(result))
+        return Response(content=payload, media_type="application/json")
     except SQLAlchemyError as e:
-        logger.error(f"Database error retrieving documents: {e}")
+        logger.exception(f"Database error retrieving documents: {e}")
         raise HTTPException(status_code=500, detail=f"Database error: {str(e)}")
     except Exception as e:
-        logger.error(f"Error retrieving documents: {e}")
-        logger.error(traceback.format_exc())
+        logger.exception(f"Error retrieving documents: {e}")
         raise HTTPException(status_code=500, detail=f"Error retrieving documents: {str(e)}")
 
 @router.get("/documents/{document_id}", response_model=DocumentResponse)
-async def get_document(
+def get_document(
     document_id: int = Path(..., gt=0),
     db: Session = Depends(get_db)
 ):
@@ -2420,12 +2706,12 @@ async def get_document(
     Get document by ID.
     """
     try:
-        document = db.query(Document).filter(Document.id == document_id).first()
+        document = db.get(Document, document_id)
         if not document:
             raise HTTPException(status_code=404, detail=f"Document with ID {document_id} not found")
         
         # Get vector database name
-        vector_db = db.query(VectorDatabase).filter(VectorDatabase.id == document.vector_database_id).first()
+        vector_db = db.get(VectorDatabase, document.vector_database_id)
         vector_db_name = vector_db.name if vector_db else f"db_{document.vector_database_id}"
         
         # Create response with vector database name
@@ -2436,12 +2722,11 @@ async def get_document(
     except HTTPException:
         raise
     except Exception as e:
-        logger.error(f"Error retrieving document: {e}")
-        logger.error(traceback.format_exc())
+        logger.exception(f"Error retrieving document: {e}")
         raise HTTPException(status_code=500, detail=f"Error retrieving document: {str(e)}")
 
 @router.get("/documents/{document_id}/content", response_class=Response)
-async def get_document_content(
+def get_document_content(
     document_id: int = Path(..., gt=0),
     db: Session = Depends(get_db)
 ):
@@ -2451,7 +2736,7 @@ async def get_document_content(
     """
     try:
         # Get document to check if it exists and get metadata
-        document = db.query(Document).filter(Document.id == document_id).first()
+        document = db.get(Document, document_id)
         if not document:
             raise HTTPException(status_code=404, detail=f"Document with ID {document_id} not found")
         
@@ -2472,8 +2757,7 @@ async def get_document_content(
     except HTTPException:
         raise
     except Exception as e:
-        logger.error(f"Error retrieving document content: {e}")
-        logger.error(traceback.format_exc())
+        logger.exception(f"Error retrieving document content: {e}")
         raise HTTPException(status_code=500, detail=f"Error retrieving document content: {str(e)}")
 
 # --- Telegram Bot models and endpoints ---
@@ -2500,7 +2784,7 @@ class TelegramBotResponse(TelegramBotBase):
     model_config = ConfigDict(from_attributes=True)
 
 @router.get("/telegram-bots/{bot_id}", response_model=TelegramBotResponse)
-async def get_telegram_bot(
+def get_telegram_bot(
     bot_id: int = Path(..., gt=0),
     db: Session = Depends(get_db)
 ):
@@ -2508,7 +2792,7 @@ async def get_telegram_bot(
     Get Telegram bot by ID.
     """
     try:
-        bot = db.query(TelegramBot).filter(TelegramBot.id == bot_id).first()
+        bot = db.get(TelegramBot, bot_id)
         if not bot:
             raise HTTPException(status_code=404, detail=f"Telegram bot with ID {bot_id} not found")
         
@@ -2516,12 +2800,11 @@ async def get_telegram_bot(
     except HTTPException:
         raise
     except Exception as e:
-        logger.error(f"Error retrieving Telegram bot: {e}")
-        logger.error(traceback.format_exc())
+        logger.exception(f"Error retrieving Telegram bot: {e}")
         raise HTTPException(status_code=500, detail=f"Error retrieving Telegram bot: {str(e)}")
 
 @router.put("/telegram-bots/{bot_id}", response_model=TelegramBotResponse)
-async def update_telegram_bot(
+def update_telegram_bot(
     bot_id: int = Path(..., gt=0),
     bot_update: TelegramBotUpdate = Body(...),
     db: Session = Depends(get_db)
@@ -2530,43 +2813,41 @@ async def update_telegram_bot(
     Update Telegram bot details.
     """
     try:
-        db_bot = db.query(TelegramBot).filter(TelegramBot.id == bot_id).first()
-        if not db_bot:
-            raise HTTPException(status_code=404, detail=f"Telegram bot with ID {bot_id} not found")
-        
-        # Check if new username conflicts with existing bots
-        if bot_update.username and bot_update.username != db_bot.username:
-            existing_bot = db.query(TelegramBot).filter(TelegramBot.username == bot_update.username).first()
-            if existing_bot:
+        # Check if new username conflicts with other bots, without loading this one first
+        if bot_update.username:
+            if db.scalar(select(exists().where(TelegramBot.username == bot_update.username, TelegramBot.id != bot_id))):
                 raise HTTPException(
                     status_code=400, 
                     detail=f"Telegram bot with username '{bot_update.username}' already exists"
                 )
         
-        # Update fields if provided
-        update_data = bot_update.model_dump(exclude_unset=True)
-        for key, value in update_data.items():
-            if value is not None:
-                setattr(db_bot, key, value)
+        # Update fields if provided with one UPDATE ... RETURNING that also tells whether the row exists
+        update_data = {name: getattr(bot_update, name) for name in bot_update.model_fields_set}
+        if update_data:
+            db_bot = db.execute(
+                update(TelegramBot).where(TelegramBot.id == bot_id).values(**update_data).returning(TelegramBot)
+            ).scalar_one_or_none()
+        else:
+            db_bot = db.get(TelegramBot, bot_id)
+        if not db_bot:
+            raise HTTPException(status_code=404, detail=f"Telegram bot with ID {bot_id} not found")
         
         db.commit()
-        db.refresh(db_bot)
         
         return TelegramBotResponse.model_validate(db_bot, from_attributes=True)
     except HTTPException:
         raise
     except SQLAlchemyError as e:
         db.rollback()
-        logger.error(f"Database error updating Telegram bot: {e}")
+        logger.exception(f"Database error updating Telegram bot: {e}")
         raise HTTPException(status_code=500, detail=f"Database error: {str(e)}")
     except Exception as e:
         db.rollback()
-        logger.error(f"Error updating Telegram bot: {e}")
-        logger.error(traceback.format_exc())
+        logger.exception(f"Error updating Telegram bot: {e}")
         raise HTTPException(status_code=500, detail=f"Error updating Telegram bot: {str(e)}")
 
 @router.delete("/telegram-bots/{bot_id}", response_model=dict)
-async def delete_telegram_bot(
+def delete_telegram_bot(
     bot_id: int = Path(..., gt=0),
     db: Session = Depends(get_db)
 ):
@@ -2574,13 +2855,12 @@ async def delete_telegram_bot(
     Delete Telegram bot.
     """
     try:
-        db_bot = db.query(TelegramBot).filter(TelegramBot.id == bot_id).first()
+        db_bot = db.get(TelegramBot, bot_id)
         if not db_bot:
             raise HTTPException(status_code=404, detail=f"Telegram bot with ID {bot_id} not found")
         
-        # Check if bot is associated with any engines
-        bot_engines = db.query(BotEngine).filter(BotEngine.bot_id == bot_id).all()
-        if bot_engines:
+        # Check if bot is associated with any engines without loading the associations
+        if db.scalar(select(exists().where(BotEngine.bot_id == bot_id))):
             raise HTTPException(
                 status_code=400,
                 detail="Cannot delete bot as it is associated with chat engines. Remove associations first."
@@ -2595,16 +2875,15 @@ async def delete_telegram_bot(
         raise
     except SQLAlchemyError as e:
         db.rollback()
-        logger.error(f"Database error deleting Telegram bot: {e}")
+        logger.exception(f"Database error deleting Telegram bot: {e}")
         raise HTTPException(status_code=500, detail=f"Database error: {str(e)}")
     except Exception as e:
         db.rollback()
-        logger.error(f"Error deleting Telegram bot: {e}")
-        logger.error(traceback.format_exc())
+        logger.exception(f"Error deleting Telegram bot: {e}")
         raise HTTPException(status_code=500, detail=f"Error deleting Telegram bot: {str(e)}")
 
 @router.get("/telegram-bots/{bot_id}/engines", response_model=List[dict])
-async def get_bot_engines_info(
+def get_bot_engines_info(
     bot_id: int = Path(..., gt=0),
     db: Session = Depends(get_db)
 ):
@@ -2612,33 +2891,30 @@ async def get_bot_engines_info(
     Get all chat engines associated with a Telegram bot.
     """
     try:
-        # Verify bot exists
-        bot = db.query(TelegramBot).filter(TelegramBot.id == bot_id).first()
-        if not bot:
+        # Verify bot exists without loading the row
+        if not db.scalar(select(exists().where(TelegramBot.id == bot_id))):
             raise HTTPException(status_code=404, detail=f"Telegram bot with ID {bot_id} not found")
         
-        # Get associated engines through BotEngine
-        bot_engines = db.query(BotEngine).filter(BotEngine.bot_id == bot_id).all()
-        
-        result = []
-        for association in bot_engines:
-            engine = db.query(ChatEngine).filter(ChatEngine.id == association.engine_id).first()
-            if engine:
-                result.append({
-                    "association_id": association.id,
-                    "engine_id": engine.id,
-                    "engine_name": engine.name,
-                    "answer_model": engine.answer_model,
-                    "status": engine.status,
-                    "created_at": association.created_at
-                })
+        # Get associated engines through BotEngine in a single joined query,
+        # reading only the returned columns instead of whole engine rows (system_prompt etc.)
+        bot_engines = db.execute(
+            select(
+                BotEngine.id.label("association_id"),
+                ChatEngine.id.label("engine_id"),
+                ChatEngine.name.label("engine_name"),
+                ChatEngine.answer_model,
+                ChatEngine.status,
+                BotEngine.created_at
+            )
+            .join(ChatEngine, ChatEngine.id == BotEngine.engine_id)
+            .where(BotEngine.bot_id == bot_id)
+        ).mappings().all()
         
-        return result
+        return [dict(row) for row in bot_engines]
     except HTTPException:
         raise
     except Exception as e:
-        logger.error(f"Error retrieving bot engines: {e}")
-        logger.error(traceback.format_exc())
+        logger.exception(f"Error retrieving bot engines: {e}")
         raise HTTPException(status_code=500, detail=f"Error retrieving bot engines: {str(e)}") 
 
 # --- Chat Engine models and endpoints ---
@@ -2674,8 +2950,10 @@ class ChatEngineResponse(ChatEngineBase):
     
     model_config = ConfigDict(from_attributes=True)
 
+chat_engine_list_adapter = TypeAdapter(List[ChatEngineResponse])
+
 @router.get("/chat-engines", response_model=List[ChatEngineResponse])
-async def get_chat_engines(
+def get_chat_engines(
     skip: int = 0,
     limit: int = 100,
     status: Optional[str] = None,
@@ -2695,17 +2973,19 @@ async def get_chat_engines(
             query = query.filter(ChatEngine.status == status)
         
         engines = query.offset(skip).limit(limit).all()
-        return [ChatEngineResponse.model_validate(engine, from_attributes=True) for engine in engines]
+        
+        # Rows come straight from the database, so skip validation; returning bytes skips FastAPI's re-serialization
+        payload = chat_engine_list_adapter.dump_json([to_response(ChatEngineResponse, row) for row in engines])
+        return Response(content=payload, media_type="application/json")
     except SQLAlchemyError as e:
-        logger.error(f"Database error retrieving chat engines: {e}")
+        logger.exception(f"Database error retrieving chat engines: {e}")
         raise HTTPException(status_code=500, detail=f"Database error: {str(e)}")
     except Exception as e:
-        logger.error(f"Error retrieving chat engines: {e}")
-        logger.error(traceback.format_exc())
+        logger.exception(f"Error retrieving chat engines: {e}")
         raise HTTPException(status_code=500, detail=f"Error retrieving chat engines: {str(e)}")
 
 @router.post("/chat-engines", response_model=ChatEngineResponse)
-async def create_chat_engine(
+def create_chat_engine(
     engine: ChatEngineCreate,
     db: Session = Depends(get_db)
 ):
@@ -2714,25 +2994,21 @@ async def create_chat_engine(
     """
     try:
         # Create chat engine
-        db_engine = ChatEngine(**engine.model_dump())
-        
-        db.add(db_engine)
+        db_engine = db.scalar(insert(ChatEngine).values(**engine.model_dump()).returning(ChatEngine))
         db.commit()
-        db.refresh(db_engine)
         
         return ChatEngineResponse.model_validate(db_engine, from_attributes=True)
     except SQLAlchemyError as e:
         db.rollback()
-        logger.error(f"Database error creating chat engine: {e}")
+        logger.exception(f"Database error creating chat engine: {e}")
         raise HTTPException(status_code=500, detail=f"Database error: {str(e)}")
     except Exception as e:
         db.rollback()
-        logger.error(f"Error creating chat engine: {e}")
-        logger.error(traceback.format_exc())
+        logger.exception(f"Error creating chat engine: {e}")
         raise HTTPException(status_code=500, detail=f"Error creating chat engine: {str(e)}")
 
 @router.get("/chat-engines/{engine_id}", response_model=ChatEngineResponse)
-async def get_chat_engine(
+def get_chat_engine(
     engine_id: int = Path(..., gt=0),
     db: Session = Depends(get_db)
 ):
@@ -2740,7 +3016,7 @@ async def get_chat_engine(
     Get chat engine by ID.
     """
     try:
-        engine = db.query(ChatEngine).filter(ChatEngine.id == engine_id).first()
+        engine = db.get(ChatEngine, engine_id)
         if not engine:
             raise HTTPException(status_code=404, detail=f"Chat engine with ID {engine_id} not found")
         
@@ -2748,12 +3024,11 @@ async def get_chat_engine(
     except HTTPException:
         raise
     except Exception as e:
-        logger.error(f"Error retrieving chat engine: {e}")
-        logger.error(traceback.format_exc())
+        logger.exception(f"Error retrieving chat engine: {e}")
         raise HTTPException(status_code=500, detail=f"Error retrieving chat engine: {str(e)}")
 
 @router.put("/chat-engines/{engine_id}", response_model=ChatEngineResponse)
-async def update_chat_engine(
+def update_chat_engine(
     engine_id: int = Path(..., gt=0),
     engine_update: ChatEngineUpdate = Body(...),
     db: Session = Depends(get_db)
@@ -2762,37 +3037,33 @@ async def update_chat_engine(
     Update chat engine details.
     """
     try:
-        db_engine = db.query(ChatEngine).filter(ChatEngine.id == engine_id).first()
+        # Update provided fields and the last_modified timestamp in a single UPDATE ... RETURNING
+        update_data = {name: getattr(engine_update, name) for name in engine_update.model_fields_set}
+        db_engine = db.execute(
+            update(ChatEngine)
+            .where(ChatEngine.id == engine_id)
+            .values(**update_data, last_modified=datetime.utcnow())
+            .returning(ChatEngine)
+        ).scalar_one_or_none()
         if not db_engine:
             raise HTTPException(status_code=404, detail=f"Chat engine with ID {engine_id} not found")
         
-        # Update fields if provided
-        update_data = engine_update.model_dump(exclude_unset=True)
-        for key, value in update_data.items():
-            if value is not None:
-                setattr(db_engine, key, value)
-        
-        # Update last_modified timestamp
-        db_engine.last_modified = datetime.utcnow()
-        
         db.commit()
-        db.refresh(db_engine)
         
         return ChatEngineResponse.model_validate(db_engine, from_attributes=True)
     except HTTPException:
         raise
     except SQLAlchemyError as e:
         db.rollback()
-        logger.error(f"Database error updating chat engine: {e}")
+        logger.exception(f"Database error updating chat engine: {e}")
         raise HTTPException(status_code=500, detail=f"Database error: {str(e)}")
     except Exception as e:
         db.rollback()
-        logger.error(f"Error updating chat engine: {e}")
-        logger.error(traceback.format_exc())
+        logger.exception(f"Error updating chat engine: {e}")
         raise HTTPException(status_code=500, detail=f"Error updating chat engine: {str(e)}")
 
 @router.delete("/chat-engines/{engine_id}", response_model=dict)
-async def delete_chat_engine(
+def delete_chat_engine(
     engine_id: int = Path(..., gt=0),
     db: Session = Depends(get_db)
 ):
@@ -2800,15 +3071,17 @@ async def delete_chat_engine(
     Delete chat engine.
     """
     try:
-        db_engine = db.query(ChatEngine).filter(ChatEngine.id == engine_id).first()
+        db_engine = db.get(ChatEngine, engine_id)
         if not db_engine:
             raise HTTPException(status_code=404, detail=f"Chat engine with ID {engine_id} not found")
         
-        # Check if engine has associated bots or vector databases
-        bot_engine_count = db.query(func.count(BotEngine.id)).filter(BotEngine.engine_id == engine_id).scalar()
-        vector_db_count = db.query(func.count(EngineVectorDb.id)).filter(EngineVectorDb.engine_id == engine_id).scalar()
+        # Check if engine has associated bots or vector databases; EXISTS stops at the first match instead of counting
+        has_associations = db.scalar(select(or_(
+            exists().where(BotEngine.engine_id == engine_id),
+            exists().where(EngineVectorDb.engine_id == engine_id)
+        )))
         
-        if bot_engine_count > 0 or vector_db_count > 0:
+        if has_associations:
             raise HTTPException(
                 status_code=400,
                 detail="Cannot delete chat engine as it has associated bots or vector databases. Remove associations first."
@@ -2823,16 +3096,15 @@ async def delete_chat_engine(
         raise
     except SQLAlchemyError as e:
         db.rollback()
-        logger.error(f"Database error deleting chat engine: {e}")
+        logger.exception(f"Database error deleting chat engine: {e}")
         raise HTTPException(status_code=500, detail=f"Database error: {str(e)}")
     except Exception as e:
         db.rollback()
-        logger.error(f"Error deleting chat engine: {e}")
-        logger.error(traceback.format_exc())
+        logger.exception(f"Error deleting chat engine: {e}")
         raise HTTPException(status_code=500, detail=f"Error deleting chat engine: {str(e)}")
 
 @router.get("/chat-engines/{engine_id}/vector-databases", response_model=List[dict])
-async def get_engine_vector_databases(
+def get_engine_vector_databases(
     engine_id: int = Path(..., gt=0),
     db: Session = Depends(get_db)
 ):
@@ -2840,33 +3112,30 @@ async def get_engine_vector_databases(
     Get all vector databases associated with a chat engine.
     """
     try:
-        # Verify engine exists
-        engine = db.query(ChatEngine).filter(ChatEngine.id == engine_id).first()
-        if not engine:
+        # Verify engine exists without loading the row
+        if not db.scalar(select(exists().where(ChatEngine.id == engine_id))):
             raise HTTPException(status_code=404, detail=f"Chat engine with ID {engine_id} not found")
         
-        # Get associated vector databases through EngineVectorDb
-        engine_vector_dbs = db.query(EngineVectorDb).filter(EngineVectorDb.engine_id == engine_id).all()
-        
-        result = []
-        for association in engine_vector_dbs:
-            vector_db = db.query(VectorDatabase).filter(VectorDatabase.id == association.vector_database_id).first()
-            if vector_db:
-                result.append({
-                    "association_id": association.id,
-                    "vector_database_id": vector_db.id,
-                    "name": vector_db.name,
-                    "pinecone_index": vector_db.pinecone_index,
-                    "priority": association.priority,
-                    "status": vector_db.status
-                })
+        # Get associated vector databases through EngineVectorDb in a single joined query,
+        # reading only the returned columns
+        engine_vector_dbs = db.execute(
+            select(
+                EngineVectorDb.id.label("association_id"),
+                VectorDatabase.id.label("vector_database_id"),
+                VectorDatabase.name,
+                VectorDatabase.pinecone_index,
+                EngineVectorDb.priority,
+                VectorDatabase.status
+            )
+            .join(VectorDatabase, VectorDatabase.id == EngineVectorDb.vector_database_id)
+            .where(EngineVectorDb.engine_id == engine_id)
+        ).mappings().all()
         
-        return result
+        return [dict(row) for row in engine_vector_dbs]
     except HTTPException:
         raise
     except Exception as e:
-        logger.error(f"Error retrieving engine vector databases: {e}")
-        logger.error(traceback.format_exc())
+        logger.exception(f"Error retrieving engine vector databases: {e}")
         raise HTTPException(status_code=500, detail=f"Error retrieving engine vector databases: {str(e)}")
 
 # --- Bot Engine Association models and endpoints ---
@@ -2880,8 +3149,10 @@ class BotEngineResponse(BotEngineCreate):
     
     model_config = ConfigDict(from_attributes=True)
 
+bot_engine_list_adapter = TypeAdapter(List[BotEngineResponse])
+
 @router.get("/bot-engines", response_model=List[BotEngineResponse])
-async def get_bot_engines(
+def get_bot_engines(
     skip: int = 0,
     limit: int = 100,
     bot_id: Optional[int] = None,
@@ -2906,17 +3177,19 @@ async def get_bot_engines(
             query = query.filter(BotEngine.engine_id == engine_id)
         
         bot_engines = query.offset(skip).limit(limit).all()
-        return [BotEngineResponse.model_validate(association, from_attributes=True) for association in bot_engines]
+        
+        # Rows come straight from the database, so skip validation; returning bytes skips FastAPI's re-serialization
+        payload = bot_engine_list_adapter.dump_json([to_response(BotEngineResponse, row) for row in bot_engines])
+        return Response(content=payload, media_type="application/json")
     except SQLAlchemyError as e:
-        logger.error(f"Database error retrieving bot-engine associations: {e}")
+        logger.exception(f"Database error retrieving bot-engine associations: {e}")
         raise HTTPException(status_code=500, detail=f"Database error: {str(e)}")
     except Exception as e:
-        logger.error(f"Error retrieving bot-engine associations: {e}")
-        logger.error(traceback.format_exc())
+        logger.exception(f"Error retrieving bot-engine associations: {e}")
         raise HTTPException(status_code=500, detail=f"Error retrieving bot-engine associations: {str(e)}")
 
 @router.post("/bot-engines", response_model=BotEngineResponse)
-async def create_bot_engine(
+def create_bot_engine(
     bot_engine: BotEngineCreate,
     db: Session = Depends(get_db)
 ):
@@ -2924,50 +3197,46 @@ async def create_bot_engine(
     Create a new bot-engine association.
     """
     try:
-        # Check if bot exists
-        bot = db.query(TelegramBot).filter(TelegramBot.id == bot_engine.bot_id).first()
-        if not bot:
+        # Check the bot, the engine and an existing association in one round-trip
+        bot_exists, engine_exists, association_exists = db.execute(select(
+            exists().where(TelegramBot.id == bot_engine.bot_id),
+            exists().where(ChatEngine.id == bot_engine.engine_id),
+            exists().where(
+                BotEngine.bot_id == bot_engine.bot_id,
+                BotEngine.engine_id == bot_engine.engine_id
+            )
+        )).one()
+        
+        if not bot_exists:
             raise HTTPException(status_code=404, detail=f"Telegram bot with ID {bot_engine.bot_id} not found")
         
-        # Check if engine exists
-        engine = db.query(ChatEngine).filter(ChatEngine.id == bot_engine.engine_id).first()
-        if not engine:
+        if not engine_exists:
             raise HTTPException(status_code=404, detail=f"Chat engine with ID {bot_engine.engine_id} not found")
         
-        # Check if association already exists
-        existing_association = db.query(BotEngine).filter(
-            BotEngine.bot_id == bot_engine.bot_id,
-            BotEngine.engine_id == bot_engine.engine_id
-        ).first()
-        
-        if existing_association:
+        if association_exists:
             raise HTTPException(
                 status_code=400,
                 detail=f"Association between bot ID {bot_engine.bot_id} and engine ID {bot_engine.engine_id} already exists"
             )
         
         # Create association
-        db_bot_engine = BotEngine(**bot_engine.model_dump())
-        
-        db.add(db_bot_engine)
+        db_bot_engine = db.scalar(insert(BotEngine).values(**bot_engine.model_dump()).returning(BotEngine))
         db.commit()
-        db.refresh(db_bot_engine)
         
         return BotEngineResponse.model_validate(db_bot_engine, from_attributes=True)
     except HTTPException:
         raise
     except SQLAlchemyError as e:
         db.rollback()
-        logger.error(f"Database error creating bot-engine association: {e}")
+        logger.exception(f"Database error creating bot-engine association: {e}")
         raise HTTPException(status_code=500, detail=f"Database error: {str(e)}")
     except Exception as e:
         db.rollback()
-        logger.error(f"Error creating bot-engine association: {e}")
-        logger.error(traceback.format_exc())
+        logger.exception(f"Error creating bot-engine association: {e}")
         raise HTTPException(status_code=500, detail=f"Error creating bot-engine association: {str(e)}")
 
 @router.get("/bot-engines/{association_id}", response_model=BotEngineResponse)
-async def get_bot_engine(
+def get_bot_engine(
     association_id: int = Path(..., gt=0),
     db: Session = Depends(get_db)
 ):
@@ -2975,7 +3244,7 @@ async def get_bot_engine(
     Get bot-engine association by ID.
     """
     try:
-        association = db.query(BotEngine).filter(BotEngine.id == association_id).first()
+        association = db.get(BotEngine, association_id)
         if not association:
             raise HTTPException(status_code=404, detail=f"Bot-engine association with ID {association_id} not found")
         
@@ -2983,12 +3252,11 @@ async def get_bot_engine(
     except HTTPException:
         raise
     except Exception as e:
-        logger.error(f"Error retrieving bot-engine association: {e}")
-        logger.error(traceback.format_exc())
+        logger.exception(f"Error retrieving bot-engine association: {e}")
         raise HTTPException(status_code=500, detail=f"Error retrieving bot-engine association: {str(e)}")
 
 @router.delete("/bot-engines/{association_id}", response_model=dict)
-async def delete_bot_engine(
+def delete_bot_engine(
     association_id: int = Path(..., gt=0),
     db: Session = Depends(get_db)
 ):
@@ -2996,7 +3264,7 @@ async def delete_bot_engine(
     Delete bot-engine association.
     """
     try:
-        association = db.query(BotEngine).filter(BotEngine.id == association_id).first()
+        association = db.get(BotEngine, association_id)
         if not association:
             raise HTTPException(status_code=404, detail=f"Bot-engine association with ID {association_id} not found")
         
@@ -3008,12 +3276,11 @@ async def delete_bot_engine(
         raise
     except SQLAlchemyError as e:
         db.rollback()
-        logger.error(f"Database error deleting bot-engine association: {e}")
+        logger.exception(f"Database error deleting bot-engine association: {e}")
         raise HTTPException(status_code=500, detail=f"Database error: {str(e)}")
     except Exception as e:
         db.rollback()
-        logger.error(f"Error deleting bot-engine association: {e}")
-        logger.error(traceback.format_exc())
+        logger.exception(f"Error deleting bot-engine association: {e}")
         raise HTTPException(status_code=500, detail=f"Error deleting bot-engine association: {str(e)}")
 
 # --- Engine-Vector DB Association models and endpoints ---
@@ -3027,8 +3294,10 @@ class EngineVectorDbResponse(EngineVectorDbCreate):
     
     model_config = ConfigDict(from_attributes=True)
 
+engine_vector_db_list_adapter = TypeAdapter(List[EngineVectorDbResponse])
+
 @router.get("/engine-vector-dbs", response_model=List[EngineVectorDbResponse])
-async def get_engine_vector_dbs(
+def get_engine_vector_dbs(
     skip: int = 0,
     limit: int = 100,
     engine_id: Optional[int] = None,
@@ -3053,17 +3322,19 @@ async def get_engine_vector_dbs(
             query = query.filter(EngineVectorDb.vector_database_id == vector_database_id)
         
         associations = query.offset(skip).limit(limit).all()
-        return [EngineVectorDbResponse.model_validate(association, from_attributes=True) for association in associations]
+        
+        # Rows come straight from the database, so skip validation; returning bytes skips FastAPI's re-serialization
+        payload = engine_vector_db_list_adapter.dump_json([to_response(EngineVectorDbResponse, row) for row in associations])
+        return Response(content=payload, media_type="application/json")
     except SQLAlchemyError as e:
-        logger.error(f"Database error retrieving engine-vector-db associations: {e}")
+        logger.exception(f"Database error retrieving engine-vector-db associations: {e}")
         raise HTTPException(status_code=500, detail=f"Database error: {str(e)}")
     except Exception as e:
-        logger.error(f"Error retrieving engine-vector-db associations: {e}")
-        logger.error(traceback.format_exc())
+        logger.exception(f"Error retrieving engine-vector-db associations: {e}")
         raise HTTPException(status_code=500, detail=f"Error retrieving engine-vector-db associations: {str(e)}")
 
 @router.post("/engine-vector-dbs", response_model=EngineVectorDbResponse)
-async def create_engine_vector_db(
+def create_engine_vector_db(
     engine_vector_db: EngineVectorDbCreate,
     db: Session = Depends(get_db)
 ):
@@ -3071,50 +3342,46 @@ async def create_engine_vector_db(
     Create a new engine-vector-db association.
     """
     try:
-        # Check if engine exists
-        engine = db.query(ChatEngine).filter(ChatEngine.id == engine_vector_db.engine_id).first()
-        if not engine:
+        # Check the engine, the vector database and an existing association in one round-trip
+        engine_exists, vector_db_exists, association_exists = db.execute(select(
+            exists().where(ChatEngine.id == engine_vector_db.engine_id),
+            exists().where(VectorDatabase.id == engine_vector_db.vector_database_id),
+            exists().where(
+                EngineVectorDb.engine_id == engine_vector_db.engine_id,
+                EngineVectorDb.vector_database_id == engine_vector_db.vector_database_id
+            )
+        )).one()
+        
+        if not engine_exists:
             raise HTTPException(status_code=404, detail=f"Chat engine with ID {engine_vector_db.engine_id} not found")
         
-        # Check if vector database exists
-        vector_db = db.query(VectorDatabase).filter(VectorDatabase.id == engine_vector_db.vector_database_id).first()
-        if not vector_db:
+        if not vector_db_exists:
             raise HTTPException(status_code=404, detail=f"Vector database with ID {engine_vector_db.vector_database_id} not found")
         
-        # Check if association already exists
-        existing_association = db.query(EngineVectorDb).filter(
-            EngineVectorDb.engine_id == engine_vector_db.engine_id,
-            EngineVectorDb.vector_database_id == engine_vector_db.vector_database_id
-        ).first()
-        
-        if existing_association:
+        if association_exists:
             raise HTTPException(
                 status_code=400,
                 detail=f"Association between engine ID {engine_vector_db.engine_id} and vector database ID {engine_vector_db.vector_database_id} already exists"
             )
         
         # Create association
-        db_engine_vector_db = EngineVectorDb(**engine_vector_db.model_dump())
-        
-        db.add(db_engine_vector_db)
+        db_engine_vector_db = db.scalar(insert(EngineVectorDb).values(**engine_vector_db.model_dump()).returning(EngineVectorDb))
         db.commit()
-        db.refresh(db_engine_vector_db)
         
         return EngineVectorDbResponse.model_validate(db_engine_vector_db, from_attributes=True)
     except HTTPException:
         raise
     except SQLAlchemyError as e:
         db.rollback()
-        logger.error(f"Database error creating engine-vector-db association: {e}")
+        logger.exception(f"Database error creating engine-vector-db association: {e}")
         raise HTTPException(status_code=500, detail=f"Database error: {str(e)}")
     except Exception as e:
         db.rollback()
-        logger.error(f"Error creating engine-vector-db association: {e}")
-        logger.error(traceback.format_exc())
+        logger.exception(f"Error creating engine-vector-db association: {e}")
         raise HTTPException(status_code=500, detail=f"Error creating engine-vector-db association: {str(e)}")
 
 @router.get("/engine-vector-dbs/{association_id}", response_model=EngineVectorDbResponse)
-async def get_engine_vector_db(
+def get_engine_vector_db(
     association_id: int = Path(..., gt=0),
     db: Session = Depends(get_db)
 ):
@@ -3122,7 +3389,7 @@ async def get_engine_vector_db(
     Get engine-vector-db association by ID.
     """
     try:
-        association = db.query(EngineVectorDb).filter(EngineVectorDb.id == association_id).first()
+        association = db.get(EngineVectorDb, association_id)
         if not association:
             raise HTTPException(status_code=404, detail=f"Engine-vector-db association with ID {association_id} not found")
         
@@ -3130,12 +3397,11 @@ async def get_engine_vector_db(
     except HTTPException:
         raise
     except Exception as e:
-        logger.error(f"Error retrieving engine-vector-db association: {e}")
-        logger.error(traceback.format_exc())
+        logger.exception(f"Error retrieving engine-vector-db association: {e}")
         raise HTTPException(status_code=500, detail=f"Error retrieving engine-vector-db association: {str(e)}")
 
 @router.put("/engine-vector-dbs/{association_id}", response_model=EngineVectorDbResponse)
-async def update_engine_vector_db(
+def update_engine_vector_db(
     association_id: int = Path(..., gt=0),
     update_data: dict = Body(...),
     db: Session = Depends(get_db)
@@ -3144,32 +3410,35 @@ async def update_engine_vector_db(
     Update engine-vector-db association details (only priority can be updated).
     """
     try:
-        association = db.query(EngineVectorDb).filter(EngineVectorDb.id == association_id).first()
-        if not association:
-            raise HTTPException(status_code=404, detail=f"Engine-vector-db association with ID {association_id} not found")
-        
         # Only priority can be updated
         if "priority" in update_data:
-            association.priority = update_data["priority"]
+            association = db.execute(
+                update(EngineVectorDb)
+                .where(EngineVectorDb.id == association_id)
+                .values(priority=update_data["priority"])
+                .returning(EngineVectorDb)
+            ).scalar_one_or_none()
+        else:
+            association = db.get(EngineVectorDb, association_id)
+        if not association:
+            raise HTTPException(status_code=404, detail=f"Engine-vector-db association with ID {association_id} not found")
         
         db.commit()
-        db.refresh(association)
         
         return EngineVectorDbResponse.model_validate(association, from_attributes=True)
     except HTTPException:
         raise
     except SQLAlchemyError as e:
         db.rollback()
-        logger.error(f"Database error updating engine-vector-db association: {e}")
+        logger.exception(f"Database error updating engine-vector-db association: {e}")
         raise HTTPException(status_code=500, detail=f"Database error: {str(e)}")
     except Exception as e:
         db.rollback()
-        logger.error(f"Error updating engine-vector-db association: {e}")
-        logger.error(traceback.format_exc())
+        logger.exception(f"Error updating engine-vector-db association: {e}")
         raise HTTPException(status_code=500, detail=f"Error updating engine-vector-db association: {str(e)}")
 
 @router.delete("/engine-vector-dbs/{association_id}", response_model=dict)
-async def delete_engine_vector_db(
+def delete_engine_vector_db(
     association_id: int = Path(..., gt=0),
     db: Session = Depends(get_db)
 ):
@@ -3177,7 +3446,7 @@ async def delete_engine_vector_db(
     Delete engine-vector-db association.
     """
     try:
-        association = db.query(EngineVectorDb).filter(EngineVectorDb.id == association_id).first()
+        association = db.get(EngineVectorDb, association_id)
         if not association:
             raise HTTPException(status_code=404, detail=f"Engine-vector-db association with ID {association_id} not found")
         
@@ -3189,12 +3458,11 @@ async def delete_engine_vector_db(
         raise
     except SQLAlchemyError as e:
         db.rollback()
-        logger.error(f"Database error deleting engine-vector-db association: {e}")
+        logger.exception(f"Database error deleting engine-vector-db association: {e}")
         raise HTTPException(status_code=500, detail=f"Database error: {str(e)}")
     except Exception as e:
         db.rollback()
-        logger.error(f"Error deleting engine-vector-db association: {e}")
-        logger.error(traceback.format_exc())
+        logger.exception(f"Error deleting engine-vector-db association: {e}")
         raise HTTPException(status_code=500, detail=f"Error deleting engine-vector-db association: {str(e)}")
 
 # --- VectorStatus models and endpoints ---
@@ -3214,8 +3482,10 @@ class VectorStatusResponse(VectorStatusBase):
     
     model_config = ConfigDict(from_attributes=True)
 
+vector_status_list_adapter = TypeAdapter(List[VectorStatusResponse])
+
 @router.get("/vector-statuses", response_model=List[VectorStatusResponse])
-async def get_vector_statuses(
+def get_vector_statuses(
     skip: int = 0,
     limit: int = 100,
     status: Optional[str] = None,
@@ -3248,273 +3518,22 @@ async def get_vector_statuses(
         # Execute query with pagination
         vector_statuses = query.offset(skip).limit(limit).all()
         
-        # Convert to Pydantic models
-        return [VectorStatusResponse.model_validate(status, from_attributes=True) for status in vector_statuses]
+        # Rows come straight from the database, so skip validation; returning bytes skips FastAPI's re-serialization
+        payload = vector_status_list_adapter.dump_json([to_response(VectorStatusResponse, row) for row in vector_statuses])
+        return Response(content=payload, media_type="application/json")
     except SQLAlchemyError as e:
-        logger.error(f"Database error in get_vector_statuses: {e}")
-        logger.error(traceback.format_exc())
+        logger.exception(f"Database error in get_vector_statuses: {e}")
         raise HTTPException(status_code=500, detail=f"Database error: {str(e)}")
     except Exception as e:
-        logger.error(f"Error retrieving vector statuses: {e}")
-        logger.error(traceback.format_exc())
+        logger.exception(f"Error retrieving vector statuses: {e}")
         raise HTTPException(status_code=500, detail=f"Error retrieving vector statuses: {str(e)}")
 
-@router.post("/emergency", response_model=EmergencyResponse)
-async def create_emergency_contact(
-    emergency: EmergencyCreate,
-    db: Session = Depends(get_db)
-):
-    """
-    Create a new emergency contact.
-    
-    - **name**: Contact name
-    - **phone_number**: Phone number
-    - **description**: Description (optional)
-    - **address**: Address (optional)
-    - **location**: Location coordinates (optional)
-    - **priority**: Priority order (default: 0)
-    - **is_active**: Whether the contact is active (default: True)
-    """
-    try:
-        db_emergency = EmergencyItem(**emergency.model_dump())
-        db.add(db_emergency)
-        db.commit()
-        db.refresh(db_emergency)
-        
-        # Invalidate emergency cache after creating a new item
-        emergencies_cache.clear()
-        
-        # Convert SQLAlchemy model to Pydantic model before returning
-        result = EmergencyResponse.model_validate(db_emergency, from_attributes=True)
-        return result
-    except SQLAlchemyError as e:
-        db.rollback()
-        logger.error(f"Database error in create_emergency_contact: {e}")
-        logger.error(traceback.format_exc())
-        raise HTTPException(status_code=500, detail=f"Database error: {str(e)}")
-
-@router.get("/emergency/{emergency_id}", response_model=EmergencyResponse)
-async def get_emergency_contact(
-    emergency_id: int = Path(..., gt=0),
-    use_cache: bool = True,
-    db: Session = Depends(get_db)
-):
-    """
-    Get a single emergency contact by ID.
-    
-    - **emergency_id**: ID of the emergency contact
-    - **use_cache**: If true, use cached results when available
-    """
-    try:
-        # Generate cache key
-        cache_key = f"emergency_{emergency_id}"
-        
-        # Try to get from cache if caching is enabled
-        if use_cache:
-            cached_result = emergencies_cache.get(cache_key)
-            if cached_result:
-                logger.info(f"Cache hit for {cache_key}")
-                return cached_result
-                
-        # Use direct SQL query for better performance on single item lookup
-        stmt = text("SELECT * FROM emergency_item WHERE id = :id")
-        result = db.execute(stmt, {"id": emergency_id}).fetchone()
-        
-        if not result:
-            raise HTTPException(status_code=404, detail="Emergency contact not found")
-        
-        # Create an EmergencyItem model instance manually
-        emergency = EmergencyItem()
-        for key, value in result._mapping.items():
-            if hasattr(emergency, key):
-                setattr(emergency, key, value)
-                
-        # Convert to Pydantic model
-        response = EmergencyResponse.model_validate(emergency, from_attributes=True)
-        
-        # Store in cache if caching is enabled
-        if use_cache:
-            emergencies_cache[cache_key] = response
-            
-        return response
-    except SQLAlchemyError as e:
-        logger.error(f"Database error in get_emergency_contact: {e}")
-        logger.error(traceback.format_exc())
-        raise HTTPException(status_code=500, detail=f"Database error: {str(e)}")
-
-@router.put("/emergency/{emergency_id}", response_model=EmergencyResponse)
-async def update_emergency_contact(
-    emergency_id: int = Path(..., gt=0),
-    emergency_update: EmergencyUpdate = Body(...),
-    db: Session = Depends(get_db)
-):
-    """
-    Update a specific emergency contact.
-    
-    - **emergency_id**: ID of the emergency contact to update
-    - **name**: New name (optional)
-    - **phone_number**: New phone number (optional)
-    - **description**: New description (optional)
-    - **address**: New address (optional)
-    - **location**: New location coordinates (optional)
-    - **priority**: New priority order (optional)
-    - **is_active**: New active status (optional)
-    """
-    try:
-        emergency = db.query(EmergencyItem).filter(EmergencyItem.id == emergency_id).first()
-        if not emergency:
-            raise HTTPException(status_code=404, detail="Emergency contact not found")
-        
-        # Update fields if provided
-        update_data = emergency_update.model_dump(exclude_unset=True)
-        for key, value in update_data.items():
-            setattr(emergency, key, value)
-            
-        db.commit()
-        db.refresh(emergency)
-        
-        # Invalidate specific cache entries
-        emergencies_cache.delete(f"emergency_{emergency_id}")
-        emergencies_cache.clear()  # Clear all list caches
-        
-        # Convert to Pydantic model
-        return EmergencyResponse.model_validate(emergency, from_attributes=True)
-    except SQLAlchemyError as e:
-        db.rollback()
-        logger.error(f"Database error in update_emergency_contact: {e}")
-        logger.error(traceback.format_exc())
-        raise HTTPException(status_code=500, detail=f"Database error: {str(e)}")
-
-@router.delete("/emergency/{emergency_id}", response_model=dict)
-async def delete_emergency_contact(
-    emergency_id: int = Path(..., gt=0),
-    db: Session = Depends(get_db)
-):
-    """
-    Delete a specific emergency contact.
-    
-    - **emergency_id**: ID of the emergency contact to delete
-    """
-    try:
-        # Use optimized direct SQL with RETURNING for better performance
-        result = db.execute(
-            text("DELETE FROM emergency_item WHERE id = :id RETURNING id"),
-            {"id": emergency_id}
-        ).fetchone()
-        
-        if not result:
-            raise HTTPException(status_code=404, detail="Emergency contact not found")
-        
-        db.commit()
-        
-        # Invalidate cache entries
-        emergencies_cache.delete(f"emergency_{emergency_id}")
-        emergencies_cache.clear()  # Clear all list caches
-        
-        return {"status": "success", "message": f"Emergency contact {emergency_id} deleted"}
-    except SQLAlchemyError as e:
-        db.rollback()
-        logger.error(f"Database error in delete_emergency_contact: {e}")
-        logger.error(traceback.format_exc())
-        raise HTTPException(status_code=500, detail=f"Database error: {str(e)}")
-
-@router.put("/emergency/batch-update-status", response_model=BatchUpdateResult)
-async def batch_update_emergency_status(
-    emergency_ids: List[int] = Body(..., embed=True),
-    is_active: bool = Body(..., embed=True),
-    db: Session = Depends(get_db)
-):
-    """
-    Update the active status of multiple emergency contacts at once.
-    
-    This is much more efficient than updating emergency contacts one at a time.
-    """
-    try:
-        if not emergency_ids:
-            raise HTTPException(status_code=400, detail="No emergency contact IDs provided")
-        
-        # Prepare the update statement
-        stmt = text("""
-            UPDATE emergency_item 
-            SET is_active = :is_active, updated_at = NOW()
-            WHERE id = ANY(:emergency_ids)
-            RETURNING id
-        """)
-        
-        # Execute the update in a single query
-        result = db.execute(stmt, {"is_active": is_active, "emergency_ids": emergency_ids})
-        updated_ids = [row[0] for row in result]
-        
-        # Commit the transaction
-        db.commit()
-        
-        # Determine which IDs weren't found
-        failed_ids = [id for id in emergency_ids if id not in updated_ids]
-        
-        # Invalidate emergency cache
-        emergencies_cache.clear()
-        
-        return BatchUpdateResult(
-            success_count=len(updated_ids),
-            failed_ids=failed_ids,
-            message=f"Updated {len(updated_ids)} emergency contacts" if updated_ids else "No emergency contacts were updated"
-        )
-    except SQLAlchemyError as e:
-        db.rollback()
-        logger.error(f"Database error in batch_update_emergency_status: {e}")
-        logger.error(traceback.format_exc())
-        raise HTTPException(status_code=500, detail=f"Database error: {str(e)}")
-
-@router.delete("/emergency/batch", response_model=BatchUpdateResult)
-async def batch_delete_emergency_contacts(
-    emergency_ids: List[int] = Body(..., embed=True),
-    db: Session = Depends(get_db)
-):
-    """
-    Delete multiple emergency contacts at once.
-    
-    This is much more efficient than deleting emergency contacts one at a time with separate API calls.
-    """
-    try:
-        if not emergency_ids:
-            raise HTTPException(status_code=400, detail="No emergency contact IDs provided")
-        
-        # Prepare and execute the delete statement with RETURNING to get deleted IDs
-        stmt = text("""
-            DELETE FROM emergency_item
-            WHERE id = ANY(:emergency_ids)
-            RETURNING id
-        """)
-        
-        result = db.execute(stmt, {"emergency_ids": emergency_ids})
-        deleted_ids = [row[0] for row in result]
-        
-        # Commit the transaction
-        db.commit()
-        
-        # Determine which IDs weren't found
-        failed_ids = [id for id in emergency_ids if id not in deleted_ids]
-        
-        # Invalidate emergency cache
-        emergencies_cache.clear()
-        
-        return BatchUpdateResult(
-            success_count=len(deleted_ids),
-            failed_ids=failed_ids,
-            message=f"Deleted {len(deleted_ids)} emergency contacts" if deleted_ids else "No emergency contacts were deleted"
-        )
-    except SQLAlchemyError as e:
-        db.rollback()
-        logger.error(f"Database error in batch_delete_emergency_contacts: {e}")
-        logger.error(traceback.format_exc())
-        raise HTTPException(status_code=500, detail=f"Database error: {str(e)}")
-
 @router.post("/documents", response_model=DocumentResponse)
 async def upload_document(
     name: str = Form(...),
     vector_database_id: int = Form(...),
     file: UploadFile = File(...),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ):
     """
     Upload a new document and associate it with a vector database.
@@ -3525,7 +3544,7 @@ async def upload_document(
     """
     try:
         # Check if vector database exists
-        vector_db = db.query(VectorDatabase).filter(VectorDatabase.id == vector_database_id).first()
+        vector_db = await db.get(VectorDatabase, vector_database_id)
         if not vector_db:
             raise HTTPException(status_code=404, detail=f"Vector database with ID {vector_database_id} not found")
         
@@ -3548,7 +3567,7 @@ async def upload_document(
         )
         
         db.add(document)
-        db.flush()  # Get ID without committing
+        await db.flush()  # Get ID and server defaults via INSERT ... RETURNING without committing
         
         # Create document content record
         document_content = DocumentContent(
@@ -3557,8 +3576,6 @@ async def upload_document(
         )
         
         db.add(document_content)
-        db.commit()
-        db.refresh(document)
         
         # Create vector status record for tracking embedding
         vector_status = VectorStatus(
@@ -3568,7 +3585,9 @@ async def upload_document(
         )
         
         db.add(vector_status)
-        db.commit()
+        
+        # Commit document, content and status in a single transaction
+        await db.commit()
         
         # Get vector database name for response
         vector_db_name = vector_db.name if vector_db else f"db_{vector_database_id}"
@@ -3591,14 +3610,12 @@ async def upload_document(
     except HTTPException:
         raise
     except SQLAlchemyError as e:
-        db.rollback()
-        logger.error(f"Database error uploading document: {e}")
-        logger.error(traceback.format_exc())
+        await db.rollback()
+        logger.exception(f"Database error uploading document: {e}")
         raise HTTPException(status_code=500, detail=f"Database error: {str(e)}")
     except Exception as e:
-        db.rollback()
-        logger.error(f"Error uploading document: {e}")
-        logger.error(traceback.format_exc())
+        await db.rollback()
+        logger.exception(f"Error uploading document: {e}")
         raise HTTPException(status_code=500, detail=f"Error uploading document: {str(e)}")
 
 @router.put("/documents/{document_id}", response_model=DocumentResponse)
@@ -3607,7 +3624,7 @@ async def update_document(
     name: Optional[str] = Form(None),
     file: Optional[UploadFile] = File(None),
     background_tasks: BackgroundTasks = None,
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ):
     """
     Update an existing document. Can update name, file content, or both.
@@ -3622,18 +3639,19 @@ async def update_document(
             raise HTTPException(status_code=400, detail="document_id must be greater than 0")
             
         # Check if document exists
-        document = db.query(Document).filter(Document.id == document_id).first()
+        document = await db.get(Document, document_id)
         if not document:
             raise HTTPException(status_code=404, detail=f"Document with ID {document_id} not found")
         
         # Get vector database information for later use
         vector_db = None
         if document.vector_database_id:
-            vector_db = db.query(VectorDatabase).filter(VectorDatabase.id == document.vector_database_id).first()
+            vector_db = await db.get(VectorDatabase, document.vector_database_id)
         
         # Update name if provided
         if name:
             document.name = name
+            document.updated_at = datetime.utcnow()
         
         # Update file if provided
         if file:
@@ -3650,10 +3668,10 @@ async def update_document(
             document.content_type = file.content_type
             document.size = file_size
             document.is_embedded = False  # Reset embedding status
-            document.updated_at = datetime.now()
+            document.updated_at = datetime.utcnow()
             
             # Update document content
-            document_content = db.query(DocumentContent).filter(DocumentContent.document_id == document_id).first()
+            document_content = (await db.scalars(select(DocumentContent).where(DocumentContent.document_id == document_id))).first()
             if document_content:
                 document_content.file_content = file_content
             else:
@@ -3665,7 +3683,7 @@ async def update_document(
                 db.add(document_content)
             
             # Get vector status for Pinecone cleanup
-            vector_status = db.query(VectorStatus).filter(VectorStatus.document_id == document_id).first()
+            vector_status = (await db.scalars(select(VectorStatus).where(VectorStatus.document_id == document_id))).first()
             
             # Store old vector_id for cleanup
             old_vector_id = None
@@ -3707,7 +3725,7 @@ async def update_document(
                     
                     logger.info(f"Scheduled deletion of old vectors for document {document_id}")
                 except Exception as e:
-                    logger.error(f"Error scheduling vector deletion: {str(e)}")
+                    logger.exception(f"Error scheduling vector deletion: {str(e)}")
                     # Continue with the update even if vector deletion scheduling fails
             
             # Schedule document for re-embedding if possible
@@ -3725,11 +3743,12 @@ async def update_document(
                     
                     logger.info(f"Scheduled re-embedding for document {document_id}")
                 except Exception as e:
-                    logger.error(f"Error scheduling document embedding: {str(e)}")
+                    logger.exception(f"Error scheduling document embedding: {str(e)}")
                     # Continue with the update even if embedding scheduling fails
         
-        db.commit()
-        db.refresh(document)
+        # updated_at is set explicitly (in UTC, like the other timestamps) on every change, so the
+        # loaded attributes stay current after commit and no refresh SELECT is needed
+        await db.commit()
         
         # Get vector database name for response
         vector_db_name = "No Database"
@@ -3756,18 +3775,16 @@ async def update_document(
     except HTTPException:
         raise
     except SQLAlchemyError as e:
-        db.rollback()
-        logger.error(f"Database error updating document: {e}")
-        logger.error(traceback.format_exc())
+        await db.rollback()
+        logger.exception(f"Database error updating document: {e}")
         raise HTTPException(status_code=500, detail=f"Database error: {str(e)}")
     except Exception as e:
-        db.rollback()
-        logger.error(f"Error updating document: {e}")
-        logger.error(traceback.format_exc())
+        await db.rollback()
+        logger.exception(f"Error updating document: {e}")
         raise HTTPException(status_code=500, detail=f"Error updating document: {str(e)}")
 
 @router.delete("/documents/{document_id}", response_model=dict)
-async def delete_document(
+def delete_document(
     document_id: int = Path(..., gt=0),
     db: Session = Depends(get_db)
 ):
@@ -3778,7 +3795,7 @@ async def delete_document(
     """
     try:
         # Check if document exists
-        document = db.query(Document).filter(Document.id == document_id).first()
+        document = db.get(Document, document_id)
         if not document:
             raise HTTPException(status_code=404, detail=f"Document with ID {document_id} not found")
         
@@ -3797,11 +3814,9 @@ async def delete_document(
         raise
     except SQLAlchemyError as e:
         db.rollback()
-        logger.error(f"Database error deleting document: {e}")
-        logger.error(traceback.format_exc())
+        logger.exception(f"Database error deleting document: {e}")
         raise HTTPException(status_code=500, detail=f"Database error: {str(e)}")
     except Exception as e:
         db.rollback()
-        logger.error(f"Error deleting document: {e}")
-        logger.error(traceback.format_exc())
+        logger.exception(f"Error deleting document: {e}")
         raise HTTPException(status_code=500, detail=f"Error deleting document: {str(e)}")
\ No newline at end of file
@@ -6,7 +6,6 @@ import os
 import json
 import hashlib
 import asyncio
-import traceback
 import google.generativeai as genai
 from datetime import datetime
 from langchain.prompts import PromptTemplate
@@ -284,9 +283,7 @@ async def chat(request: ChatRequest, background_tasks: BackgroundTasks):
         # Return response
         return chat_response
     except Exception as e:
-        logger.error(f"Error processing chat request: {e}")
-        import traceback
-        logger.error(traceback.format_exc())
+        logger.exception(f"Error processing chat request: {e}")
         raise HTTPException(status_code=500, detail=f"Failed to process chat request: {str(e)}")
 
 # Health check endpoint
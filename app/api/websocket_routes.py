@@ -340,6 +340,4 @@ async def send_notification(data: dict):
         logger.info("Notification broadcast completed successfully")
         
     except Exception as e:
-        logger.error(f"Error sending notification: {e}")
-        import traceback
-        logger.error(traceback.format_exc())
\ No newline at end of file
+        logger.exception(f"Error sending notification: {e}")
\ No newline at end of file
@@ -1,10 +1,12 @@
 import os
 from sqlalchemy import create_engine, text
-from sqlalchemy.ext.declarative import declarative_base
+from sqlalchemy.engine import make_url
+from sqlalchemy.ext.asyncio import create_async_engine, async_sessionmaker
 from sqlalchemy.orm import sessionmaker
 from sqlalchemy.exc import SQLAlchemyError, OperationalError
 from dotenv import load_dotenv
 import logging
+import orjson
 
 # Configure logging
 logger = logging.getLogger(__name__)
@@ -48,9 +50,15 @@ try:
         echo=False,                 # Disable SQL echo to reduce overhead
         echo_pool=False,            # Disable pool logging
         future=True,                # Use SQLAlchemy 2.0 features
+        query_cache_size=1200,      # Bounded LRU cache of compiled statements
+        json_serializer=lambda obj: orjson.dumps(obj).decode(),  # Encode JSON columns with orjson
+        json_deserializer=orjson.loads,  # Registered with psycopg2 to decode json/jsonb columns
+        # Batch executemany: INSERTs as multi-row VALUES, UPDATE/DELETE via psycopg2's execute_batch
+        executemany_mode="values_plus_batch",
+        insertmanyvalues_page_size=1000,  # Rows per multi-row INSERT statement
+        executemany_batch_page_size=500,  # Parameter sets per execute_batch round-trip
         # Execution options for common queries
         execution_options={
-            "compiled_cache": {},   # Use an empty dict for compiled query caching
             "logging_token": "SQL", # Tag for query logging
         }
     )
@@ -67,17 +75,67 @@ SessionLocal = sessionmaker(
     expire_on_commit=False  # Prevent automatic reloading after commit
 )
 
+# asyncpg does not understand libpq's sslmode parameter, so move it into connect_args
+ASYNC_DATABASE_URL = make_url(DATABASE_URL)
+async_connect_args = {
+    "timeout": 5,  # Connection timeout in seconds
+    "server_settings": {"application_name": "pixagent_api"},  # Identify app in PostgreSQL logs
+    "statement_cache_size": 1024,  # asyncpg server-side prepared statements kept per connection
+    "prepared_statement_cache_size": 256,  # SQLAlchemy's per-connection map of SQL to prepared statement
+}
+if "sslmode" in ASYNC_DATABASE_URL.query:
+    async_connect_args["ssl"] = ASYNC_DATABASE_URL.query["sslmode"]
+ASYNC_DATABASE_URL = ASYNC_DATABASE_URL.difference_update_query(["sslmode"]).set(drivername="postgresql+asyncpg")
+
+# Async pool sizing; keep pool_size + max_overflow per worker within the server's max_connections
+ASYNC_POOL_SIZE = int(os.getenv("DB_POOL_SIZE", "20"))
+ASYNC_MAX_OVERFLOW = int(os.getenv("DB_MAX_OVERFLOW", "10"))
+
+# Connections opened at startup so the first requests skip connect and TLS setup
+POOL_WARM_SIZE = min(int(os.getenv("DB_POOL_WARM_SIZE", "5")), ASYNC_POOL_SIZE)
+
+# Create async engine so request handlers can await queries without blocking the event loop
+try:
+    async_engine = create_async_engine(
+        ASYNC_DATABASE_URL,
+        pool_size=ASYNC_POOL_SIZE,  # Connections kept open for concurrent requests
+        max_overflow=ASYNC_MAX_OVERFLOW,  # Allow temporary overflow of connections
+        pool_timeout=5,  # Fail fast instead of queueing requests behind an exhausted pool
+        pool_recycle=300,  # Recycle connections every 5 minutes
+        pool_pre_ping=True,  # Verify connection is still valid before using it
+        connect_args=async_connect_args,
+        isolation_level="READ COMMITTED",
+        echo=False,
+        query_cache_size=1200,
+        json_serializer=lambda obj: orjson.dumps(obj).decode(),
+        json_deserializer=orjson.loads,  # Registered as the asyncpg json/jsonb codec
+    )
+    logger.info("PostgreSQL async engine initialized")
+except Exception as e:
+    logger.error(f"Failed to initialize PostgreSQL async engine: {e}")
+    # Don't raise exception to avoid crash on startup
+
+# Create async session factory
+AsyncSessionLocal = async_sessionmaker(
+    bind=async_engine,
+    autoflush=False,
+    expire_on_commit=False  # Keep loaded attributes usable after commit without another query
+)
+
 # Base class for declarative models - use sqlalchemy.orm for SQLAlchemy 2.0 compatibility
 from sqlalchemy.orm import declarative_base
 Base = declarative_base()
 
+# Connectivity probe shared by the sync check and the async pool warm-up
+PING_STMT = text("SELECT 1")
+
 # Check PostgreSQL connection
 def check_db_connection():
     """Check PostgreSQL connection status"""
     try:
         # Simple query to verify connection
         with engine.connect() as connection:
-            connection.execute(text("SELECT 1")).fetchone()
+            connection.execute(PING_STMT).fetchone()
         logger.info("PostgreSQL connection successful")
         return True
     except OperationalError as e:
@@ -87,13 +145,31 @@ def check_db_connection():
         logger.error(f"Unknown error checking PostgreSQL connection: {e}")
         return False
 
+# Tables the API routes expect to exist
+REQUIRED_TABLES = ("faq_item", "emergency_item", "event_item")
+
+# Look up every required table in one catalog query instead of one inspector call per table
+MISSING_TABLES_STMT = text("""
+    SELECT name
+    FROM unnest(CAST(:tables AS text[])) AS name
+    WHERE to_regclass(name) IS NULL
+""")
+
+def get_missing_tables():
+    """Return the required tables that do not exist, or None if the check failed"""
+    try:
+        with engine.connect() as connection:
+            return connection.execute(MISSING_TABLES_STMT, {"tables": list(REQUIRED_TABLES)}).scalars().all()
+    except SQLAlchemyError as e:
+        logger.error(f"Failed to check PostgreSQL schema: {e}")
+        return None
+
 # Dependency to get DB session with improved error handling
 def get_db():
     """Get PostgreSQL database session"""
     db = SessionLocal()
     try:
-        # Test connection
-        db.execute(text("SELECT 1")).fetchone()
+        # No test query here: pool_pre_ping already validates the connection on checkout
         yield db
     except Exception as e:
         logger.error(f"DB connection error: {e}")
@@ -101,6 +177,28 @@ def get_db():
     finally:
         db.close()  # Ensure connection is closed and returned to pool
 
+# Pre-open pooled async connections
+async def warm_async_pool(connections: int = POOL_WARM_SIZE):
+    """Open connections concurrently at startup so they sit idle in the pool"""
+    import asyncio
+    
+    async def ping():
+        async with async_engine.connect() as conn:
+            await conn.execute(PING_STMT)
+    
+    results = await asyncio.gather(*(ping() for _ in range(connections)), return_exceptions=True)
+    failures = [result for result in results if isinstance(result, Exception)]
+    if failures:
+        logger.error(f"Failed to warm {len(failures)} of {connections} PostgreSQL connections: {failures[0]}")
+    else:
+        logger.info(f"Warmed {connections} PostgreSQL connections")
+
+# Dependency to get async DB session
+async def get_async_db():
+    """Get async PostgreSQL database session"""
+    async with AsyncSessionLocal() as db:
+        yield db  # Closing the session returns the connection to the pool
+
 # Create tables in database if they don't exist
 def create_tables():
     """Create tables in database"""
@@ -123,7 +221,7 @@ def create_indexes():
             try:
                 # Index for featured events - use try-except to handle if index already exists
                 conn.execute(text("""
-                    CREATE INDEX idx_event_featured 
+                    CREATE INDEX IF NOT EXISTS idx_event_featured
                     ON event_item(featured)
                 """))
             except SQLAlchemyError:
@@ -132,7 +230,7 @@ def create_indexes():
             try:
                 # Index for active events
                 conn.execute(text("""
-                    CREATE INDEX idx_event_active 
+                    CREATE INDEX IF NOT EXISTS idx_event_active
                     ON event_item(is_active)
                 """))
             except SQLAlchemyError:
@@ -141,7 +239,7 @@ def create_indexes():
             try:
                 # Index for date filtering
                 conn.execute(text("""
-                    CREATE INDEX idx_event_date_start 
+                    CREATE INDEX IF NOT EXISTS idx_event_date_start
                     ON event_item(date_start)
                 """))
             except SQLAlchemyError:
@@ -150,7 +248,7 @@ def create_indexes():
             try:
                 # Composite index for combined filtering
                 conn.execute(text("""
-                    CREATE INDEX idx_event_featured_active 
+                    CREATE INDEX IF NOT EXISTS idx_event_featured_active
                     ON event_item(featured, is_active)
                 """))
             except SQLAlchemyError:
@@ -160,7 +258,7 @@ def create_indexes():
             try:
                 # FAQ active flag index
                 conn.execute(text("""
-                    CREATE INDEX idx_faq_active 
+                    CREATE INDEX IF NOT EXISTS idx_faq_active
                     ON faq_item(is_active)
                 """))
             except SQLAlchemyError:
@@ -169,7 +267,7 @@ def create_indexes():
             try:
                 # Emergency contact active flag and priority indexes
                 conn.execute(text("""
-                    CREATE INDEX idx_emergency_active 
+                    CREATE INDEX IF NOT EXISTS idx_emergency_active
                     ON emergency_item(is_active)
                 """))
             except SQLAlchemyError:
@@ -177,16 +275,259 @@ def create_indexes():
                 
             try:
                 conn.execute(text("""
-                    CREATE INDEX idx_emergency_priority 
+                    CREATE INDEX IF NOT EXISTS idx_emergency_priority
                     ON emergency_item(priority)
                 """))
             except SQLAlchemyError:
                 logger.info("Index idx_emergency_priority already exists")
             
+            try:
+                # Partial index matching the featured active events listing, walked in
+                # (date_start, id) order so the planner can stop after LIMIT rows
+                conn.execute(text("""
+                    CREATE INDEX IF NOT EXISTS idx_event_active_featured_date
+                    ON event_item(date_start DESC, id DESC)
+                    WHERE is_active = true AND featured = true
+                """))
+            except SQLAlchemyError:
+                logger.info("Index idx_event_active_featured_date already exists")
+            
+            try:
+                # Keyset order of the unfiltered events listing
+                conn.execute(text("""
+                    CREATE INDEX IF NOT EXISTS idx_event_date_start_id
+                    ON event_item(date_start DESC, id DESC)
+                """))
+            except SQLAlchemyError:
+                logger.info("Index idx_event_date_start_id already exists")
+            
+            try:
+                # Partial index matching the active emergency contacts listing order
+                conn.execute(text("""
+                    CREATE INDEX IF NOT EXISTS idx_emergency_active_priority
+                    ON emergency_item((COALESCE(priority, 0)) DESC, id DESC)
+                    WHERE is_active = true
+                """))
+            except SQLAlchemyError:
+                logger.info("Index idx_emergency_active_priority already exists")
+            
+            try:
+                # Emergency contacts listing order when inactive contacts are included
+                conn.execute(text("""
+                    CREATE INDEX IF NOT EXISTS idx_emergency_priority_id
+                    ON emergency_item((COALESCE(priority, 0)) DESC, id DESC)
+                """))
+            except SQLAlchemyError:
+                logger.info("Index idx_emergency_priority_id already exists")
+            
+            try:
+                # Partial index matching the active FAQ listing, already in keyset (id) order
+                conn.execute(text("""
+                    CREATE INDEX IF NOT EXISTS idx_faq_active_id
+                    ON faq_item(id)
+                    WHERE is_active = true
+                """))
+            except SQLAlchemyError:
+                logger.info("Index idx_faq_active_id already exists")
+            
+            try:
+                # Active events listing (default filters) in keyset order
+                conn.execute(text("""
+                    CREATE INDEX IF NOT EXISTS idx_event_active_date
+                    ON event_item(date_start DESC, id DESC)
+                    WHERE is_active = true
+                """))
+            except SQLAlchemyError:
+                logger.info("Index idx_event_active_date already exists")
+            
+            try:
+                # Featured events listing when inactive events are included
+                conn.execute(text("""
+                    CREATE INDEX IF NOT EXISTS idx_event_featured_date
+                    ON event_item(featured, date_start DESC, id DESC)
+                """))
+            except SQLAlchemyError:
+                logger.info("Index idx_event_featured_date already exists")
+            
+            try:
+                # Emergency contacts of one section, returned by priority
+                conn.execute(text("""
+                    CREATE INDEX IF NOT EXISTS idx_emergency_section_id_priority
+                    ON emergency_item(section_id, priority DESC)
+                """))
+            except SQLAlchemyError:
+                logger.info("Index idx_emergency_section_id_priority already exists")
+            
+            try:
+                # API key validation looks up active keys by value
+                conn.execute(text("""
+                    CREATE INDEX IF NOT EXISTS idx_api_key_active_value
+                    ON api_key(key_value)
+                    WHERE is_active = true
+                """))
+            except SQLAlchemyError:
+                logger.info("Index idx_api_key_active_value already exists")
+            
             conn.commit()
             
         logger.info("Database indexes created or verified")
         return True
     except SQLAlchemyError as e:
         logger.error(f"Failed to create indexes: {e}")
-        return False 
\ No newline at end of file
+        return False 
+
+# Channel used by the change-notification triggers below
+CHANGE_NOTIFY_CHANNEL = "pixagent_table_changed"
+
+# Tables whose route caches are invalidated through LISTEN/NOTIFY
+CHANGE_NOTIFY_TABLES = ("faq_item", "emergency_item", "event_item", "about_pixity", "solana_summit", "danang_bucket_list")
+
+# Most row ids carried by one notification; larger statements notify the table alone,
+# which keeps the payload well under PostgreSQL's 8000 byte limit
+CHANGE_NOTIFY_MAX_IDS = 500
+
+# Transition table each change trigger exposes to the notify function
+CHANGE_NOTIFY_EVENTS = (("insert", "NEW"), ("update", "NEW"), ("delete", "OLD"))
+
+# Create triggers that publish a NOTIFY whenever a cached table changes
+def create_change_notify_triggers():
+    """
+    Create statement-level triggers that NOTIFY "table:id1,id2,..." on changes to cached tables.
+    
+    A batch update, delete or COPY sends one notification for the whole statement instead of
+    one per row; when it touches more than CHANGE_NOTIFY_MAX_IDS rows the id list is left empty.
+    """
+    try:
+        with engine.connect() as conn:
+            conn.execute(text(f"""
+                CREATE OR REPLACE FUNCTION pixagent_notify_table_change() RETURNS trigger AS $$
+                DECLARE
+                    row_ids text;
+                    row_count integer;
+                BEGIN
+                    SELECT string_agg(id::text, ','), count(*) INTO row_ids, row_count
+                    FROM (SELECT id FROM changed_rows LIMIT {CHANGE_NOTIFY_MAX_IDS + 1}) AS limited_rows;
+                    IF row_count = 0 THEN
+                        RETURN NULL;
+                    END IF;
+                    IF row_count > {CHANGE_NOTIFY_MAX_IDS} THEN
+                        row_ids := '';
+                    END IF;
+                    PERFORM pg_notify('{CHANGE_NOTIFY_CHANNEL}', TG_TABLE_NAME || ':' || row_ids);
+                    RETURN NULL;
+                END;
+                $$ LANGUAGE plpgsql
+            """))
+            
+            for table_name in CHANGE_NOTIFY_TABLES:
+                # Replace the per-row trigger used by earlier versions
+                conn.execute(text(f"DROP TRIGGER IF EXISTS {table_name}_notify_change ON {table_name}"))
+                
+                # A trigger with a transition table can only handle one event, so each event gets its own
+                for event, transition in CHANGE_NOTIFY_EVENTS:
+                    conn.execute(text(f"DROP TRIGGER IF EXISTS {table_name}_notify_{event} ON {table_name}"))
+                    conn.execute(text(f"""
+                        CREATE TRIGGER {table_name}_notify_{event}
+                        AFTER {event.upper()} ON {table_name}
+                        REFERENCING {transition} TABLE AS changed_rows
+                        FOR EACH STATEMENT EXECUTE FUNCTION pixagent_notify_table_change()
+                    """))
+            
+            conn.commit()
+            
+        logger.info("Change notification triggers created or verified")
+        return True
+    except SQLAlchemyError as e:
+        logger.error(f"Failed to create change notification triggers: {e}")
+        return False
+
+# Tables whose updated_at is stamped by the database on every UPDATE
+UPDATED_AT_TABLES = ("faq_item", "emergency_item", "event_item")
+
+# Create triggers that keep updated_at current without each statement setting it
+def create_updated_at_triggers():
+    """Create BEFORE UPDATE triggers that set updated_at to now() on every updated row"""
+    try:
+        with engine.connect() as conn:
+            conn.execute(text("""
+                CREATE OR REPLACE FUNCTION pixagent_set_updated_at() RETURNS trigger AS $$
+                BEGIN
+                    NEW.updated_at := now();
+                    RETURN NEW;
+                END;
+                $$ LANGUAGE plpgsql
+            """))
+            
+            for table_name in UPDATED_AT_TABLES:
+                conn.execute(text(f"DROP TRIGGER IF EXISTS {table_name}_set_updated_at ON {table_name}"))
+                conn.execute(text(f"""
+                    CREATE TRIGGER {table_name}_set_updated_at
+                    BEFORE UPDATE ON {table_name}
+                    FOR EACH ROW EXECUTE FUNCTION pixagent_set_updated_at()
+                """))
+            
+            conn.commit()
+            
+        logger.info("updated_at triggers created or verified")
+        return True
+    except SQLAlchemyError as e:
+        logger.error(f"Failed to create updated_at triggers: {e}")
+        return False
+
+# Start listening for table change notifications on the running event loop
+def start_change_listener(callback):
+    """
+    Open a dedicated connection that LISTENs for table change notifications.
+    
+    The connection socket is registered with the running asyncio loop, so
+    callback(payload) is invoked with the "table:id1,id2,..." payload on the event loop thread for every NOTIFY.
+    Returns the listener connection, or None if it could not be started.
+    """
+    import asyncio
+    import psycopg2
+    import psycopg2.extensions
+    
+    try:
+        conn = psycopg2.connect(DATABASE_URL, application_name="pixagent_listener")
+        conn.set_isolation_level(psycopg2.extensions.ISOLATION_LEVEL_AUTOCOMMIT)
+        with conn.cursor() as cursor:
+            cursor.execute(f"LISTEN {CHANGE_NOTIFY_CHANNEL}")
+    except Exception as e:
+        logger.error(f"Failed to start PostgreSQL change listener: {e}")
+        return None
+    
+    loop = asyncio.get_running_loop()
+    
+    def handle_notifications():
+        try:
+            conn.poll()
+        except Exception as e:
+            # Stop listening on a broken connection; caches fall back to their TTL
+            logger.error(f"PostgreSQL change listener stopped: {e}")
+            loop.remove_reader(conn)
+            return
+        
+        while conn.notifies:
+            notification = conn.notifies.pop(0)
+            try:
+                callback(notification.payload)
+            except Exception as e:
+                logger.error(f"Error handling change notification for {notification.payload}: {e}")
+    
+    loop.add_reader(conn, handle_notifications)
+    logger.info(f"Listening for PostgreSQL notifications on {CHANGE_NOTIFY_CHANNEL}")
+    return conn
+
+# Stop a listener started with start_change_listener
+def stop_change_listener(conn):
+    """Unregister and close the change listener connection"""
+    import asyncio
+    
+    try:
+        asyncio.get_running_loop().remove_reader(conn)
+    except Exception:
+        pass
+    try:
+        conn.close()
+    except Exception as e:
+        logger.error(f"Error closing PostgreSQL change listener: {e}")
@@ -2,10 +2,12 @@ import os
 import time
 import threading
 import logging
+from collections import OrderedDict
+from functools import lru_cache
 from typing import Dict, Any, Optional, Tuple, List, Callable, Generic, TypeVar, Union
 from datetime import datetime
 from dotenv import load_dotenv
-import json
+import orjson
 
 # Thiết lập logging
 logger = logging.getLogger(__name__)
@@ -48,7 +50,8 @@ class InMemoryCache:
         cleanup_interval: int = DEFAULT_CACHE_CLEANUP_INTERVAL,
         max_size: int = DEFAULT_CACHE_MAX_SIZE
     ):
-        self.cache: Dict[str, CacheItem] = {}
+        # OrderedDict giữ thứ tự truy cập (cũ nhất ở đầu) để loại bỏ LRU trong O(1)
+        self.cache: "OrderedDict[str, CacheItem]" = OrderedDict()
         self.ttl = ttl
         self.cleanup_interval = cleanup_interval
         self.max_size = max_size
@@ -68,6 +71,7 @@ class InMemoryCache:
                 self._evict_lru_items()
                 
             self.cache[key] = CacheItem(value, ttl_value)
+            self.cache.move_to_end(key)
             logger.debug(f"Cache set: {key} (expires in {ttl_value}s)")
     
     def get(self, key: str, default: Any = None) -> Any:
@@ -88,8 +92,9 @@ class InMemoryCache:
                     logger.debug(f"Cache miss (not found): {key}")
                 return default
             
-            # Cập nhật thời gian truy cập
+            # Cập nhật thời gian truy cập và đưa key về cuối thứ tự LRU
             item.touch()
+            self.cache.move_to_end(key)
             logger.debug(f"Cache hit: {key}")
             return item.value
     
@@ -141,11 +146,11 @@ class InMemoryCache:
                 logger.debug(f"Cleaned up {len(expired_keys)} expired cache items")
     
     def _evict_lru_items(self, count: int = 1) -> None:
-        """Xóa bỏ các item ít được truy cập nhất khi cache đầy"""
-        items = sorted(self.cache.items(), key=lambda x: x[1].last_accessed)
-        for i in range(min(count, len(items))):
-            del self.cache[items[i][0]]
-        logger.debug(f"Evicted {min(count, len(items))} least recently used items from cache")
+        """Xóa bỏ các item ít được truy cập nhất khi cache đầy (O(1) mỗi item)"""
+        evicted = min(count, len(self.cache))
+        for _ in range(evicted):
+            self.cache.popitem(last=False)
+        logger.debug(f"Evicted {evicted} least recently used items from cache")
     
     def stats(self) -> Dict[str, Any]:
         """Trả về thống kê về cache"""
@@ -173,7 +178,7 @@ class InMemoryCache:
                 if isinstance(item.value, (str, bytes)):
                     cache_size += len(item.value)
                 elif isinstance(item.value, (dict, list)):
-                    cache_size += len(json.dumps(item.value))
+                    cache_size += len(orjson.dumps(item.value, default=str, option=orjson.OPT_NON_STR_KEYS))
                 else:
                     # Giá trị mặc định cho các loại dữ liệu khác
                     cache_size += 100
@@ -190,4 +195,225 @@ def get_cache() -> InMemoryCache:
     global _cache_instance
     if _cache_instance is None:
         _cache_instance = InMemoryCache()
-    return _cache_instance 
\ No newline at end of file
+    return _cache_instance
+
+class LocalTTLCache:
+    """
+    Cache response cục bộ của một worker: dict key -> (thời điểm hết hạn, giá trị, namespace).
+    Chỉ dùng trong event loop nên không cần lock; item hết hạn bị xóa lười khi đọc
+    và bởi sweep() định kỳ. Khi đầy, entry được ghi sớm nhất bị loại trong O(1).
+    Các key được nhóm theo namespace để xóa cả một nhóm (vd. các trang danh sách);
+    tập key của namespace được cập nhật mỗi khi entry bị loại, hết hạn hay bị xóa.
+    """
+    __slots__ = ("store", "namespaces", "maxsize", "ttl")
+
+    def __init__(self, maxsize: int, ttl: int = DEFAULT_CACHE_TTL):
+        self.store: Dict[Any, Tuple[float, Any, Optional[str]]] = {}
+        self.namespaces: Dict[str, set] = {}
+        self.maxsize = maxsize
+        self.ttl = ttl
+
+    def _discard(self, key: Any) -> Optional[Tuple[float, Any, Optional[str]]]:
+        """Xóa entry khỏi store và khỏi tập key của namespace chứa nó"""
+        entry = self.store.pop(key, None)
+        if entry is not None and entry[2] is not None:
+            keys = self.namespaces.get(entry[2])
+            if keys is not None:
+                keys.discard(key)
+                if not keys:
+                    del self.namespaces[entry[2]]
+        return entry
+
+    def get(self, key: Any, default: Any = None) -> Any:
+        """Lấy giá trị còn hạn, xóa luôn entry đã hết hạn (lazy expiration)"""
+        entry = self.store.get(key)
+        if entry is None:
+            return default
+        if entry[0] <= time.monotonic():
+            self._discard(key)
+            return default
+        return entry[1]
+
+    def set(self, key: Any, value: Any, namespace: Optional[str] = None) -> None:
+        """Ghi một giá trị, gắn key vào namespace (nếu có)"""
+        store = self.store
+        # Ghi lại key ở cuối để thứ tự dict luôn là thứ tự ghi
+        if key in store:
+            self._discard(key)
+        elif len(store) >= self.maxsize:
+            self._discard(next(iter(store)))
+        store[key] = (time.monotonic() + self.ttl, value, namespace)
+        if namespace is not None:
+            self.namespaces.setdefault(namespace, set()).add(key)
+
+    def __setitem__(self, key: Any, value: Any) -> None:
+        self.set(key, value)
+
+    def pop(self, key: Any, default: Any = None) -> Any:
+        """Xóa một key và trả về giá trị của nó"""
+        entry = self._discard(key)
+        return default if entry is None else entry[1]
+
+    def clear_namespace(self, namespace: str) -> int:
+        """Xóa tất cả các entry của một namespace, trả về số entry đã xóa"""
+        keys = self.namespaces.pop(namespace, ())
+        for key in keys:
+            self.store.pop(key, None)
+        return len(keys)
+
+    def clear(self) -> None:
+        self.store.clear()
+        self.namespaces.clear()
+
+    def __len__(self) -> int:
+        return len(self.store)
+
+    def sweep(self) -> int:
+        """Xóa tất cả các entry đã hết hạn, trả về số entry đã xóa"""
+        now = time.monotonic()
+        expired_keys = [key for key, entry in self.store.items() if entry[0] <= now]
+        for key in expired_keys:
+            self._discard(key)
+        return len(expired_keys)
+
+# Cache dùng chung giữa các worker (tùy chọn, bật khi có REDIS_URL)
+REDIS_URL = os.getenv("REDIS_URL")
+REDIS_CACHE_PREFIX = os.getenv("REDIS_CACHE_PREFIX", "pixagent")
+
+# Đọc generation hiện tại của namespace và lấy entry tương ứng trong một round-trip
+_REDIS_GET_SCRIPT = """
+local gen = redis.call('GET', KEYS[1]) or '0'
+return redis.call('HMGET', ARGV[1] .. ':v' .. gen .. ':' .. ARGV[2], 'body', 'cursor')
+"""
+
+# Ghi entry dưới generation hiện tại của namespace trong một round-trip
+_REDIS_SET_SCRIPT = """
+local gen = redis.call('GET', KEYS[1]) or '0'
+local key = ARGV[1] .. ':v' .. gen .. ':' .. ARGV[2]
+redis.call('HSET', key, 'body', ARGV[3], 'cursor', ARGV[4])
+redis.call('EXPIRE', key, ARGV[5])
+return 1
+"""
+
+# Xóa các entry chỉ định dưới generation hiện tại của namespace trong một round-trip
+_REDIS_DELETE_SCRIPT = """
+local gen = redis.call('GET', KEYS[1]) or '0'
+local deleted = 0
+for i = 2, #ARGV do
+    deleted = deleted + redis.call('DEL', ARGV[1] .. ':v' .. gen .. ':' .. ARGV[i])
+end
+return deleted
+"""
+
+class RedisCache:
+    """
+    Cache L2 trên Redis để các uvicorn worker dùng chung.
+    Mỗi entry là một hash gồm payload JSON đã mã hóa và cursor trang kế tiếp (nếu có).
+    Key chứa generation của namespace, nên việc xóa cache chỉ là một lệnh INCR;
+    các entry cũ tự hết hạn theo TTL.
+    Lỗi Redis chỉ được ghi log, request sẽ fallback về database.
+    """
+    
+    def __init__(self, url: str, prefix: str = REDIS_CACHE_PREFIX, ttl: int = DEFAULT_CACHE_TTL):
+        import redis.asyncio as aioredis
+        
+        self.client = aioredis.from_url(url)
+        self.prefix = prefix
+        self.ttl = ttl
+        self._get_script = self.client.register_script(_REDIS_GET_SCRIPT)
+        self._set_script = self.client.register_script(_REDIS_SET_SCRIPT)
+        self._delete_script = self.client.register_script(_REDIS_DELETE_SCRIPT)
+        self._namespace_key_cache: Dict[str, Tuple[List[str], str]] = {}
+    
+    def _namespace_keys(self, namespace: str) -> Tuple[List[str], str]:
+        """([key generation], tiền tố entry) của namespace, chỉ format một lần cho mỗi namespace"""
+        namespace_keys = self._namespace_key_cache.get(namespace)
+        if namespace_keys is None:
+            namespace_keys = ([f"{self.prefix}:{namespace}:gen"], f"{self.prefix}:{namespace}")
+            self._namespace_key_cache[namespace] = namespace_keys
+        return namespace_keys
+    
+    @staticmethod
+    @lru_cache(maxsize=4096)
+    def _entry_key(key: Any) -> str:
+        """Chuyển cache key (chuỗi hoặc tuple) thành phần cuối của key Redis"""
+        if isinstance(key, tuple):
+            return ":".join(str(part) for part in key)
+        return str(key)
+    
+    async def get(self, namespace: str, key: Any) -> Optional[Tuple[bytes, Optional[int]]]:
+        """Lấy (payload, cursor) từ Redis, trả về None nếu không có"""
+        try:
+            gen_keys, entry_prefix = self._namespace_keys(namespace)
+            body, cursor = await self._get_script(keys=gen_keys, args=[entry_prefix, self._entry_key(key)])
+        except Exception as e:
+            logger.warning(f"Redis cache get failed for {namespace}: {e}")
+            return None
+        if body is None:
+            return None
+        return body, int(cursor) if cursor else None
+    
+    async def set(self, namespace: str, key: Any, body: Union[bytes, str], cursor: Optional[int] = None, ttl: Optional[int] = None) -> None:
+        """Lưu payload và cursor trong một round-trip"""
+        try:
+            gen_keys, entry_prefix = self._namespace_keys(namespace)
+            await self._set_script(
+                keys=gen_keys,
+                args=[
+                    entry_prefix,
+                    self._entry_key(key),
+                    body,
+                    "" if cursor is None else cursor,
+                    ttl if ttl is not None else self.ttl,
+                ]
+            )
+        except Exception as e:
+            logger.warning(f"Redis cache set failed for {namespace}: {e}")
+    
+    async def delete(self, namespace: str, *keys: Any) -> None:
+        """Xóa các entry chỉ định, giữ nguyên các entry khác của namespace"""
+        if not keys:
+            return
+        try:
+            gen_keys, entry_prefix = self._namespace_keys(namespace)
+            await self._delete_script(keys=gen_keys, args=[entry_prefix, *(self._entry_key(key) for key in keys)])
+        except Exception as e:
+            logger.warning(f"Redis cache delete failed for {namespace}: {e}")
+    
+    async def clear(self, namespace: str) -> None:
+        """Vô hiệu hóa tất cả các entry của namespace bằng cách tăng generation (O(1))"""
+        try:
+            await self.client.incr(self._namespace_keys(namespace)[0][0])
+        except Exception as e:
+            logger.warning(f"Redis cache clear failed for {namespace}: {e}")
+    
+    async def ping(self) -> None:
+        """Kiểm tra kết nối Redis, ném exception nếu Redis không phản hồi"""
+        await self.client.ping()
+    
+    async def invalidate_many(self, deletions: Dict[str, List[Any]], clears: Optional[List[str]] = None) -> None:
+        """
+        Xóa các entry chỉ định của nhiều namespace và tăng generation của các namespace
+        trong clears, gửi tất cả qua một pipeline (một round-trip thay vì một lệnh mỗi lần)
+        """
+        try:
+            async with self.client.pipeline(transaction=False) as pipe:
+                for namespace, keys in deletions.items():
+                    if keys:
+                        gen_keys, entry_prefix = self._namespace_keys(namespace)
+                        await self._delete_script(keys=gen_keys, args=[entry_prefix, *(self._entry_key(key) for key in keys)], client=pipe)
+                for namespace in clears or ():
+                    pipe.incr(self._namespace_keys(namespace)[0][0])
+                await pipe.execute()
+        except Exception as e:
+            logger.warning(f"Redis cache invalidation failed for {', '.join([*deletions, *(clears or ())])}: {e}")
+
+# Singleton instance cho Redis
+_redis_cache_instance = None
+
+def get_redis_cache() -> Optional[RedisCache]:
+    """Trả về instance singleton của RedisCache, hoặc None nếu chưa cấu hình REDIS_URL"""
+    global _redis_cache_instance
+    if _redis_cache_instance is None and REDIS_URL:
+        _redis_cache_instance = RedisCache(REDIS_URL)
+    return _redis_cache_instance
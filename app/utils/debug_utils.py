@@ -87,12 +87,13 @@ class DebugInfo:
     def get_database_status():
         """Get database connection status"""
         try:
-            from app.database.postgresql import check_db_connection as check_postgresql
+            from app.database.postgresql import check_db_connection as check_postgresql, get_missing_tables
             from app.database.mongodb import check_db_connection as check_mongodb
             from app.database.pinecone import check_db_connection as check_pinecone
             
             return {
                 "postgresql": check_postgresql(),
+                "postgresql_missing_tables": get_missing_tables(),
                 "mongodb": check_mongodb(),
                 "pinecone": check_pinecone(),
                 "timestamp": datetime.now().isoformat()
@@ -3,7 +3,6 @@ from fastapi.responses import JSONResponse
 from starlette.middleware.base import BaseHTTPMiddleware
 import logging
 import time
-import traceback
 import uuid
 from .utils import get_local_time
 
@@ -41,8 +40,7 @@ class RequestLoggingMiddleware(BaseHTTPMiddleware):
         except Exception as e:
             # Log error
             process_time = time.time() - start_time
-            logger.error(f"Error [{request_id}] after {process_time:.4f}s: {str(e)}")
-            logger.error(traceback.format_exc())
+            logger.exception(f"Error [{request_id}] after {process_time:.4f}s: {str(e)}")
             
             # Return error response
             return JSONResponse(
@@ -65,8 +63,7 @@ class ErrorHandlingMiddleware(BaseHTTPMiddleware):
             request_id = getattr(request.state, "request_id", str(uuid.uuid4()))
             
             # Log error
-            logger.error(f"Uncaught exception [{request_id}]: {str(e)}")
-            logger.error(traceback.format_exc())
+            logger.exception(f"Uncaught exception [{request_id}]: {str(e)}")
             
             # Return error response
             return JSONResponse(
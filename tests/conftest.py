@@ -0,0 +1,5 @@
+import os
+
+# Importing the app package runs app.py, which exits when required settings are missing
+# outside debug mode; tests only exercise in-process code, so run them in debug mode
+os.environ.setdefault("DEBUG", "true")
@@ -0,0 +1,150 @@
+import time
+
+import pytest
+
+from app.utils import cache as cache_module
+from app.utils.cache import InMemoryCache, LocalTTLCache
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    """Freeze time.monotonic and time.time at a value the test can move forward"""
+    now = [1000.0]
+    monkeypatch.setattr(cache_module.time, "monotonic", lambda: now[0])
+    monkeypatch.setattr(cache_module.time, "time", lambda: now[0])
+    return now
+
+
+# --- LocalTTLCache ---
+
+def test_local_cache_returns_stored_value():
+    cache = LocalTTLCache(maxsize=2, ttl=60)
+    cache["a"] = 1
+    
+    assert cache.get("a") == 1
+    assert cache.get("missing", "default") == "default"
+
+
+def test_local_cache_expires_entries_on_read(clock):
+    cache = LocalTTLCache(maxsize=2, ttl=60)
+    cache["a"] = 1
+    
+    clock[0] += 59
+    assert cache.get("a") == 1
+    
+    clock[0] += 1
+    assert cache.get("a") is None
+    assert len(cache) == 0
+
+
+def test_local_cache_evicts_oldest_written_entry_when_full():
+    cache = LocalTTLCache(maxsize=2, ttl=60)
+    cache["a"] = 1
+    cache["b"] = 2
+    cache["c"] = 3
+    
+    assert cache.get("a") is None
+    assert cache.get("b") == 2
+    assert cache.get("c") == 3
+
+
+def test_local_cache_rewrite_moves_key_to_newest():
+    cache = LocalTTLCache(maxsize=2, ttl=60)
+    cache["a"] = 1
+    cache["b"] = 2
+    cache["a"] = 10
+    cache["c"] = 3
+    
+    assert cache.get("a") == 10
+    assert cache.get("b") is None
+    assert len(cache) == 2
+
+
+def test_local_cache_pop_and_clear():
+    cache = LocalTTLCache(maxsize=4, ttl=60)
+    cache["a"] = 1
+    cache["b"] = 2
+    
+    assert cache.pop("a") == 1
+    assert cache.pop("a", "gone") == "gone"
+    
+    cache.clear()
+    assert len(cache) == 0
+
+
+def test_local_cache_sweep_removes_only_expired_entries(clock):
+    cache = LocalTTLCache(maxsize=4, ttl=60)
+    cache["old"] = 1
+    clock[0] += 30
+    cache["new"] = 2
+    clock[0] += 30
+    
+    assert cache.sweep() == 1
+    assert cache.get("old") is None
+    assert cache.get("new") == 2
+
+
+def test_local_cache_clear_namespace_keeps_other_namespaces():
+    cache = LocalTTLCache(maxsize=4, ttl=60)
+    cache.set("page", 1, "list")
+    cache.set("item", 2, "items")
+    
+    assert cache.clear_namespace("list") == 1
+    assert cache.get("page") is None
+    assert cache.get("item") == 2
+
+
+def test_local_cache_prunes_namespace_on_eviction_and_expiry(clock):
+    cache = LocalTTLCache(maxsize=2, ttl=60)
+    cache.set("a", 1, "list")
+    cache.set("b", 2, "list")
+    cache.set("c", 3, "list")
+    
+    assert cache.namespaces["list"] == {"b", "c"}
+    
+    clock[0] += 60
+    cache.sweep()
+    assert cache.namespaces == {}
+
+
+def test_local_cache_pop_removes_key_from_namespace():
+    cache = LocalTTLCache(maxsize=2, ttl=60)
+    cache.set("a", 1, "list")
+    cache.pop("a")
+    
+    assert cache.namespaces == {}
+
+
+# --- InMemoryCache ---
+
+def test_in_memory_cache_evicts_least_recently_used():
+    cache = InMemoryCache(ttl=60, cleanup_interval=3600, max_size=3)
+    cache.set("a", 1)
+    cache.set("b", 2)
+    cache.set("c", 3)
+    
+    # Reading "a" makes "b" the least recently used key
+    assert cache.get("a") == 1
+    cache.set("d", 4)
+    
+    assert list(cache.cache) == ["c", "a", "d"]
+    assert cache.get("b") is None
+
+
+def test_in_memory_cache_overwrite_does_not_evict():
+    cache = InMemoryCache(ttl=60, cleanup_interval=3600, max_size=2)
+    cache.set("a", 1)
+    cache.set("b", 2)
+    cache.set("a", 10)
+    
+    assert list(cache.cache) == ["b", "a"]
+    assert cache.get("a") == 10
+
+
+def test_in_memory_cache_expires_entries_on_read(clock):
+    cache = InMemoryCache(ttl=60, cleanup_interval=3600, max_size=2)
+    cache.set("a", 1)
+    
+    clock[0] += 61
+    assert cache.get("a") is None
+    assert "a" not in cache.cache
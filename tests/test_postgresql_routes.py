@@ -0,0 +1,222 @@
+import asyncio
+from datetime import datetime
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from app.api import postgresql_routes
+from app.api.postgresql_routes import MAX_LIST_LIMIT, EventCreate, next_page_cursor, single_flight, to_naive_utc
+from app.database.postgresql import get_async_db
+
+
+# --- List cursors ---
+
+def test_next_page_cursor_points_at_last_row_of_full_page():
+    rows = [{"id": 3}, {"id": 7}]
+    
+    assert next_page_cursor(rows, 2) == 7
+
+
+def test_next_page_cursor_is_none_for_short_page():
+    assert next_page_cursor([{"id": 3}], 2) is None
+
+
+def test_next_page_cursor_is_none_for_empty_page():
+    assert next_page_cursor([], 2) is None
+
+
+@pytest.fixture
+def client():
+    """Serve the PostgreSQL router without a database; requests must fail validation before any query"""
+    app = FastAPI()
+    app.include_router(postgresql_routes.router)
+    app.dependency_overrides[get_async_db] = lambda: None
+    return TestClient(app)
+
+
+@pytest.mark.parametrize("path", ["/postgres/faq", "/postgres/emergency", "/postgres/events"])
+@pytest.mark.parametrize("limit", [0, -1, MAX_LIST_LIMIT + 1])
+def test_list_routes_reject_out_of_range_limit(client, path, limit):
+    response = client.get(path, params={"limit": limit})
+    
+    assert response.status_code == 422
+
+
+# --- Event datetimes ---
+
+class RecordingResult:
+    def __init__(self, rows):
+        self.rows = rows
+    
+    def mappings(self):
+        return self
+    
+    def all(self):
+        return self.rows
+
+
+class RecordingSession:
+    """Stands in for the AsyncSession of a single INSERT ... RETURNING request and keeps the bound rows"""
+    
+    def __init__(self):
+        self.rows = None
+    
+    async def execute(self, statement, rows=None):
+        self.rows = rows
+        return RecordingResult([{"id": 1, "created_at": datetime(2024, 1, 1), "updated_at": datetime(2024, 1, 1)}])
+    
+    async def commit(self):
+        pass
+    
+    async def rollback(self):
+        pass
+
+
+def test_to_naive_utc_converts_aware_values():
+    aware = datetime.fromisoformat("2024-05-01T17:00:00+07:00")
+    
+    assert to_naive_utc(aware) == datetime(2024, 5, 1, 10, 0)
+    assert to_naive_utc(datetime(2024, 5, 1, 10, 0)) == datetime(2024, 5, 1, 10, 0)
+    assert to_naive_utc(None) is None
+
+
+def test_event_models_store_dates_as_naive_utc():
+    event = EventCreate(
+        name="Summit", description="Talks", address="Da Nang",
+        date_start="2024-05-01T10:00:00Z", date_end="2024-05-01T20:00:00+07:00",
+    )
+    
+    assert event.date_start == datetime(2024, 5, 1, 10, 0)
+    assert event.date_end == datetime(2024, 5, 1, 13, 0)
+
+
+def test_create_event_binds_naive_utc_for_z_timestamp(monkeypatch):
+    monkeypatch.setattr(postgresql_routes, "shared_cache", None)
+    session = RecordingSession()
+    app = FastAPI()
+    app.include_router(postgresql_routes.router)
+    app.dependency_overrides[get_async_db] = lambda: session
+    
+    response = TestClient(app).post("/postgres/events", json={
+        "name": "Summit",
+        "description": "Talks",
+        "address": "Da Nang",
+        "date_start": "2024-05-01T10:00:00Z",
+    })
+    
+    assert response.status_code == 200
+    assert session.rows[0]["date_start"] == datetime(2024, 5, 1, 10, 0)
+    assert session.rows[0]["date_start"].tzinfo is None
+    assert response.json()["date_start"] == "2024-05-01T10:00:00"
+
+
+# --- single_flight ---
+
+def test_single_flight_shares_one_fetch_between_concurrent_callers():
+    calls = []
+    
+    async def fetch():
+        calls.append(1)
+        await asyncio.sleep(0.01)
+        return "payload"
+    
+    async def main():
+        return await asyncio.gather(*(single_flight("key", fetch) for _ in range(5)))
+    
+    assert asyncio.run(main()) == ["payload"] * 5
+    assert len(calls) == 1
+    assert "key" not in postgresql_routes.inflight_fetches
+
+
+def test_single_flight_fetches_again_after_completion():
+    calls = []
+    
+    async def fetch():
+        calls.append(1)
+        return len(calls)
+    
+    async def main():
+        return await single_flight("key", fetch), await single_flight("key", fetch)
+    
+    assert asyncio.run(main()) == (1, 2)
+
+
+def test_single_flight_propagates_errors_to_every_caller():
+    calls = []
+    
+    async def fetch():
+        calls.append(1)
+        await asyncio.sleep(0.01)
+        raise ValueError("boom")
+    
+    async def main():
+        return await asyncio.gather(*(single_flight("key", fetch) for _ in range(3)), return_exceptions=True)
+    
+    results = asyncio.run(main())
+    
+    assert len(calls) == 1
+    assert all(isinstance(result, ValueError) for result in results)
+    assert "key" not in postgresql_routes.inflight_fetches
+
+
+def test_single_flight_waiters_survive_leader_cancellation():
+    calls = []
+    
+    async def fetch():
+        calls.append(1)
+        await asyncio.sleep(0.05)
+        return len(calls)
+    
+    async def main():
+        leader = asyncio.create_task(single_flight("key", fetch))
+        await asyncio.sleep(0)
+        waiters = [asyncio.create_task(single_flight("key", fetch)) for _ in range(3)]
+        await asyncio.sleep(0.01)
+        
+        # Only the leader's own request is cancelled; the waiters share a second fetch
+        leader.cancel()
+        results = await asyncio.gather(*waiters)
+        with pytest.raises(asyncio.CancelledError):
+            await leader
+        return results
+    
+    assert asyncio.run(main()) == [2, 2, 2]
+    assert len(calls) == 2
+    assert "key" not in postgresql_routes.inflight_fetches
+
+
+def test_single_flight_cancelled_waiter_does_not_cancel_fetch():
+    async def fetch():
+        await asyncio.sleep(0.05)
+        return "payload"
+    
+    async def main():
+        leader = asyncio.create_task(single_flight("key", fetch))
+        await asyncio.sleep(0)
+        waiter = asyncio.create_task(single_flight("key", fetch))
+        await asyncio.sleep(0.01)
+        
+        waiter.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await waiter
+        return await leader
+    
+    assert asyncio.run(main()) == "payload"
+
+
+def test_single_flight_keeps_distinct_keys_separate():
+    calls = []
+    
+    async def fetch_for(key):
+        async def fetch():
+            calls.append(key)
+            await asyncio.sleep(0.01)
+            return key
+        return await single_flight(key, fetch)
+    
+    async def main():
+        return await asyncio.gather(fetch_for("a"), fetch_for("b"))
+    
+    assert asyncio.run(main()) == ["a", "b"]
+    assert sorted(calls) == ["a", "b"]